@@ -0,0 +1,86 @@
+"""
+Сравнение времени поиска пользователей в БД: ad-hoc запросы "SELECT *" с разбором строк по индексам столбцов
+(исходная реализация database/users.py) против подготовленных запросов с именованными столбцами (EntityLookup).
+
+Скрипт работает с базой данных приложения, указанной в переменных DB_*, и ничего в ней не изменяет.
+
+Запуск::
+
+    python -m benchmarks.db_lookups --lookups 500
+"""
+import argparse
+import time
+
+from database.db_baseclass import Database
+from database.users import get_user_data
+from helpers.latency_tracker import summarize_samples
+from models.users import DatabaseUserDataModel
+
+
+def get_user_data_ad_hoc(db: Database, user_id) -> DatabaseUserDataModel | None:
+    # Воспроизведение исходной реализации get_user_data_by_id.
+    db_result = db.execute_db_request(
+        query='SELECT * from public.users WHERE id = %s;',
+        params=(str(user_id),),
+        fetchmode='one'
+    )
+    if db_result is None:
+        return None
+    return DatabaseUserDataModel(
+        id=db_result[0],
+        firstname=db_result[1],
+        middlename=db_result[2],
+        surname=db_result[3],
+        email=db_result[4],
+        hashed_password=db_result[5],
+        is_admin=db_result[6]
+    )
+
+
+def measure(lookup, db: Database, users_ids: list, lookups: int) -> dict:
+    samples = []
+    for index in range(lookups):
+        started_at = time.perf_counter()
+        lookup(db, users_ids[index % len(users_ids)])
+        samples.append((time.perf_counter() - started_at) * 1000)
+    summary = summarize_samples(samples)
+    summary["total_ms"] = round(sum(samples), 3)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=500, help="Количество поисков для каждого варианта")
+    args = parser.parse_args()
+
+    # Пул из одного подключения: оба варианта работают на одном подключении, а подготовленный запрос
+    # разбирается сервером один раз.
+    db = Database(min_size=1, max_size=1)
+    db.connect_to_database()
+    try:
+        users_ids = [row.id for row in db.execute_db_request(query="SELECT id FROM public.users;", fetchmode='all')]
+        if not users_ids:
+            raise SystemExit("Таблица public.users пуста")
+
+        variants = {
+            "ad-hoc SELECT *": get_user_data_ad_hoc,
+            "prepared, named columns": lambda database, user_id: get_user_data(database, by='id', value=user_id),
+        }
+        # Прогрев: открытие подключения и подготовка запроса не должны попадать в замеры.
+        for lookup in variants.values():
+            measure(lookup, db, users_ids, 5)
+
+        results = {name: measure(lookup, db, users_ids, args.lookups) for name, lookup in variants.items()}
+    finally:
+        db.close()
+
+    print(f"{'variant':<26}{'total_ms':>12}{'mean_ms':>10}{'p50_ms':>10}{'p95_ms':>10}{'p99_ms':>10}")
+    for name, summary in results.items():
+        print(
+            f"{name:<26}{summary['total_ms']:>12}{summary['mean_ms']:>10}{summary['p50_ms']:>10}"
+            f"{summary['p95_ms']:>10}{summary['p99_ms']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Сравнение способов валидации большого ответа (списка всех книг, MultipleBooks): разбор тела ответа в словари Python
+(res.json()) с последующей валидацией модели (исходная реализация), validate_response_model (валидация словарей
+заранее собранным TypeAdapter) и validate_response (валидация байтов ответа).
+
+Скрипт не обращается к приложению: ответы генерируются в памяти.
+
+Запуск::
+
+    python -m benchmarks.response_validation --books 10000 100000 --repeats 5
+"""
+import argparse
+import gc
+import json
+import time
+from uuid import uuid4
+
+from faker import Faker
+from httpx import Response
+
+from helpers.latency_tracker import summarize_samples
+from helpers.validate_response import validate_response, validate_response_model
+from models.books import MultipleBooks
+
+
+def generate_books_response(books_count: int) -> Response:
+    fake = Faker()
+    books = [
+        {
+            "id": str(uuid4()),
+            "title": fake.sentence(nb_words=4),
+            "author": fake.name(),
+            "isbn": fake.isbn13(separator='')
+        } for _ in range(books_count)
+    ]
+    return Response(200, content=json.dumps(books).encode("utf-8"))
+
+
+def measure(validation, response: Response, repeats: int) -> dict:
+    samples = []
+    for _ in range(repeats):
+        # Сборка мусора перед замером: иначе в замер попадает сборка объектов, созданных предыдущими вариантами.
+        gc.collect()
+        started_at = time.perf_counter()
+        validation(response)
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return summarize_samples(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--books", type=int, nargs="+", default=[10000, 100000], help="Количество книг в ответе")
+    parser.add_argument("--repeats", type=int, default=5, help="Количество замеров для каждого варианта")
+    args = parser.parse_args()
+
+    variants = {
+        "json() + model_validate": lambda res: MultipleBooks.model_validate(res.json()),
+        "validate_response_model": lambda res: validate_response_model(
+            model=MultipleBooks, data=res.json(), attach_to_report=False
+        ),
+        "validate_response (bytes)": lambda res: validate_response(
+            model=MultipleBooks, response=res, attach_to_report=False
+        ),
+    }
+
+    print(f"{'books':>8}  {'variant':<28}{'mean_ms':>10}{'p50_ms':>10}{'max_ms':>10}{'MB/s':>10}")
+    for books_count in args.books:
+        response = generate_books_response(books_count)
+        size_in_mb = len(response.content) / 1024 / 1024
+        # Прогрев: первая валидация (и сборка валидатора) не должна попадать в замеры.
+        for validation in variants.values():
+            validation(generate_books_response(10))
+
+        for name, validation in variants.items():
+            summary = measure(validation, response, args.repeats)
+            throughput = round(size_in_mb / (summary['mean_ms'] / 1000), 1)
+            print(
+                f"{books_count:>8}  {name:<28}{summary['mean_ms']:>10}{summary['p50_ms']:>10}"
+                f"{summary['max_ms']:>10}{throughput:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
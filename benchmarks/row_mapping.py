@@ -0,0 +1,86 @@
+"""
+Сравнение способов преобразования строк результата запроса в pydantic-модели: создание модели для каждой строки
+(исходная реализация функций модулей database, аналог psycopg class_row), валидация всего набора одним вызовом
+TypeAdapter и создание моделей без валидации (model_construct).
+
+Скрипт не обращается к БД: строки генерируются в памяти в том виде, в котором их возвращает драйвер (namedtuple
+с именами столбцов).
+
+Запуск::
+
+    python -m benchmarks.row_mapping --rows 10000 100000 --repeats 5
+"""
+import argparse
+import time
+from collections import namedtuple
+from uuid import uuid4
+
+from faker import Faker
+
+from database.books import BOOKS_LOOKUP, BOOKS_MAPPER
+from database.users import USERS_LOOKUP, USERS_MAPPER
+from helpers.latency_tracker import summarize_samples
+
+
+def generate_users_rows(rows_count: int) -> list:
+    fake = Faker()
+    row_type = namedtuple('Row', USERS_LOOKUP.columns)
+    return [
+        row_type(uuid4(), fake.first_name(), None, fake.last_name(), f"user{index}@example.com", fake.sha256(), False)
+        for index in range(rows_count)
+    ]
+
+
+def generate_books_rows(rows_count: int) -> list:
+    fake = Faker()
+    row_type = namedtuple('Row', BOOKS_LOOKUP.columns)
+    return [
+        row_type(uuid4(), fake.sentence(nb_words=4), fake.name(), fake.isbn13(separator=''))
+        for _ in range(rows_count)
+    ]
+
+
+def measure(mapping, rows: list, repeats: int) -> dict:
+    samples = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        mapping(rows)
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return summarize_samples(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000], help="Размеры наборов строк")
+    parser.add_argument("--repeats", type=int, default=5, help="Количество замеров для каждого варианта")
+    args = parser.parse_args()
+
+    entities = {
+        "users": (USERS_MAPPER, generate_users_rows),
+        "books": (BOOKS_MAPPER, generate_books_rows),
+    }
+
+    print(f"{'entity':<8}{'rows':>8}  {'variant':<28}{'mean_ms':>10}{'p50_ms':>10}{'max_ms':>10}{'rows/s':>12}")
+    for entity, (mapper, generate_rows) in entities.items():
+        variants = {
+            "per-row model(**row)": lambda rows: [mapper.model(**row._asdict()) for row in rows],
+            "TypeAdapter, one call": mapper.many,
+            "model_construct (trusted)": lambda rows: mapper.many(rows, trusted=True),
+        }
+        for rows_count in args.rows:
+            rows = generate_rows(rows_count)
+            # Прогрев: первая валидация не должна попадать в замеры.
+            for mapping in variants.values():
+                mapping(rows[:100])
+
+            for name, mapping in variants.items():
+                summary = measure(mapping, rows, args.repeats)
+                rows_per_second = int(rows_count / (summary['mean_ms'] / 1000))
+                print(
+                    f"{entity:<8}{rows_count:>8}  {name:<28}{summary['mean_ms']:>10}{summary['p50_ms']:>10}"
+                    f"{summary['max_ms']:>10}{rows_per_second:>12}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,15 @@ class FrameworkVariables:
     DB_PASSWORD = environ.get('DB_PASSWORD') or 'postgres'
     ''' Пароль пользователя, от имени которого будет происходить подключение к СУБД '''
 
+    DB_POOL_MIN_SIZE = environ.get('DB_POOL_MIN_SIZE') or 1
+    ''' Минимальное количество подключений к СУБД, удерживаемых пулом подключений '''
+
+    DB_POOL_MAX_SIZE = environ.get('DB_POOL_MAX_SIZE') or 10
+    ''' Максимальное количество подключений к СУБД в пуле подключений '''
+
+    DB_STREAM_BATCH_SIZE = environ.get('DB_STREAM_BATCH_SIZE') or 500
+    ''' Количество строк, запрашиваемых за одно обращение к серверному курсору при потоковом чтении из БД '''
+
     PASSWORD_HASH_SALT = environ.get('PASSWORD_HASH_SALT') or "DefaultPasswordHashSalt"
     ''' Соль, применяемая при хешировании паролей пользователей '''
 
@@ -38,3 +47,85 @@ class FrameworkVariables:
 
     REFRESH_TOKEN_TTL_IN_MINUTES = environ.get('REFRESH_TOKEN_TTL_IN_MINUTES') or 43200
     ''' Время жизни генерируемых токенов обновления (в минутах) '''
+
+    ADMIN_TOKEN_REFRESH_MARGIN_IN_SECONDS = environ.get('ADMIN_TOKEN_REFRESH_MARGIN_IN_SECONDS') or 300
+    ''' За сколько секунд до истечения токена доступа общая сессия администратора обновляет пару токенов '''
+
+    DB_SNAPSHOT_RESTORE_SCOPE = environ.get('DB_SNAPSHOT_RESTORE_SCOPE') or 'none'
+    ''' Граница, на которой база данных приложения восстанавливается из снимка: "module" (после каждого тестового
+    модуля), "domain" (после каждого функционального домена) или "none" (снимок не используется) '''
+
+    HTTP_POOL_SIZE = environ.get('HTTP_POOL_SIZE') or 10
+    ''' Максимальное количество удерживаемых HTTP-клиентом соединений с сервером приложения '''
+
+    HTTP_POOL_WARMUP_CONNECTIONS = environ.get('HTTP_POOL_WARMUP_CONNECTIONS') or 1
+    ''' Количество соединений, открываемых HTTP-клиентом заранее, при старте сессии '''
+
+    HTTP_TIMEOUT_IN_SECONDS = environ.get('HTTP_TIMEOUT_IN_SECONDS') or 30
+    ''' Время ожидания ответа сервера приложения асинхронным HTTP-клиентом (в секундах) '''
+
+    USER_POOL_SIZE = environ.get('USER_POOL_SIZE') or 2
+    ''' Количество пользователей без прав администратора, создаваемых заранее для пула тестовых пользователей '''
+
+    LATENCY_SUMMARY_PATH = environ.get('LATENCY_SUMMARY_PATH') or 'allure-results/latency-summary.json'
+    ''' Путь к JSON-файлу со сводкой времени ответа эндпоинтов приложения за запуск '''
+
+    DB_QUERY_SUMMARY_PATH = environ.get('DB_QUERY_SUMMARY_PATH') or 'allure-results/db-query-summary.json'
+    ''' Путь к файлу сводки запросов к БД за запуск (самые затратные и самые частые запросы, тесты с N+1 запросами) '''
+
+    DB_QUERY_SUMMARY_TOP_N = environ.get('DB_QUERY_SUMMARY_TOP_N') or 10
+    ''' Количество запросов в каждом из списков сводки запросов к БД '''
+
+    DB_QUERY_REPEAT_THRESHOLD = environ.get('DB_QUERY_REPEAT_THRESHOLD') or 10
+    ''' Количество исполнений одного запроса за тест, превышение которого отмечает тест как содержащий N+1 запросов '''
+
+    PHASE_TIMING_SUMMARY_PATH = environ.get('PHASE_TIMING_SUMMARY_PATH') or 'allure-results/phase-timing-summary.json'
+    ''' Путь к файлу сводки времени стадий тестов (подготовки, исполнения и уборки) за запуск '''
+
+    PHASE_TIMING_SUMMARY_TOP_N = environ.get('PHASE_TIMING_SUMMARY_TOP_N') or 10
+    ''' Количество самых долгих тестов в сводке времени стадий тестов '''
+
+    PERFORMANCE_TRENDS_DB_PATH = environ.get('PERFORMANCE_TRENDS_DB_PATH') or 'allure-report/performance-trends.sqlite3'
+    ''' Путь к файлу SQLite, в котором сохраняются показатели производительности всех запусков '''
+
+    PERFORMANCE_BASELINE_RUNS = environ.get('PERFORMANCE_BASELINE_RUNS') or 10
+    ''' Количество предыдущих запусков в базовой линии (при значении 0 показатели запусков не сохраняются) '''
+
+    PERFORMANCE_BASELINE_MIN_RUNS = environ.get('PERFORMANCE_BASELINE_MIN_RUNS') or 5
+    ''' Минимальное количество предыдущих запусков с показателем, при котором он сравнивается с базовой линией '''
+
+    PERFORMANCE_REGRESSION_MAD_MULTIPLIER = environ.get('PERFORMANCE_REGRESSION_MAD_MULTIPLIER') or 3
+    ''' Допустимое превышение медианы базовой линии в приведённых медианных абсолютных отклонениях '''
+
+    PERFORMANCE_REGRESSION_MIN_INCREASE_PERCENT = environ.get('PERFORMANCE_REGRESSION_MIN_INCREASE_PERCENT') or 20
+    ''' Минимальное превышение медианы базовой линии (в процентах), при котором показатель считается регрессией '''
+
+    ALLURE_ATTACHMENTS_MODE = environ.get('ALLURE_ATTACHMENTS_MODE') or 'on_failure'
+    ''' Режим прикрепления данных запросов и ответов к отчёту: "on_failure" (только при неудаче теста) или "verbose" '''
+
+    ALLURE_REQUEST_DATA_BUFFER_SIZE = environ.get('ALLURE_REQUEST_DATA_BUFFER_SIZE') or 20
+    ''' Количество последних запросов теста, данные которых хранятся для прикрепления к отчёту при неудаче теста '''
+
+    ALLURE_ATTACHMENT_SIZE_LIMIT_IN_KB = environ.get('ALLURE_ATTACHMENT_SIZE_LIMIT_IN_KB') or 256
+    ''' Максимальный размер текстового вложения отчёта (в килобайтах), превышение которого заменяет вложение превью '''
+
+    ALLURE_ATTACHMENT_PREVIEW_SIZE_IN_KB = environ.get('ALLURE_ATTACHMENT_PREVIEW_SIZE_IN_KB') or 16
+    ''' Размер превью вложения, превысившего ALLURE_ATTACHMENT_SIZE_LIMIT_IN_KB (в килобайтах) '''
+
+    ALLURE_WRITER_QUEUE_SIZE = environ.get('ALLURE_WRITER_QUEUE_SIZE') or 1000
+    ''' Размер очереди фоновой записи результатов Allure (при значении 0 результаты записываются в потоке теста) '''
+
+    BULK_ASSERTION_AGGREGATION_THRESHOLD = environ.get('BULK_ASSERTION_AGGREGATION_THRESHOLD') or 100
+    ''' Количество сравнений, превышение которого агрегирует массовую проверку (без остановки на первой ошибке) '''
+
+    LOAD_VIRTUAL_USERS = environ.get('LOAD_VIRTUAL_USERS') or 0
+    ''' Количество виртуальных пользователей нагрузочного запуска (при значении 0 нагрузочный запуск пропускается) '''
+
+    LOAD_DURATION_IN_SECONDS = environ.get('LOAD_DURATION_IN_SECONDS') or 60
+    ''' Длительность нагрузочного запуска (в секундах) '''
+
+    LOAD_ERROR_BACKOFF_IN_SECONDS = environ.get('LOAD_ERROR_BACKOFF_IN_SECONDS') or 0.5
+    ''' Пауза виртуального пользователя после ошибки шага сценария (в секундах) '''
+
+    LOAD_REPORT_PATH = environ.get('LOAD_REPORT_PATH') or 'allure-results/load-report.json'
+    ''' Путь к JSON-файлу с отчётом о нагрузочном запуске '''
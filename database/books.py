@@ -1,68 +1,222 @@
+from collections.abc import Iterator, AsyncIterator
 from typing import List, Type
-from database.db_baseclass import Database
-from models.books import DatabaseBookDataModel
+from uuid import UUID, uuid4
+
+from database.db_baseclass import Database, AsyncDatabase
+from database.lookup import EntityLookup
+from database.mapping import RowMapper
+from models.books import DatabaseBookDataModel, CreatedBookDataBundle
+
+
+BOOKS_LOOKUP = EntityLookup(
+    table='public.books',
+    columns=('id', 'title', 'author', 'isbn'),
+    key_columns=('id', 'isbn')
+)
+
+BOOKS_MAPPER = RowMapper(DatabaseBookDataModel)
+
+ALL_BOOKS_DATA_QUERY = f"SELECT {', '.join(BOOKS_LOOKUP.columns)} FROM public.books;"
+
+ALL_BOOKS_DATA_ORDERED_QUERY = f"SELECT {', '.join(BOOKS_LOOKUP.columns)} FROM public.books ORDER BY id;"
+
+INSERT_BOOKS_QUERY = '''
+    INSERT INTO public.books (id, title, author, isbn)
+    SELECT * FROM unnest(%s::uuid[], %s::text[], %s::text[], %s::text[])
+    '''
+
+DELETE_BOOKS_QUERY = 'DELETE FROM public.books WHERE id = ANY(%s::uuid[]);'
 
 
 def get_all_books_data(db: Database) -> List[DatabaseBookDataModel] | Type[list[None]]:
     db_result = db.execute_db_request(
-        query='SELECT * from public.books',
-        fetchmode='all'
+        query=ALL_BOOKS_DATA_QUERY,
+        fetchmode='all',
+        prepare=True
     )
-    if db_result is not None:
-        books_list = []
-        for book_data_bundle in db_result:
-            book_data = DatabaseBookDataModel(
-                id=book_data_bundle.id,
-                title=book_data_bundle.title,
-                author=book_data_bundle.author,
-                isbn=book_data_bundle.isbn
-            )
-            books_list.append(book_data)
-        return books_list
-    else:
-        return List[None]
+    return _build_books_list(db_result)
+
+
+def iterate_all_books_data(db: Database, batch_size: int | None = None) -> Iterator[DatabaseBookDataModel]:
+    """
+    Данный метод последовательно предоставляет данные всех книг, упорядоченных по ID, не загружая их в память
+    одновременно: строки читаются через серверный курсор порциями по batch_size строк.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param batch_size: Количество строк в порции.
+        Если значение не передано, то используется значение переменной DB_STREAM_BATCH_SIZE.
+    :return: (yield) Данные книги.
+    """
+    for row in db.stream_db_request(query=ALL_BOOKS_DATA_ORDERED_QUERY, batch_size=batch_size):
+        yield BOOKS_MAPPER.one(row)
+
+
+def get_book_data(db: Database, by: str, value: UUID | str) -> DatabaseBookDataModel | None:
+    """
+    Данный метод запрашивает данные книги по значению уникального столбца таблицы public.books.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param by: Столбец, по которому выполняется поиск ("id" или "isbn").
+    :param value: Искомое значение.
+    :return: Данные книги, либо None, если книга не найдена.
+    """
+    db_result = BOOKS_LOOKUP.fetch_one(db=db, by=by, value=value)
+    return BOOKS_MAPPER.one(db_result)
 
 
 def get_book_data_by_id(db: Database, book_id: str) -> DatabaseBookDataModel | None:
+    return get_book_data(db=db, by='id', value=book_id)
+
+
+def get_book_data_by_isbn(db: Database, isbn: str) -> DatabaseBookDataModel | None:
+    return get_book_data(db=db, by='isbn', value=isbn)
+
+
+def get_books_count(db: Database) -> int:
     db_result = db.execute_db_request(
-        query='SELECT * from public.books WHERE id = %s;',
-        params=(book_id,),
+        query="SELECT count(*) FROM public.books;",
         fetchmode='one'
     )
-    if db_result is not None:
-        book_data = DatabaseBookDataModel(
-            id=db_result.id,
-            title=db_result.title,
-            author=db_result.author,
-            isbn=db_result.isbn
+    return db_result[0]
+
+
+def insert_books(db: Database, books_data: list[dict]) -> list[CreatedBookDataBundle]:
+    """
+    Данный метод добавляет книги напрямую в таблицу public.books одним запросом.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param books_data: Список данных книг в формате тела запроса POST /v1/books
+        (см. helpers.data_generators.generate_book_data).
+    :return: Список наборов данных добавленных книг.
+    """
+    books = [CreatedBookDataBundle(book_id=uuid4(), **book_data) for book_data in books_data]
+    if len(books) >= 1:
+        db.execute_db_request(
+            query=INSERT_BOOKS_QUERY,
+            params=_get_books_insertion_params(books),
+            fetchmode='nofetch'
         )
-        return book_data
-    else:
-        return None
+        db.commit()
+    return books
 
 
-def get_book_data_by_isbn(db: Database, isbn: str) -> DatabaseBookDataModel | None:
-    db_result = db.execute_db_request(
-        query='SELECT * from public.books WHERE isbn = %s;',
-        params=(isbn,),
+def delete_books(db: Database, books_ids: list[UUID]) -> None:
+    """
+    Данный метод удаляет книги напрямую из БД одним запросом.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param books_ids: Список ID удаляемых книг.
+    :return: Метод ничего не возвращает.
+    """
+    if len(books_ids) >= 1:
+        db.execute_db_request(
+            query=DELETE_BOOKS_QUERY,
+            params=([str(book_id) for book_id in books_ids],),
+            fetchmode='nofetch'
+        )
+        db.commit()
+
+
+async def async_get_all_books_data(db: AsyncDatabase) -> List[DatabaseBookDataModel] | Type[list[None]]:
+    db_result = await db.execute_db_request(
+        query=ALL_BOOKS_DATA_QUERY,
+        fetchmode='all',
+        prepare=True
+    )
+    return _build_books_list(db_result)
+
+
+async def async_iterate_all_books_data(
+        db: AsyncDatabase, batch_size: int | None = None
+) -> AsyncIterator[DatabaseBookDataModel]:
+    """
+    Асинхронный вариант метода iterate_all_books_data.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param batch_size: Количество строк в порции.
+        Если значение не передано, то используется значение переменной DB_STREAM_BATCH_SIZE.
+    :return: (yield) Данные книги.
+    """
+    async for row in db.stream_db_request(query=ALL_BOOKS_DATA_ORDERED_QUERY, batch_size=batch_size):
+        yield BOOKS_MAPPER.one(row)
+
+
+async def async_get_book_data(db: AsyncDatabase, by: str, value: UUID | str) -> DatabaseBookDataModel | None:
+    """
+    Асинхронный вариант метода get_book_data.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param by: Столбец, по которому выполняется поиск ("id" или "isbn").
+    :param value: Искомое значение.
+    :return: Данные книги, либо None, если книга не найдена.
+    """
+    db_result = await BOOKS_LOOKUP.async_fetch_one(db=db, by=by, value=value)
+    return BOOKS_MAPPER.one(db_result)
+
+
+async def async_get_book_data_by_id(db: AsyncDatabase, book_id: str) -> DatabaseBookDataModel | None:
+    return await async_get_book_data(db=db, by='id', value=book_id)
+
+
+async def async_get_book_data_by_isbn(db: AsyncDatabase, isbn: str) -> DatabaseBookDataModel | None:
+    return await async_get_book_data(db=db, by='isbn', value=isbn)
+
+
+async def async_get_books_count(db: AsyncDatabase) -> int:
+    db_result = await db.execute_db_request(
+        query="SELECT count(*) FROM public.books;",
         fetchmode='one'
     )
-    if db_result is not None:
-        book_data = DatabaseBookDataModel(
-            id=db_result.id,
-            title=db_result.title,
-            author=db_result.author,
-            isbn=db_result.isbn
+    return db_result[0]
+
+
+async def async_insert_books(db: AsyncDatabase, books_data: list[dict]) -> list[CreatedBookDataBundle]:
+    """
+    Асинхронный вариант метода insert_books.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param books_data: Список данных книг в формате тела запроса POST /v1/books.
+    :return: Список наборов данных добавленных книг.
+    """
+    books = [CreatedBookDataBundle(book_id=uuid4(), **book_data) for book_data in books_data]
+    if len(books) >= 1:
+        await db.execute_db_request(
+            query=INSERT_BOOKS_QUERY,
+            params=_get_books_insertion_params(books),
+            fetchmode='nofetch'
+        )
+        await db.commit()
+    return books
+
+
+async def async_delete_books(db: AsyncDatabase, books_ids: list[UUID]) -> None:
+    """
+    Асинхронный вариант метода delete_books.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param books_ids: Список ID удаляемых книг.
+    :return: Метод ничего не возвращает.
+    """
+    if len(books_ids) >= 1:
+        await db.execute_db_request(
+            query=DELETE_BOOKS_QUERY,
+            params=([str(book_id) for book_id in books_ids],),
+            fetchmode='nofetch'
         )
-        return book_data
+        await db.commit()
+
+
+def _build_books_list(db_result) -> List[DatabaseBookDataModel] | Type[list[None]]:
+    if db_result is not None:
+        return BOOKS_MAPPER.many(db_result)
     else:
-        return None
+        return List[None]
 
 
-def get_books_count(db: Database) -> int:
-    db_result = db.execute_db_request(
-        query="SELECT count(*) FROM public.books;",
-        fetchmode='one'
+def _get_books_insertion_params(books: list[CreatedBookDataBundle]) -> tuple[list, ...]:
+    return (
+        [str(book.book_id) for book in books],
+        [book.title for book in books],
+        [book.author for book in books],
+        [book.isbn for book in books]
     )
-    books_count = db_result[0]
-    return books_count
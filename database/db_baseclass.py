@@ -1,7 +1,17 @@
+import threading
+import time
+from collections.abc import Iterator, AsyncIterator
+from contextlib import contextmanager, asynccontextmanager, nullcontext
+from contextvars import ContextVar
+from uuid import uuid4
+
 import psycopg
-from psycopg import ClientCursor, DatabaseError
+from psycopg import ClientCursor, AsyncClientCursor, DatabaseError
+from psycopg.conninfo import make_conninfo
 from psycopg.rows import namedtuple_row
+from psycopg_pool import ConnectionPool, AsyncConnectionPool
 from data.framework_variables import FrameworkVariables as FrVars
+from helpers.query_tracker import query_tracker
 
 
 class Database:
@@ -9,58 +19,336 @@ class Database:
     Данный класс включает в себя базовые операции с БД,
     такие, как: установка подключения, создание БД при необходимости,
     сброс БД.
+
+    Подключения к БД предоставляются пулом (psycopg_pool). Каждый запрос получает подключение из пула на время своего
+    исполнения, поэтому запросы из разных потоков и асинхронных задач не ожидают друг друга. Несколько запросов могут
+    быть исполнены на одном подключении (в одной транзакции) внутри блока "with db.connection():".
     """
 
-    def __init__(self):
-        self.connection = None
-        self.cursor = None
+    _existing_databases: set[tuple[str, str, str]] = set()
+    ''' Базы данных, существование которых уже было проверено (хост, порт, название) '''
+
+    _existence_check_lock = threading.Lock()
+
+    def __init__(self, dbname: str = 'leeroy', min_size: int | None = None, max_size: int | None = None):
+        """
+        :param dbname: Название базы данных.
+        :param min_size: Минимальное количество подключений, удерживаемых пулом.
+            Если значение не передано, то используется значение переменной DB_POOL_MIN_SIZE.
+        :param max_size: Максимальное количество подключений пула.
+            Если значение не передано, то используется значение переменной DB_POOL_MAX_SIZE.
+        """
+        self.dbname = dbname
+        self.pool: ConnectionPool | None = None
         self.user = str(FrVars.DB_USER)
         self.password = str(FrVars.DB_PASSWORD)
         self.host = str(FrVars.DB_HOST)
         self.port = str(FrVars.DB_PORT)
+        self.min_size = int(min_size or FrVars.DB_POOL_MIN_SIZE)
+        self.max_size = max(int(max_size or FrVars.DB_POOL_MAX_SIZE), self.min_size)
+        self._bound_connection: ContextVar[psycopg.Connection | None] = ContextVar(
+            f"database_{dbname}_{id(self)}_connection", default=None
+        )
 
     def connect_to_database(self):
-        # Первым шагом происходит подключение к стандартной базе данных "postgres". Это необходимо для проверки
-        # существования базы данных приложения "leeroy".
-        self.connection = psycopg.connect(
-            cursor_factory=ClientCursor,
-            dbname='postgres',
-            user=self.user,
-            password=self.password,
-            host=self.host,
-            port=self.port
-        )
-        # Создаём курсор
-        self.cursor = self.connection.cursor()
-        # Проверяем существование базы данных "leeroy".
-        self.cursor.execute('SELECT datname FROM pg_database WHERE datname = \'leeroy\'')
-        leeroy_in_exist = self.cursor.fetchone()
-
-        if leeroy_in_exist is None:
-            raise DatabaseError("Database Leeroy is not exist!")
-        else:
-            self.connection.close()
-            self.connection = psycopg.connect(
-                cursor_factory=ClientCursor,
-                dbname='leeroy',
+        # Существование базы данных приложения проверяется через подключение к стандартной базе данных "postgres"
+        # только при первом подключении к ней за время жизни процесса.
+        self._check_database_existence()
+
+        self.pool = ConnectionPool(
+            conninfo=make_conninfo(
+                dbname=self.dbname,
                 user=self.user,
                 password=self.password,
                 host=self.host,
                 port=self.port
-            )
-            self.cursor = self.connection.cursor(row_factory=namedtuple_row)
-
-    def execute_db_request(self, query: str, params: tuple = None, fetchmode: str = 'all'):
-        self.cursor.execute(query, params)
-        if fetchmode == 'all':
-            result = self.cursor.fetchall()
-        elif fetchmode == 'one':
-            result = self.cursor.fetchone()
-        elif fetchmode == 'nofetch':
-            result = None
-        else:
+            ),
+            min_size=self.min_size,
+            max_size=self.max_size,
+            kwargs={
+                "cursor_factory": ClientCursor,
+                "row_factory": namedtuple_row
+            },
+            name=f"{self.dbname}-pool",
+            # Подключения проверяются при выдаче из пула: подключения, закрытые сервером (например, при восстановлении
+            # базы данных из снимка), заменяются новыми.
+            check=ConnectionPool.check_connection,
+            open=True
+        )
+        # Ожидание открытия минимального количества подключений: недоступность БД обнаруживается сразу.
+        self.pool.wait()
+
+    def _check_database_existence(self):
+        database_key = (self.host, self.port, self.dbname)
+        with self._existence_check_lock:
+            if database_key in self._existing_databases:
+                return
+
+            with psycopg.connect(
+                    dbname='postgres',
+                    user=self.user,
+                    password=self.password,
+                    host=self.host,
+                    port=self.port
+            ) as connection:
+                database_is_exist = connection.execute(
+                    'SELECT datname FROM pg_database WHERE datname = %s', (self.dbname,)
+                ).fetchone()
+
+            if database_is_exist is None:
+                raise DatabaseError(f"Database {self.dbname} is not exist!")
+            self._existing_databases.add(database_key)
+
+    @contextmanager
+    def connection(self):
+        """
+        Контекстный менеджер, закрепляющий подключение из пула за текущим потоком (или асинхронной задачей) на время
+        блока. Все запросы внутри блока исполняются на этом подключении, а по завершении блока транзакция фиксируется
+        (или откатывается, если блок завершился исключением) и подключение возвращается в пул.
+
+        :return: (yield) Подключение к БД.
+        """
+        bound_connection = self._bound_connection.get()
+        if bound_connection is not None:
+            yield bound_connection
+            return
+
+        with self.pool.connection() as connection:
+            token = self._bound_connection.set(connection)
+            try:
+                yield connection
+            finally:
+                self._bound_connection.reset(token)
+
+    def execute_db_request(self, query: str, params: tuple = None, fetchmode: str = 'all', prepare: bool = False):
+        if fetchmode not in ('all', 'one', 'nofetch'):
             raise DatabaseError("Unsupported fetch mode type!")
+
+        with self.connection() as connection:
+            # Подготовленные запросы поддерживаются только курсором с привязкой параметров на стороне сервера,
+            # поэтому для них вместо курсора по умолчанию (ClientCursor) используется psycopg.Cursor.
+            cursor = psycopg.Cursor(connection) if prepare else connection.cursor()
+            started_at = time.perf_counter()
+            try:
+                with cursor:
+                    cursor.execute(query, params, prepare=prepare or None)
+                    if fetchmode == 'all':
+                        result = cursor.fetchall()
+                    elif fetchmode == 'one':
+                        result = cursor.fetchone()
+                    else:
+                        result = None
+            finally:
+                # Время исполнения и количество запросов учитываются для текущего теста и для сводки за запуск.
+                query_tracker.record(query, (time.perf_counter() - started_at) * 1000)
         return result
 
+    def stream_db_request(self, query: str, params: tuple = None, batch_size: int | None = None) -> Iterator:
+        """
+        Метод для потокового чтения результата запроса через именованный курсор на стороне сервера: строки
+        запрашиваются у сервера порциями по batch_size строк, поэтому в памяти одновременно находится только одна
+        порция, независимо от размера результата.
+
+        Подключение удерживается до тех пор, пока генератор не будет исчерпан или закрыт.
+
+        :param query: Текст запроса.
+        :param params: Параметры запроса.
+        :param batch_size: Количество строк в порции.
+            Если значение не передано, то используется значение переменной DB_STREAM_BATCH_SIZE.
+        :return: (yield) Строки результата запроса.
+        """
+        batch_size = int(batch_size or FrVars.DB_STREAM_BATCH_SIZE)
+        # Подключение не закрепляется за контекстом: выполнение генератора может прерываться запросами вызывающего
+        # кода, которые в таком случае исполняются на других подключениях пула.
+        bound_connection = self._bound_connection.get()
+        with (nullcontext(bound_connection) if bound_connection is not None else self.pool.connection()) as connection:
+            # Учитывается время обращений к серверу без времени обработки строк вызывающим кодом.
+            elapsed_in_ms = 0.0
+            try:
+                with connection.cursor(name=f"{self.dbname}_stream_{uuid4().hex}") as cursor:
+                    started_at = time.perf_counter()
+                    cursor.execute(query, params)
+                    rows = cursor.fetchmany(batch_size)
+                    elapsed_in_ms += (time.perf_counter() - started_at) * 1000
+                    while rows:
+                        yield from rows
+                        started_at = time.perf_counter()
+                        rows = cursor.fetchmany(batch_size)
+                        elapsed_in_ms += (time.perf_counter() - started_at) * 1000
+            finally:
+                query_tracker.record(query, elapsed_in_ms)
+
     def commit(self):
-        self.connection.commit()
\ No newline at end of file
+        # Вне блока "with db.connection():" каждый запрос фиксируется при возврате подключения в пул.
+        bound_connection = self._bound_connection.get()
+        if bound_connection is not None:
+            bound_connection.commit()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+        self.pool = None
+
+
+class AsyncDatabase:
+    """
+    Данный класс является асинхронным вариантом класса Database: подключения к БД предоставляются асинхронным пулом
+    (psycopg_pool.AsyncConnectionPool), а метод execute_db_request является корутиной с тем же набором аргументов.
+
+    Запросы к БД не блокируют цикл событий, поэтому проверки в БД могут исполняться одновременно с HTTP-запросами.
+    Каждая асинхронная задача получает собственное подключение из пула.
+    """
+
+    def __init__(self, dbname: str = 'leeroy', min_size: int | None = None, max_size: int | None = None):
+        """
+        :param dbname: Название базы данных.
+        :param min_size: Минимальное количество подключений, удерживаемых пулом.
+            Если значение не передано, то используется значение переменной DB_POOL_MIN_SIZE.
+        :param max_size: Максимальное количество подключений пула.
+            Если значение не передано, то используется значение переменной DB_POOL_MAX_SIZE.
+        """
+        self.dbname = dbname
+        self.pool: AsyncConnectionPool | None = None
+        self.user = str(FrVars.DB_USER)
+        self.password = str(FrVars.DB_PASSWORD)
+        self.host = str(FrVars.DB_HOST)
+        self.port = str(FrVars.DB_PORT)
+        self.min_size = int(min_size or FrVars.DB_POOL_MIN_SIZE)
+        self.max_size = max(int(max_size or FrVars.DB_POOL_MAX_SIZE), self.min_size)
+        self._bound_connection: ContextVar[psycopg.AsyncConnection | None] = ContextVar(
+            f"async_database_{dbname}_{id(self)}_connection", default=None
+        )
+
+    async def connect_to_database(self):
+        await self._check_database_existence()
+
+        self.pool = AsyncConnectionPool(
+            conninfo=make_conninfo(
+                dbname=self.dbname,
+                user=self.user,
+                password=self.password,
+                host=self.host,
+                port=self.port
+            ),
+            min_size=self.min_size,
+            max_size=self.max_size,
+            kwargs={
+                "cursor_factory": AsyncClientCursor,
+                "row_factory": namedtuple_row
+            },
+            name=f"{self.dbname}-async-pool",
+            # Подключения проверяются при выдаче из пула: подключения, закрытые сервером (например, при восстановлении
+            # базы данных из снимка), заменяются новыми.
+            check=AsyncConnectionPool.check_connection,
+            open=False
+        )
+        await self.pool.open(wait=True)
+
+    async def _check_database_existence(self):
+        # Результат проверки общий с классом Database: проверка выполняется один раз за время жизни процесса.
+        # Блокировка удерживается только при обращении к общему множеству (без ожидания внутри неё), чтобы не
+        # блокировать цикл событий; одновременная повторная проверка одной базы данных безвредна.
+        database_key = (self.host, self.port, self.dbname)
+        with Database._existence_check_lock:
+            if database_key in Database._existing_databases:
+                return
+
+        async with await psycopg.AsyncConnection.connect(
+                dbname='postgres',
+                user=self.user,
+                password=self.password,
+                host=self.host,
+                port=self.port
+        ) as connection:
+            cursor = await connection.execute('SELECT datname FROM pg_database WHERE datname = %s', (self.dbname,))
+            database_is_exist = await cursor.fetchone()
+
+        if database_is_exist is None:
+            raise DatabaseError(f"Database {self.dbname} is not exist!")
+        with Database._existence_check_lock:
+            Database._existing_databases.add(database_key)
+
+    @asynccontextmanager
+    async def connection(self):
+        """
+        Асинхронный вариант контекстного менеджера Database.connection: закрепляет подключение из пула за текущей
+        асинхронной задачей на время блока.
+
+        :return: (yield) Подключение к БД.
+        """
+        bound_connection = self._bound_connection.get()
+        if bound_connection is not None:
+            yield bound_connection
+            return
+
+        async with self.pool.connection() as connection:
+            token = self._bound_connection.set(connection)
+            try:
+                yield connection
+            finally:
+                self._bound_connection.reset(token)
+
+    async def execute_db_request(
+            self, query: str, params: tuple = None, fetchmode: str = 'all', prepare: bool = False
+    ):
+        if fetchmode not in ('all', 'one', 'nofetch'):
+            raise DatabaseError("Unsupported fetch mode type!")
+
+        async with self.connection() as connection:
+            cursor = psycopg.AsyncCursor(connection) if prepare else connection.cursor()
+            started_at = time.perf_counter()
+            try:
+                async with cursor:
+                    await cursor.execute(query, params, prepare=prepare or None)
+                    if fetchmode == 'all':
+                        result = await cursor.fetchall()
+                    elif fetchmode == 'one':
+                        result = await cursor.fetchone()
+                    else:
+                        result = None
+            finally:
+                query_tracker.record(query, (time.perf_counter() - started_at) * 1000)
+        return result
+
+    async def stream_db_request(
+            self, query: str, params: tuple = None, batch_size: int | None = None
+    ) -> AsyncIterator:
+        """
+        Асинхронный вариант метода Database.stream_db_request.
+
+        :param query: Текст запроса.
+        :param params: Параметры запроса.
+        :param batch_size: Количество строк в порции.
+            Если значение не передано, то используется значение переменной DB_STREAM_BATCH_SIZE.
+        :return: (yield) Строки результата запроса.
+        """
+        batch_size = int(batch_size or FrVars.DB_STREAM_BATCH_SIZE)
+        bound_connection = self._bound_connection.get()
+        async with (
+                nullcontext(bound_connection) if bound_connection is not None else self.pool.connection()
+        ) as connection:
+            elapsed_in_ms = 0.0
+            try:
+                async with connection.cursor(name=f"{self.dbname}_stream_{uuid4().hex}") as cursor:
+                    started_at = time.perf_counter()
+                    await cursor.execute(query, params)
+                    rows = await cursor.fetchmany(batch_size)
+                    elapsed_in_ms += (time.perf_counter() - started_at) * 1000
+                    while rows:
+                        for row in rows:
+                            yield row
+                        started_at = time.perf_counter()
+                        rows = await cursor.fetchmany(batch_size)
+                        elapsed_in_ms += (time.perf_counter() - started_at) * 1000
+            finally:
+                query_tracker.record(query, elapsed_in_ms)
+
+    async def commit(self):
+        bound_connection = self._bound_connection.get()
+        if bound_connection is not None:
+            await bound_connection.commit()
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+        self.pool = None
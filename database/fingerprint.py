@@ -0,0 +1,44 @@
+from database.db_baseclass import Database, AsyncDatabase
+from models.database import TableFingerprint
+
+FINGERPRINT_TABLES = ('public.users', 'public.books', 'public.access_tokens', 'public.refresh_tokens')
+''' Таблицы, отпечатки которых формирует get_tables_fingerprint '''
+
+# Хэш содержимого таблицы - сумма хэшей текстовых представлений её строк: сумма не зависит от порядка строк и
+# вычисляется без сортировки, а строки не передаются клиенту.
+TABLES_FINGERPRINT_QUERY = " UNION ALL ".join(
+    f"SELECT '{table}' AS table_name, count(*) AS rows_count, "
+    f"coalesce(sum(hashtextextended(t::text, 0)), 0)::text AS content_hash FROM {table} AS t"
+    for table in FINGERPRINT_TABLES
+) + ";"
+
+
+def get_tables_fingerprint(db: Database) -> dict[str, TableFingerprint]:
+    """
+    Данный метод одним запросом формирует отпечатки состояния таблиц пользователей, книг, токенов доступа и токенов
+    обновления. Сравнение отпечатков, полученных до и после действия, позволяет одним сравнением проверить, что
+    действие не изменило ни одну из таблиц.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :return: Словарь отпечатков, ключами которого являются названия таблиц.
+    """
+    db_result = db.execute_db_request(query=TABLES_FINGERPRINT_QUERY, fetchmode='all', prepare=True)
+    return _build_fingerprints(db_result)
+
+
+async def async_get_tables_fingerprint(db: AsyncDatabase) -> dict[str, TableFingerprint]:
+    """
+    Асинхронный вариант метода get_tables_fingerprint.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :return: Словарь отпечатков, ключами которого являются названия таблиц.
+    """
+    db_result = await db.execute_db_request(query=TABLES_FINGERPRINT_QUERY, fetchmode='all', prepare=True)
+    return _build_fingerprints(db_result)
+
+
+def _build_fingerprints(db_result) -> dict[str, TableFingerprint]:
+    return {
+        row.table_name: TableFingerprint(rows_count=row.rows_count, content_hash=row.content_hash)
+        for row in db_result
+    }
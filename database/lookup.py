@@ -0,0 +1,95 @@
+from database.db_baseclass import Database, AsyncDatabase
+
+
+class EntityLookup:
+    """
+    Данный класс реализует поиск одной записи таблицы по значению любого из её уникальных индексированных столбцов.
+
+    Запрос перечисляет столбцы по именам (вместо "SELECT *"), поэтому строки результата не зависят от порядка
+    столбцов в таблице. Текст запроса для каждого столбца поиска формируется один раз, а сам запрос исполняется как
+    подготовленный (prepared statement) на стороне сервера: разбор и планирование запроса выполняются однократно
+    для каждого подключения, а при повторных поисках передаются только параметры.
+
+    Для поиска нескольких записей одним запросом предусмотрен метод fetch_many: искомые значения передаются
+    одним параметром-массивом ("= ANY(%s)"), поэтому количество запросов не зависит от количества записей.
+    """
+
+    def __init__(self, table: str, columns: tuple[str, ...], key_columns: tuple[str, ...]):
+        """
+        :param table: Название таблицы (вместе со схемой).
+        :param columns: Названия возвращаемых столбцов.
+        :param key_columns: Названия столбцов, по которым допускается поиск (уникальные индексированные столбцы).
+        """
+        self.table = table
+        self.columns = columns
+        self.queries = {
+            key_column: f"SELECT {', '.join(columns)} FROM {table} WHERE {key_column} = %s;"
+            for key_column in key_columns
+        }
+        self.batch_queries = {
+            key_column: f"SELECT {', '.join(columns)} FROM {table} WHERE {key_column} = ANY(%s);"
+            for key_column in key_columns
+        }
+
+    def fetch_one(self, db: Database, by: str, value):
+        """
+        Метод для поиска записи.
+
+        :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+        :param by: Название столбца, по которому выполняется поиск.
+        :param value: Искомое значение.
+        :return: Найденная строка (namedtuple с именами столбцов), либо None, если запись не найдена.
+        :raises ValueError: Исключение, возвращаемое в случае, если поиск по переданному столбцу не поддерживается.
+        """
+        return db.execute_db_request(query=self._get_query(by), params=(str(value),), fetchmode='one', prepare=True)
+
+    async def async_fetch_one(self, db: AsyncDatabase, by: str, value):
+        """
+        Асинхронный вариант метода fetch_one.
+
+        :param db: Экземпляр класса AsyncDatabase.
+        :param by: Название столбца, по которому выполняется поиск.
+        :param value: Искомое значение.
+        :return: Найденная строка (namedtuple с именами столбцов), либо None, если запись не найдена.
+        """
+        return await db.execute_db_request(
+            query=self._get_query(by), params=(str(value),), fetchmode='one', prepare=True
+        )
+
+    def fetch_many(self, db: Database, by: str, values) -> list:
+        """
+        Метод для поиска нескольких записей одним запросом.
+
+        :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+        :param by: Название столбца, по которому выполняется поиск.
+        :param values: Искомые значения.
+        :return: Список найденных строк (namedtuple с именами столбцов). Строки для ненайденных значений отсутствуют,
+            порядок строк не гарантируется.
+        :raises ValueError: Исключение, возвращаемое в случае, если поиск по переданному столбцу не поддерживается.
+        """
+        query = self._get_query(by, batch=True)
+        values = [str(value) for value in values]
+        if len(values) == 0:
+            return []
+        return db.execute_db_request(query=query, params=(values,), fetchmode='all', prepare=True)
+
+    async def async_fetch_many(self, db: AsyncDatabase, by: str, values) -> list:
+        """
+        Асинхронный вариант метода fetch_many.
+
+        :param db: Экземпляр класса AsyncDatabase.
+        :param by: Название столбца, по которому выполняется поиск.
+        :param values: Искомые значения.
+        :return: Список найденных строк (namedtuple с именами столбцов).
+        """
+        query = self._get_query(by, batch=True)
+        values = [str(value) for value in values]
+        if len(values) == 0:
+            return []
+        return await db.execute_db_request(query=query, params=(values,), fetchmode='all', prepare=True)
+
+    def _get_query(self, by: str, batch: bool = False) -> str:
+        try:
+            return self.batch_queries[by] if batch else self.queries[by]
+        except KeyError:
+            raise ValueError(f"Lookup by '{by}' is not supported for {self.table}!")
@@ -0,0 +1,67 @@
+from typing import Callable, Generic, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+ModelType = TypeVar('ModelType', bound=BaseModel)
+
+
+class RowMapper(Generic[ModelType]):
+    """
+    Данный класс преобразует строки результата запроса (namedtuple с именами столбцов) в pydantic-модели.
+
+    Предусмотрено два режима:
+
+    - с валидацией: весь набор строк валидируется одним вызовом заранее собранного TypeAdapter (list[модель]) вместо
+      создания модели для каждой строки по отдельности;
+    - доверенный (trusted=True): модели создаются методом model_construct без валидации. Режим предназначен для
+      массового чтения данных, типы которых гарантируются схемой БД и драйвером (UUID, текст, булевы значения).
+      Он выигрывает только у моделей с дорогими валидаторами (например, EmailStr): простые модели pydantic-core
+      валидирует быстрее, чем создаёт model_construct (см. benchmarks/row_mapping.py).
+    """
+
+    def __init__(self, model: type[ModelType], prepare_row: Callable[[dict], dict] | None = None):
+        """
+        :param model: Класс pydantic-модели.
+        :param prepare_row: Функция предварительной обработки строки (в виде словаря), приводящая значения столбцов
+            к типам полей модели (например, datetime - к строке). Если функция не передана, то строки передаются
+            в модель без изменений.
+        """
+        self.model = model
+        self.prepare_row = prepare_row
+        self._list_adapter = TypeAdapter(list[model])
+
+    def one(self, row, trusted: bool = False) -> ModelType | None:
+        """
+        Метод для преобразования одной строки.
+
+        :param row: Строка результата запроса, либо None.
+        :param trusted: Признак создания модели без валидации.
+        :return: Экземпляр модели, либо None, если строка не передана.
+        """
+        if row is None:
+            return None
+        row_data = self._to_dict(row)
+        if trusted:
+            return self.model.model_construct(**row_data)
+        return self.model(**row_data)
+
+    def many(self, rows, trusted: bool = False) -> list[ModelType]:
+        """
+        Метод для преобразования набора строк.
+
+        :param rows: Строки результата запроса.
+        :param trusted: Признак создания моделей без валидации.
+        :return: Список экземпляров модели в порядке строк.
+        """
+        if trusted:
+            return [self.model.model_construct(**self._to_dict(row)) for row in rows]
+        if self.prepare_row is None:
+            # Строки (namedtuple) читаются валидатором напрямую по атрибутам, без промежуточных словарей.
+            return self._list_adapter.validate_python(rows, from_attributes=True)
+        return self._list_adapter.validate_python([self._to_dict(row) for row in rows])
+
+    def _to_dict(self, row) -> dict:
+        row_data = row._asdict()
+        if self.prepare_row is not None:
+            row_data = self.prepare_row(row_data)
+        return row_data
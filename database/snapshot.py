@@ -0,0 +1,166 @@
+import time
+from typing import Callable
+
+import psycopg
+from psycopg import sql, DatabaseError
+
+from database.db_baseclass import Database
+
+CONNECTIONS_TERMINATION_TIMEOUT_IN_SECONDS = 10
+''' Максимальное время ожидания завершения принудительно закрытых подключений к базе данных (в секундах) '''
+
+
+class DatabaseSnapshot:
+    """
+    Данный класс реализует снимок базы данных приложения в виде базы данных-шаблона PostgreSQL и быстрое
+    восстановление базы данных приложения из этого снимка.
+
+    Создание снимка и восстановление из него требуют отсутствия подключений к копируемой базе данных, поэтому на время
+    этих операций подключения к ней запрещаются, а открытые подключения (в том числе подключения приложения)
+    принудительно закрываются. Подключение фреймворка (экземпляр класса Database) закрывается и восстанавливается
+    автоматически, а приложение должно самостоятельно восстановить свои подключения.
+    """
+
+    def __init__(self, db: Database, snapshot_name: str | None = None):
+        """
+        :param db: Экземпляр класса Database, снимок базы данных которого необходимо создать. Подключение экземпляра
+            закрывается на время создания снимка или восстановления из него и восстанавливается после.
+        :param snapshot_name: Название базы данных-шаблона, хранящей снимок.
+            Если значение не передано, то используется название "<название базы данных>_snapshot".
+        """
+        self.db = db
+        self.database_name = db.dbname
+        self.snapshot_name = snapshot_name or f"{db.dbname}_snapshot"
+        self._restore_callbacks: list[Callable[[], None]] = []
+
+    def add_restore_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Метод для регистрации функции, которая будет вызвана после каждого восстановления базы данных из снимка.
+        Используется для сброса закешированных данных, которые перестают существовать после восстановления
+        (например, токенов общей сессии администратора).
+
+        :param callback: Функция без аргументов.
+        :return: Метод ничего не возвращает.
+        """
+        self._restore_callbacks.append(callback)
+
+    def exists(self) -> bool:
+        """
+        Метод для проверки существования снимка.
+
+        :return: True, если база данных-шаблон со снимком существует, иначе - False.
+        """
+        with self._maintenance_connection() as connection:
+            return self._database_exists(connection, self.snapshot_name)
+
+    def create(self) -> None:
+        """
+        Метод для создания снимка базы данных. Ранее созданный снимок заменяется новым.
+
+        :return: Метод ничего не возвращает.
+        """
+        self.db.close()
+        try:
+            with self._maintenance_connection() as connection:
+                self._drop_snapshot(connection)
+                self._disconnect_clients(connection, self.database_name)
+                try:
+                    connection.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+                        sql.Identifier(self.snapshot_name), sql.Identifier(self.database_name)
+                    ))
+                finally:
+                    self._allow_connections(connection, self.database_name, True)
+                connection.execute(sql.SQL("ALTER DATABASE {} WITH IS_TEMPLATE true ALLOW_CONNECTIONS false").format(
+                    sql.Identifier(self.snapshot_name)
+                ))
+        finally:
+            self.db.connect_to_database()
+
+    def restore(self) -> None:
+        """
+        Метод для восстановления базы данных из снимка: база данных удаляется и создаётся заново копированием
+        базы данных-шаблона.
+
+        :return: Метод ничего не возвращает.
+        :raises DatabaseError: Исключение, возвращаемое в случае, если снимок не существует.
+        """
+        self.db.close()
+        try:
+            with self._maintenance_connection() as connection:
+                if not self._database_exists(connection, self.snapshot_name):
+                    raise DatabaseError(f"Database snapshot {self.snapshot_name} is not exist!")
+                self._disconnect_clients(connection, self.database_name)
+                try:
+                    connection.execute(sql.SQL("DROP DATABASE {} WITH (FORCE)").format(
+                        sql.Identifier(self.database_name)
+                    ))
+                except DatabaseError:
+                    self._allow_connections(connection, self.database_name, True)
+                    raise
+                connection.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+                    sql.Identifier(self.database_name), sql.Identifier(self.snapshot_name)
+                ))
+        finally:
+            self.db.connect_to_database()
+
+        for callback in self._restore_callbacks:
+            callback()
+
+    def drop(self) -> None:
+        """
+        Метод для удаления снимка.
+
+        :return: Метод ничего не возвращает.
+        """
+        with self._maintenance_connection() as connection:
+            self._drop_snapshot(connection)
+
+    def _maintenance_connection(self) -> psycopg.Connection:
+        # Команды CREATE/DROP DATABASE не могут исполняться внутри транзакции и из копируемой базы данных,
+        # поэтому они отправляются через отдельное подключение к служебной базе данных "postgres".
+        return psycopg.connect(
+            dbname='postgres',
+            user=self.db.user,
+            password=self.db.password,
+            host=self.db.host,
+            port=self.db.port,
+            autocommit=True
+        )
+
+    @staticmethod
+    def _database_exists(connection: psycopg.Connection, database_name: str) -> bool:
+        return connection.execute(
+            "SELECT 1 FROM pg_database WHERE datname = %s", (database_name,)
+        ).fetchone() is not None
+
+    def _drop_snapshot(self, connection: psycopg.Connection) -> None:
+        if not self._database_exists(connection, self.snapshot_name):
+            return
+        connection.execute(sql.SQL("ALTER DATABASE {} WITH IS_TEMPLATE false").format(
+            sql.Identifier(self.snapshot_name)
+        ))
+        connection.execute(sql.SQL("DROP DATABASE {} WITH (FORCE)").format(sql.Identifier(self.snapshot_name)))
+
+    @staticmethod
+    def _allow_connections(connection: psycopg.Connection, database_name: str, allow: bool) -> None:
+        connection.execute(sql.SQL("ALTER DATABASE {} WITH ALLOW_CONNECTIONS {}").format(
+            sql.Identifier(database_name), sql.Literal(allow)
+        ))
+
+    def _disconnect_clients(self, connection: psycopg.Connection, database_name: str) -> None:
+        # Запрет новых подключений не позволяет приложению переподключиться до завершения операции.
+        self._allow_connections(connection, database_name, False)
+        connection.execute(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = %s AND pid <> pg_backend_pid()",
+            (database_name,)
+        )
+        # Закрытие подключений выполняется сервером асинхронно, поэтому их исчезновение необходимо дождаться.
+        deadline = time.monotonic() + CONNECTIONS_TERMINATION_TIMEOUT_IN_SECONDS
+        while connection.execute(
+                "SELECT count(*) FROM pg_stat_activity WHERE datname = %s AND pid <> pg_backend_pid()",
+                (database_name,)
+        ).fetchone()[0] > 0:
+            if time.monotonic() > deadline:
+                self._allow_connections(connection, database_name, True)
+                raise DatabaseError(f"Connections to database {database_name} were not terminated in time!")
+            time.sleep(0.05)
@@ -1,42 +1,85 @@
-from datetime import datetime
 from uuid import UUID
 
-from database.db_baseclass import Database
+from database.db_baseclass import Database, AsyncDatabase
+from database.lookup import EntityLookup
+from database.mapping import RowMapper
 from models.jwt import DatabaseAccessToken, DatabaseRefreshToken
 
 
-def get_access_token_by_id(db: Database, token_id: UUID) -> DatabaseAccessToken:
-    db_result = db.execute_db_request(
-        query='SELECT * from public.access_tokens WHERE id = %s;',
-        params=(str(token_id),),
-        fetchmode='one'
-    )
-    token_data = DatabaseAccessToken(
-        id=db_result[0],
-        user_id=db_result[1],
-        issued_at=db_result[2].isoformat(),
-        expired_at=db_result[3].isoformat(),
-        refresh_token_id=db_result[4],
-        revoked=db_result[5]
-    )
+ACCESS_TOKENS_LOOKUP = EntityLookup(
+    table='public.access_tokens',
+    columns=('id', 'user_id', 'issued_at', 'expired_at', 'refresh_token_id', 'revoked'),
+    key_columns=('id',)
+)
+
+REFRESH_TOKENS_LOOKUP = EntityLookup(
+    table='public.refresh_tokens',
+    columns=('id', 'user_id', 'issued_at', 'expired_at', 'access_token_id', 'revoked'),
+    key_columns=('id',)
+)
+
+TOKENS_TABLES = {
+    'access_token': 'public.access_tokens',
+    'refresh_token': 'public.refresh_tokens'
+}
+''' Таблицы токенов по типам токенов '''
+
+
+def _format_token_dates(token_data: dict) -> dict:
+    token_data['issued_at'] = token_data['issued_at'].isoformat()
+    token_data['expired_at'] = token_data['expired_at'].isoformat()
     return token_data
 
 
+ACCESS_TOKENS_MAPPER = RowMapper(DatabaseAccessToken, prepare_row=_format_token_dates)
+
+REFRESH_TOKENS_MAPPER = RowMapper(DatabaseRefreshToken, prepare_row=_format_token_dates)
+
+
+def get_token(
+        db: Database,
+        by: str,
+        value: UUID | str,
+        token_type: str = 'access_token'
+) -> DatabaseAccessToken | DatabaseRefreshToken | None:
+    """
+    Данный метод запрашивает данные токена доступа или токена обновления по значению уникального столбца таблицы.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param by: Столбец, по которому выполняется поиск ("id").
+    :param value: Искомое значение.
+    :param token_type: Тип токена ("access_token" или "refresh_token")
+    :return: Данные токена, либо None, если токен не найден.
+    """
+    lookup, mapper = _get_token_lookup(token_type)
+    db_result = lookup.fetch_one(db=db, by=by, value=value)
+    return mapper.one(db_result)
+
+
+def get_access_token_by_id(db: Database, token_id: UUID) -> DatabaseAccessToken:
+    return get_token(db=db, by='id', value=token_id, token_type='access_token')
+
+
 def get_refresh_token_by_id(db: Database, token_id: UUID) -> DatabaseRefreshToken:
-    db_result = db.execute_db_request(
-        query='SELECT * from public.refresh_tokens WHERE id = %s;',
-        params=(str(token_id),),
-        fetchmode='one'
-    )
-    token_data = DatabaseRefreshToken(
-        id=db_result[0],
-        user_id=db_result[1],
-        issued_at=db_result[2].isoformat(),
-        expired_at=db_result[3].isoformat(),
-        access_token_id=db_result[4],
-        revoked=db_result[5]
-    )
-    return token_data
+    return get_token(db=db, by='id', value=token_id, token_type='refresh_token')
+
+
+def get_tokens_by_ids(
+        db: Database,
+        tokens_ids: list[UUID],
+        token_type: str = 'access_token'
+) -> dict[UUID, DatabaseAccessToken | DatabaseRefreshToken]:
+    """
+    Данный метод запрашивает данные нескольких токенов одного типа одним запросом.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param tokens_ids: Список UUIDv4 идентификаторов токенов.
+    :param token_type: Тип токенов ("access_token" или "refresh_token")
+    :return: Словарь данных токенов, ключами которого являются их ID. Ненайденные токены в словаре отсутствуют.
+    """
+    lookup, mapper = _get_token_lookup(token_type)
+    db_result = lookup.fetch_many(db=db, by='id', values=tokens_ids)
+    return {token_data.id: token_data for token_data in mapper.many(db_result)}
 
 
 def change_jwt_token_revoke_status(
@@ -58,49 +101,157 @@ def change_jwt_token_revoke_status(
     """
 
     try:
-        if token_type == 'access_token':
+        db.execute_db_request(
+            query=f"UPDATE {_get_tokens_table(token_type)} SET revoked = %s::boolean WHERE id = %s;",
+            params=(str(new_value), str(token_id),),
+            fetchmode='nofetch'
+        )
+        db.commit()
+        return True
+
+    except Exception as e:
+        raise RuntimeError(f'Token revoke status changing is failed!\n{e}')
+
+
+def revoke_all_user_tokens(db: Database, user_id: UUID) -> None:
+    """
+    Данный метод отзывает все неотозванные токены доступа и токены обновления пользователя.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param user_id: UUIDv4 идентификатор пользователя, токены которого необходимо отозвать.
+    :return: Метод ничего не возвращает.
+    """
+    for table_name in TOKENS_TABLES.values():
+        db.execute_db_request(
+            query=f"UPDATE {table_name} SET revoked = true WHERE user_id = %s AND revoked = false;",
+            params=(str(user_id),),
+            fetchmode='nofetch'
+        )
+    db.commit()
+
+
+def get_tokens_count(db: Database, user_id: UUID, token_type: str = 'access_token') -> int:
+    db_result = db.execute_db_request(
+        query=f"SELECT count(*) FROM {_get_tokens_table(token_type)} WHERE user_id = %s;",
+        params=(str(user_id),),
+        fetchmode='one'
+    )
+    return db_result[0]
+
+
+async def async_get_token(
+        db: AsyncDatabase,
+        by: str,
+        value: UUID | str,
+        token_type: str = 'access_token'
+) -> DatabaseAccessToken | DatabaseRefreshToken | None:
+    """
+    Асинхронный вариант метода get_token.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param by: Столбец, по которому выполняется поиск ("id").
+    :param value: Искомое значение.
+    :param token_type: Тип токена ("access_token" или "refresh_token")
+    :return: Данные токена, либо None, если токен не найден.
+    """
+    lookup, mapper = _get_token_lookup(token_type)
+    db_result = await lookup.async_fetch_one(db=db, by=by, value=value)
+    return mapper.one(db_result)
+
+
+async def async_get_access_token_by_id(db: AsyncDatabase, token_id: UUID) -> DatabaseAccessToken:
+    return await async_get_token(db=db, by='id', value=token_id, token_type='access_token')
 
-            db.execute_db_request(
-                query="UPDATE public.access_tokens SET revoked = %s::boolean WHERE id = %s;",
-                params=(str(new_value), str(token_id),),
-                fetchmode='nofetch'
-            )
-            db.commit()
 
-        elif token_type == 'refresh_token':
+async def async_get_refresh_token_by_id(db: AsyncDatabase, token_id: UUID) -> DatabaseRefreshToken:
+    return await async_get_token(db=db, by='id', value=token_id, token_type='refresh_token')
 
-            db.execute_db_request(
-                query="UPDATE public.refresh_tokens SET revoked = %s::boolean WHERE id = %s;",
-                params=(str(new_value), str(token_id),),
-                fetchmode='nofetch'
-            )
-            db.commit()
 
-        else:
-            raise ValueError("Unsupported token type")
+async def async_get_tokens_by_ids(
+        db: AsyncDatabase,
+        tokens_ids: list[UUID],
+        token_type: str = 'access_token'
+) -> dict[UUID, DatabaseAccessToken | DatabaseRefreshToken]:
+    """
+    Асинхронный вариант метода get_tokens_by_ids.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param tokens_ids: Список UUIDv4 идентификаторов токенов.
+    :param token_type: Тип токенов ("access_token" или "refresh_token")
+    :return: Словарь данных токенов, ключами которого являются их ID.
+    """
+    lookup, mapper = _get_token_lookup(token_type)
+    db_result = await lookup.async_fetch_many(db=db, by='id', values=tokens_ids)
+    return {token_data.id: token_data for token_data in mapper.many(db_result)}
 
+
+async def async_change_jwt_token_revoke_status(
+        db: AsyncDatabase,
+        token_id: UUID,
+        new_value: bool,
+        token_type: str = 'access_token'
+) -> bool:
+    """
+    Асинхронный вариант метода change_jwt_token_revoke_status.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param token_id: UUIDv4 идентификатор токена, статус отзыва которого необходимо изменить.
+    :param new_value: Желаемое значение статуса отзыва токена (True - токен отозван, False - токен не отозван).
+    :param token_type: Тип токена ("access_token" или "refresh_token")
+    :return: При отсутствии явных ошибок при исполнении запроса функция возвращает булево значение True.
+    :raises RuntimeError: Исключение, возвращаемое в случае, если при попытке изменения статуса отзыва токена произошла
+        ошибка.
+    """
+    try:
+        await db.execute_db_request(
+            query=f"UPDATE {_get_tokens_table(token_type)} SET revoked = %s::boolean WHERE id = %s;",
+            params=(str(new_value), str(token_id),),
+            fetchmode='nofetch'
+        )
+        await db.commit()
         return True
 
     except Exception as e:
         raise RuntimeError(f'Token revoke status changing is failed!\n{e}')
 
 
-def get_tokens_count(db: Database, user_id: UUID, token_type: str = 'access_token') -> int:
-    if token_type == 'access_token':
-        db_result = db.execute_db_request(
-            query="SELECT count(*) FROM public.access_tokens WHERE user_id = %s;",
-            params=(str(user_id),),
-            fetchmode='one'
-        )
-    elif token_type == 'refresh_token':
-        db_result = db.execute_db_request(
-            query="SELECT count(*) FROM public.access_tokens WHERE user_id = %s;",
+async def async_revoke_all_user_tokens(db: AsyncDatabase, user_id: UUID) -> None:
+    """
+    Асинхронный вариант метода revoke_all_user_tokens.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param user_id: UUIDv4 идентификатор пользователя, токены которого необходимо отозвать.
+    :return: Метод ничего не возвращает.
+    """
+    for table_name in TOKENS_TABLES.values():
+        await db.execute_db_request(
+            query=f"UPDATE {table_name} SET revoked = true WHERE user_id = %s AND revoked = false;",
             params=(str(user_id),),
-            fetchmode='one'
+            fetchmode='nofetch'
         )
-    else:
-        raise ValueError("Unexpected mode value!")
+    await db.commit()
+
+
+async def async_get_tokens_count(db: AsyncDatabase, user_id: UUID, token_type: str = 'access_token') -> int:
+    db_result = await db.execute_db_request(
+        query=f"SELECT count(*) FROM {_get_tokens_table(token_type)} WHERE user_id = %s;",
+        params=(str(user_id),),
+        fetchmode='one'
+    )
+    return db_result[0]
 
-    user_tokens_count = db_result[0]
 
-    return user_tokens_count
+def _get_tokens_table(token_type: str) -> str:
+    try:
+        return TOKENS_TABLES[token_type]
+    except KeyError:
+        raise ValueError("Unsupported token type")
+
+
+def _get_token_lookup(token_type: str) -> tuple[EntityLookup, RowMapper]:
+    if token_type == 'access_token':
+        return ACCESS_TOKENS_LOOKUP, ACCESS_TOKENS_MAPPER
+    elif token_type == 'refresh_token':
+        return REFRESH_TOKENS_LOOKUP, REFRESH_TOKENS_MAPPER
+    else:
+        raise ValueError("Unsupported token type")
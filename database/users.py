@@ -1,120 +1,300 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from pydantic import EmailStr
 
-from database.db_baseclass import Database
-from models.users import DatabaseUserDataModel
+from database.db_baseclass import Database, AsyncDatabase
+from database.lookup import EntityLookup
+from database.mapping import RowMapper
+from helpers.password_tools import hash_password
+from models.users import DatabaseUserDataModel, CreatedUserDataBundle
 from data.framework_variables import FrameworkVariables as FrVars
 
 
-def get_user_data_by_email(db: Database, email: str | EmailStr) -> DatabaseUserDataModel | None:
-    db_result = db.execute_db_request(
-        query='SELECT * from public.users WHERE email = %s;',
-        params=(email,),
-        fetchmode='one'
+USERS_LOOKUP = EntityLookup(
+    table='public.users',
+    columns=('id', 'firstname', 'middlename', 'surname', 'email', 'hashed_password', 'is_admin'),
+    key_columns=('id', 'email')
+)
+
+USERS_MAPPER = RowMapper(DatabaseUserDataModel)
+
+
+NONADMIN_USERS_IDS_QUERY = "SELECT id FROM public.users WHERE is_admin = 'false'"
+
+CHANGE_ADMINISTRATOR_PERMISSIONS_QUERY = '''
+    UPDATE public.users
+    SET is_admin = %s
+    WHERE id in %s
+    '''
+
+INSERT_USERS_QUERY = '''
+    INSERT INTO public.users (id, firstname, middlename, surname, email, hashed_password, is_admin)
+    SELECT *, false FROM unnest(%s::uuid[], %s::text[], %s::text[], %s::text[], %s::text[], %s::text[])
+    '''
+
+# Токены доступа и токены обновления ссылаются друг на друга, поэтому они удаляются в одном запросе с пользователями:
+# ограничения внешних ключей проверяются по завершении всего запроса.
+DELETE_USERS_QUERY = '''
+    WITH deleted_access_tokens AS (
+        DELETE FROM public.access_tokens WHERE user_id = ANY(%s::uuid[])
+    ), deleted_refresh_tokens AS (
+        DELETE FROM public.refresh_tokens WHERE user_id = ANY(%s::uuid[])
     )
-    if db_result is not None:
-        user_data = DatabaseUserDataModel(
-            id=db_result[0],
-            firstname=db_result[1],
-            middlename=db_result[2],
-            surname=db_result[3],
-            email=db_result[4],
-            hashed_password=db_result[5],
-            is_admin=db_result[6]
-        )
-        return user_data
-    else:
-        return None
+    DELETE FROM public.users WHERE id = ANY(%s::uuid[])
+    '''
+
+
+def get_user_data(db: Database, by: str, value: UUID | str | EmailStr) -> DatabaseUserDataModel | None:
+    """
+    Данный метод запрашивает данные пользователя по значению уникального столбца таблицы public.users.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param by: Столбец, по которому выполняется поиск ("id" или "email").
+    :param value: Искомое значение.
+    :return: Данные пользователя, либо None, если пользователь не найден.
+    """
+    db_result = USERS_LOOKUP.fetch_one(db=db, by=by, value=value)
+    return USERS_MAPPER.one(db_result)
+
+
+def get_user_data_by_email(db: Database, email: str | EmailStr) -> DatabaseUserDataModel | None:
+    return get_user_data(db=db, by='email', value=email)
+
 
-# TODO: Необходимо оптимизировать методы запроса пользовательских данных и свести их в один,
-#  с опциональным поиском по email или id.
 def get_user_data_by_id(db: Database, user_id: UUID) -> DatabaseUserDataModel | None:
-    db_result = db.execute_db_request(
-        query='SELECT * from public.users WHERE id = %s;',
-        params=(str(user_id),),
-        fetchmode='one'
-    )
-    if db_result is not None:
-        user_data = DatabaseUserDataModel(
-            id=db_result[0],
-            firstname=db_result[1],
-            middlename=db_result[2],
-            surname=db_result[3],
-            email=db_result[4],
-            hashed_password=db_result[5],
-            is_admin=db_result[6]
-        )
-        return user_data
-    else:
-        return None
+    return get_user_data(db=db, by='id', value=user_id)
 
 
-def get_all_administrators_ids(db: Database, mode: str | None = None) -> tuple:
+def get_users_by_ids(db: Database, users_ids: list[UUID]) -> dict[UUID, DatabaseUserDataModel]:
+    """
+    Данный метод запрашивает данные нескольких пользователей одним запросом.
 
-    if mode == 'except_default':
-        sql_query = "SELECT id FROM public.users WHERE is_admin = 'true' AND email != %s "
-        sql_params=(str(FrVars.APP_DEFAULT_USER_EMAIL),)
-    else:
-        sql_query = "SELECT id FROM public.users WHERE is_admin = 'true'"
-        sql_params = None
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param users_ids: Список UUIDv4 идентификаторов пользователей.
+    :return: Словарь данных пользователей, ключами которого являются их ID. Ненайденные пользователи в словаре
+        отсутствуют.
+    """
+    db_result = USERS_LOOKUP.fetch_many(db=db, by='id', values=users_ids)
+    # Валидация EmailStr занимает большую часть времени создания модели, а адреса в БД уже прошли её в приложении,
+    # поэтому при массовом чтении модели создаются без валидации.
+    return _index_users_by_id(USERS_MAPPER.many(db_result, trusted=True))
 
+
+def get_all_administrators_ids(db: Database, mode: str | None = None) -> tuple:
+    sql_query, sql_params = _get_administrators_ids_query(mode)
     db_result = db.execute_db_request(
         query=sql_query,
         params=sql_params,
         fetchmode='all'
     )
-    ids_list = []
-    for row in db_result:
-        ids_list.append(row[0])
-    return tuple(ids_list)
-
-def get_all_nonadmin_users_ids(db: Database) -> tuple:
+    return tuple(row[0] for row in db_result)
 
-    sql_query = "SELECT id FROM public.users WHERE is_admin = 'false'"
 
+def get_all_nonadmin_users_ids(db: Database) -> tuple:
     db_result = db.execute_db_request(
-        query=sql_query,
+        query=NONADMIN_USERS_IDS_QUERY,
         fetchmode='all'
     )
-    ids_list = []
-    for row in db_result:
-        ids_list.append(row[0])
-    return tuple(ids_list)
+    return tuple(row[0] for row in db_result)
 
 
 def bulk_change_administrator_permissions(db: Database, ids: tuple[UUID], is_admin: bool):
     if len(ids) >= 1:
         db.execute_db_request(
-        query='''
-            UPDATE public.users 
-            SET is_admin = %s 
-            WHERE id in %s
-            ''',
-        params=(is_admin,ids),
-        fetchmode='nofetch'
+            query=CHANGE_ADMINISTRATOR_PERMISSIONS_QUERY,
+            params=(is_admin, ids),
+            fetchmode='nofetch'
         )
         db.commit()
-    else:
-        pass
 
 
 def get_users_count(db: Database, mode: str = 'email_distinct') -> int:
-    if mode == 'email_distinct':
-        sql_query = "SELECT DISTINCT email FROM public.users;"
-    elif mode == 'table_count':
-        sql_query = "SELECT count(*) FROM public.users;"
-    else:
-        raise ValueError("Unexpected mode value!")
-
     db_result = db.execute_db_request(
+        query=_get_users_count_query(mode),
+        fetchmode='all'
+    )
+    return _count_users(db_result)
+
+
+def insert_users(db: Database, users_data: list[dict]) -> list[CreatedUserDataBundle]:
+    """
+    Данный метод добавляет пользователей без прав администратора напрямую в таблицу public.users одним запросом.
+    Хэш пароля вычисляется тем же способом, что и в приложении, поэтому добавленные пользователи могут авторизоваться.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param users_data: Список данных пользователей в формате тела запроса POST /v1/users
+        (см. helpers.data_generators.generate_user_data).
+    :return: Список наборов данных добавленных пользователей.
+    """
+    users = [CreatedUserDataBundle(user_id=uuid4(), **user_data) for user_data in users_data]
+    if len(users) >= 1:
+        db.execute_db_request(
+            query=INSERT_USERS_QUERY,
+            params=_get_users_insertion_params(users),
+            fetchmode='nofetch'
+        )
+        db.commit()
+    return users
+
+
+def delete_users(db: Database, users_ids: list[UUID]) -> None:
+    """
+    Данный метод удаляет пользователей и все выпущенные на них токены напрямую из БД одним запросом.
+
+    :param db: Экземпляр класса Database, предоставляющий подключение и методы взаимодействия с БД.
+    :param users_ids: Список UUIDv4 идентификаторов удаляемых пользователей.
+    :return: Метод ничего не возвращает.
+    """
+    if len(users_ids) >= 1:
+        ids = [str(user_id) for user_id in users_ids]
+        db.execute_db_request(
+            query=DELETE_USERS_QUERY,
+            params=(ids, ids, ids),
+            fetchmode='nofetch'
+        )
+        db.commit()
+
+
+async def async_get_user_data(
+        db: AsyncDatabase, by: str, value: UUID | str | EmailStr
+) -> DatabaseUserDataModel | None:
+    """
+    Асинхронный вариант метода get_user_data.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param by: Столбец, по которому выполняется поиск ("id" или "email").
+    :param value: Искомое значение.
+    :return: Данные пользователя, либо None, если пользователь не найден.
+    """
+    db_result = await USERS_LOOKUP.async_fetch_one(db=db, by=by, value=value)
+    return USERS_MAPPER.one(db_result)
+
+
+async def async_get_user_data_by_email(db: AsyncDatabase, email: str | EmailStr) -> DatabaseUserDataModel | None:
+    return await async_get_user_data(db=db, by='email', value=email)
+
+
+async def async_get_user_data_by_id(db: AsyncDatabase, user_id: UUID) -> DatabaseUserDataModel | None:
+    return await async_get_user_data(db=db, by='id', value=user_id)
+
+
+async def async_get_users_by_ids(db: AsyncDatabase, users_ids: list[UUID]) -> dict[UUID, DatabaseUserDataModel]:
+    """
+    Асинхронный вариант метода get_users_by_ids.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param users_ids: Список UUIDv4 идентификаторов пользователей.
+    :return: Словарь данных пользователей, ключами которого являются их ID.
+    """
+    db_result = await USERS_LOOKUP.async_fetch_many(db=db, by='id', values=users_ids)
+    return _index_users_by_id(USERS_MAPPER.many(db_result, trusted=True))
+
+
+async def async_get_all_administrators_ids(db: AsyncDatabase, mode: str | None = None) -> tuple:
+    sql_query, sql_params = _get_administrators_ids_query(mode)
+    db_result = await db.execute_db_request(
         query=sql_query,
+        params=sql_params,
+        fetchmode='all'
+    )
+    return tuple(row[0] for row in db_result)
+
+
+async def async_get_all_nonadmin_users_ids(db: AsyncDatabase) -> tuple:
+    db_result = await db.execute_db_request(
+        query=NONADMIN_USERS_IDS_QUERY,
+        fetchmode='all'
+    )
+    return tuple(row[0] for row in db_result)
+
+
+async def async_bulk_change_administrator_permissions(db: AsyncDatabase, ids: tuple[UUID], is_admin: bool):
+    if len(ids) >= 1:
+        await db.execute_db_request(
+            query=CHANGE_ADMINISTRATOR_PERMISSIONS_QUERY,
+            params=(is_admin, ids),
+            fetchmode='nofetch'
+        )
+        await db.commit()
+
+
+async def async_get_users_count(db: AsyncDatabase, mode: str = 'email_distinct') -> int:
+    db_result = await db.execute_db_request(
+        query=_get_users_count_query(mode),
         fetchmode='all'
     )
+    return _count_users(db_result)
+
+
+async def async_insert_users(db: AsyncDatabase, users_data: list[dict]) -> list[CreatedUserDataBundle]:
+    """
+    Асинхронный вариант метода insert_users.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param users_data: Список данных пользователей в формате тела запроса POST /v1/users.
+    :return: Список наборов данных добавленных пользователей.
+    """
+    users = [CreatedUserDataBundle(user_id=uuid4(), **user_data) for user_data in users_data]
+    if len(users) >= 1:
+        await db.execute_db_request(
+            query=INSERT_USERS_QUERY,
+            params=_get_users_insertion_params(users),
+            fetchmode='nofetch'
+        )
+        await db.commit()
+    return users
+
+
+async def async_delete_users(db: AsyncDatabase, users_ids: list[UUID]) -> None:
+    """
+    Асинхронный вариант метода delete_users.
+
+    :param db: Экземпляр класса AsyncDatabase.
+    :param users_ids: Список UUIDv4 идентификаторов удаляемых пользователей.
+    :return: Метод ничего не возвращает.
+    """
+    if len(users_ids) >= 1:
+        ids = [str(user_id) for user_id in users_ids]
+        await db.execute_db_request(
+            query=DELETE_USERS_QUERY,
+            params=(ids, ids, ids),
+            fetchmode='nofetch'
+        )
+        await db.commit()
+
 
+def _index_users_by_id(users_data: list[DatabaseUserDataModel]) -> dict[UUID, DatabaseUserDataModel]:
+    return {user_data.id: user_data for user_data in users_data}
+
+
+def _get_administrators_ids_query(mode: str | None) -> tuple[str, tuple | None]:
+    if mode == 'except_default':
+        return (
+            "SELECT id FROM public.users WHERE is_admin = 'true' AND email != %s ",
+            (str(FrVars.APP_DEFAULT_USER_EMAIL),)
+        )
+    return "SELECT id FROM public.users WHERE is_admin = 'true'", None
+
+
+def _get_users_count_query(mode: str) -> str:
     if mode == 'email_distinct':
-        users_count = len(db_result)
+        return "SELECT count(DISTINCT email) FROM public.users;"
+    elif mode == 'table_count':
+        return "SELECT count(*) FROM public.users;"
     else:
-        users_count = int(db_result[0][0])
+        raise ValueError("Unexpected mode value!")
+
 
-    return users_count
\ No newline at end of file
+def _count_users(db_result) -> int:
+    return int(db_result[0][0])
+
+
+def _get_users_insertion_params(users: list[CreatedUserDataBundle]) -> tuple[list, ...]:
+    return (
+        [str(user.user_id) for user in users],
+        [user.firstname for user in users],
+        [user.middlename for user in users],
+        [user.surname for user in users],
+        [str(user.email) for user in users],
+        [hash_password(user.password) for user in users]
+    )
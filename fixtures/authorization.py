@@ -1,25 +1,133 @@
 import allure
 import pytest
-import requests
+import pytest_asyncio
 
 from data.framework_variables import FrameworkVariables as FrVars
+from helpers.administrator_session import AdministratorSession, ADMINISTRATOR_SESSION_CACHE_FILE_NAME
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
+from helpers.workers import get_worker_id
 from models.authorization import AuthSuccessfulResponse
 
+OWN_ADMINISTRATOR_SESSION_DIRECTIVE = "own administrator session should be used"
+''' Директива indirect-параметризации, отключающая использование общей сессии администратора '''
+
+
+@pytest.fixture(scope="session")
+@allure.title("Общая сессия стандартного администратора")
+def administrator_session(http_client, shared_run_directory, database_snapshot) -> AdministratorSession:
+    """
+    Данная фикстура предоставляет сессию стандартного администратора приложения, общую для всего запуска (а при
+    параллельном запуске - для всех процессов-исполнителей). Авторизация выполняется при первом обращении к токену,
+    а обновление пары токенов - незадолго до истечения времени жизни токена доступа.
+
+    При запуске без pytest-xdist выход из учётной записи выполняется на стадии уборки фикстуры, при параллельном
+    запуске - управляющим процессом после завершения всех процессов-исполнителей.
+
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
+    :param shared_run_directory: Ссылка на фикстуру "shared_run_directory".
+    :param database_snapshot: Ссылка на фикстуру "database_snapshot".
+        После восстановления базы данных из снимка токены администратора перестают существовать и сбрасываются.
+    :return: Экземпляр класса AdministratorSession.
+    """
+    if shared_run_directory is None:
+        session = AdministratorSession(http_client)
+    else:
+        session = AdministratorSession(http_client, shared_run_directory / ADMINISTRATOR_SESSION_CACHE_FILE_NAME)
+    if database_snapshot is not None:
+        database_snapshot.add_restore_callback(session.reset)
+
+    yield session
+
+    if get_worker_id() == "master":
+        with allure.step("Выход из учётной записи"):
+            session.logout()
+
 
 @pytest.fixture(scope="class")
 @allure.title("Авторизация стандартного администратора")
-def authorize_administrator(variable_manager) -> AuthSuccessfulResponse:
+def authorize_administrator(
+        http_client, administrator_session, request
+) -> AuthSuccessfulResponse | AdministratorSession:
     """
-    Данная фикстура авторизует стандартного администратора приложения.
+    Данная фикстура предоставляет токены стандартного администратора приложения из общей сессии администратора.
+
+    Тесты, которым требуется собственная сессия администратора (отдельная авторизация и выход из учётной записи),
+    могут отказаться от общей сессии путём параметризации фикстуры следующим образом::
 
-    :param variable_manager: Ссылка на фикстуру "variable_manager".
-    :return AuthSuccessfulResponse: (yield) Сериализованный ответ на запрос авторизации.
+        @pytest.mark.parametrize("authorize_administrator", ["own administrator session should be used"], indirect=True)
+
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
+    :param administrator_session: Ссылка на фикстуру "administrator_session".
+    :param request: Ссылка на объект вызова фикстуры, содержащий директиву использования собственной сессии.
+    :return: (yield) Общая сессия администратора, либо сериализованный ответ на запрос авторизации.
     """
+    if getattr(request, 'param', None) != OWN_ADMINISTRATOR_SESSION_DIRECTIVE:
+        yield administrator_session
+        return
+
+    with allure.step("Авторизация в системе"):
+        res = http_client.post(
+            url=FrVars.APP_HOST + "/v1/authorize",
+            json={
+                "email": FrVars.APP_DEFAULT_USER_EMAIL,
+                "password": FrVars.APP_DEFAULT_USER_PASSWORD
+            }
+        )
+        attach_request_data_to_report(res)
+
+        make_simple_assertion(
+            expected_value=200,
+            actual_value=res.status_code,
+            assertion_name="Код ответа на запрос фикстуры"
+        )
+
+        serialized_response = validate_response(
+            model=AuthSuccessfulResponse,
+            response=res
+        )
+
+    yield serialized_response
+
+    with allure.step("Выход из учётной записи"):
+        res = http_client.delete(
+            url=FrVars.APP_HOST + "/v1/logout",
+            headers={
+                "Access-Token": serialized_response.access_token
+            }
+        )
+        attach_request_data_to_report(res)
+        make_simple_assertion(
+            expected_value=200,
+            actual_value=res.status_code,
+            assertion_name="Код ответа на запрос фикстуры"
+        )
+
+@pytest_asyncio.fixture(scope="class", loop_scope="session")
+@allure.title("Авторизация стандартного администратора (асинхронная)")
+async def async_authorize_administrator(
+        async_http_client, administrator_session, request
+) -> AuthSuccessfulResponse | AdministratorSession:
+    """
+    Данная фикстура является асинхронным вариантом фикстуры "authorize_administrator" и используется асинхронными
+    фикстурами, которым требуются права администратора. Отказ от общей сессии администратора выполняется так же,
+    как и для фикстуры "authorize_administrator".
+
+    :param async_http_client: Ссылка на фикстуру "async_http_client".
+        Используется для отправки запросов к приложению.
+    :param administrator_session: Ссылка на фикстуру "administrator_session".
+    :param request: Ссылка на объект вызова фикстуры, содержащий директиву использования собственной сессии.
+    :return: (yield) Общая сессия администратора, либо сериализованный ответ на запрос авторизации.
+    """
+    if getattr(request, 'param', None) != OWN_ADMINISTRATOR_SESSION_DIRECTIVE:
+        yield administrator_session
+        return
+
     with allure.step("Авторизация в системе"):
-        res = requests.post(
+        res = await async_http_client.post(
             url=FrVars.APP_HOST + "/v1/authorize",
             json={
                 "email": FrVars.APP_DEFAULT_USER_EMAIL,
@@ -34,15 +142,15 @@ def authorize_administrator(variable_manager) -> AuthSuccessfulResponse:
             assertion_name="Код ответа на запрос фикстуры"
         )
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=AuthSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
     yield serialized_response
 
     with allure.step("Выход из учётной записи"):
-        res = requests.delete(
+        res = await async_http_client.delete(
             url=FrVars.APP_HOST + "/v1/logout",
             headers={
                 "Access-Token": serialized_response.access_token
@@ -57,7 +165,7 @@ def authorize_administrator(variable_manager) -> AuthSuccessfulResponse:
 
 @pytest.fixture(scope="function")
 @allure.title("Выход пользователя из учётной записи")
-def logout(variable_manager) -> None:
+def logout(http_client, variable_manager) -> None:
     """
     Данная фикстура обеспечивает вызов эндпоинта /logout для тестовых функций, которые завершились корректной
     авторизацией и требуют погашения выданных токенов.
@@ -66,6 +174,8 @@ def logout(variable_manager) -> None:
     logout требуется, чтобы перед её вызовом в variable_manager была записана переменная 'access_token' с токеном,
     который необходимо погасить.
 
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param variable_manager: Ссылка на фикстуру "variable_manager"
     :return: Данная фикстура ничего не возвращает.
     """
@@ -80,7 +190,7 @@ def logout(variable_manager) -> None:
 
     with allure.step("Выход из учётной записи"):
 
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + "/v1/logout",
             headers={
                 "Access-Token": access_token
@@ -1,20 +1,23 @@
+import asyncio
 import random
 
 import allure
 import pytest
-import requests
+import pytest_asyncio
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
+from database.books import insert_books, delete_books
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion
-from helpers.validate_response import validate_response_model
+from helpers.data_generators import generate_book_data
+from helpers.validate_response import validate_response
 from models.books import DeleteBookSuccessfulResponse, CreateBookSuccessfulResponse, CreatedBookDataBundle
 
 
 @pytest.fixture(scope="function")
 @allure.title("Создание тестовой книги")
-def create_book(database, authorize_administrator, request) -> CreatedBookDataBundle:
+def create_book(http_client, database, authorize_administrator, request) -> CreatedBookDataBundle:
     """
     Данная фикстура обеспечивает создание книги и её удаление после завершения тестирования.
 
@@ -22,6 +25,8 @@ def create_book(database, authorize_administrator, request) -> CreatedBookDataBu
 
         @pytest.mark.parametrize("create_book", ["fixture book deletion should be skipped"], indirect=True)
 
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param authorize_administrator: Ссылка на фикстуру "authorize_administrator".
         Используется данной фикстурой, так как создание книги требует прав администратора.
     :param database: Ссылка на фикстуру "database".
@@ -45,7 +50,7 @@ def create_book(database, authorize_administrator, request) -> CreatedBookDataBu
 
     # Отправка запроса на создание книги
     with allure.step("Создание книги"):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/books",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -64,9 +69,9 @@ def create_book(database, authorize_administrator, request) -> CreatedBookDataBu
             assertion_name="Код ответа на запрос создания книги в фикстуре"
         )
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=CreateBookSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
     # Сериализация данных созданной книги в набор
@@ -97,7 +102,7 @@ def create_book(database, authorize_administrator, request) -> CreatedBookDataBu
 
         # Отправка запроса на удаление книги
         with allure.step("Удаление книги"):
-            res = requests.delete(
+            res = http_client.delete(
                 url=FrVars.APP_HOST + f"/v1/books/{created_book_data.book_id}",
                 headers={
                     "Access-Token": authorize_administrator.access_token
@@ -111,15 +116,15 @@ def create_book(database, authorize_administrator, request) -> CreatedBookDataBu
                 assertion_name="Код ответа на запрос удаления книги в фикстуре"
             )
 
-            validate_response_model(
+            validate_response(
                 model=DeleteBookSuccessfulResponse,
-                data=res.json()
+                response=res
             )
 
 
 @pytest.fixture(scope="function")
 @allure.title("Удаление тестовой книги")
-def delete_book(variable_manager, authorize_administrator) -> None:
+def delete_book(http_client, variable_manager, authorize_administrator) -> None:
     """
     Данная фикстура обеспечивает вызов эндпоинта DELETE /books/{book_id} для тестовых функций, которые завершились
     корректным созданием книги и требуют её удаления.
@@ -128,6 +133,8 @@ def delete_book(variable_manager, authorize_administrator) -> None:
     delete_book требуется, чтобы перед её вызовом в variable_manager была записана переменная 'book_id' c ID,
     книги, которую необходимо удалить.
 
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param authorize_administrator: Ссылка на фикстуру "authorize_administrator".
         Используется данной фикстурой, так как удаление книги требует наличия прав администратора.
     :param variable_manager: Ссылка на фикстуру "variable_manager".
@@ -144,7 +151,7 @@ def delete_book(variable_manager, authorize_administrator) -> None:
 
     # Отправка запроса на удаление книги
     with allure.step("Удаление книги"):
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/books/{book_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -158,10 +165,152 @@ def delete_book(variable_manager, authorize_administrator) -> None:
             assertion_name="Код ответа на запрос удаления книги в фикстуре"
         )
 
-        validate_response_model(
+        validate_response(
             model=DeleteBookSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
     # Очистка переменной book_id из менеджера переменных
-    variable_manager.unset('book_id')
\ No newline at end of file
+    variable_manager.unset('book_id')
+
+
+async def async_delete_books(async_http_client, access_token: str, books_ids: list) -> None:
+    """
+    Данный метод одновременно удаляет переданные книги.
+
+    Запросы отправляются одновременно, а их результаты проверяются и прикрепляются к отчёту последовательно,
+    чтобы шаги отчёта не перемешивались.
+
+    :param async_http_client: Экземпляр класса AsyncHttpClient.
+    :param access_token: Токен доступа администратора.
+    :param books_ids: Список ID удаляемых книг.
+    :return: Метод ничего не возвращает.
+    """
+    responses = await asyncio.gather(*(
+        async_http_client.delete(
+            url=FrVars.APP_HOST + f"/v1/books/{book_id}",
+            headers={
+                "Access-Token": access_token
+            }
+        ) for book_id in books_ids
+    ))
+    for res in responses:
+        with allure.step("Удаление книги"):
+            attach_request_data_to_report(res)
+
+            make_simple_assertion(
+                expected_value=200,
+                actual_value=res.status_code,
+                assertion_name="Код ответа на запрос удаления книги в фикстуре"
+            )
+
+            validate_response(
+                model=DeleteBookSuccessfulResponse,
+                response=res
+            )
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+@allure.title("Создание тестовых книг (асинхронное)")
+async def async_create_books(async_http_client, async_authorize_administrator, request) -> list[CreatedBookDataBundle]:
+    """
+    Данная фикстура является асинхронным вариантом фикстуры "create_book": она одновременно создаёт несколько книг
+    и одновременно удаляет их после завершения тестирования.
+
+    Количество создаваемых книг (по умолчанию - две) может быть изменено путём параметризации фикстуры
+    следующим образом::
+
+        @pytest.mark.parametrize("async_create_books", [5], indirect=True)
+
+    :param async_http_client: Ссылка на фикстуру "async_http_client".
+        Используется для отправки запросов к приложению.
+    :param async_authorize_administrator: Ссылка на фикстуру "async_authorize_administrator".
+        Используется данной фикстурой, так как создание книг требует прав администратора.
+    :param request: Ссылка на объект вызова фикстуры, содержащий количество создаваемых книг.
+    :return: Список наборов данных созданных книг.
+    """
+    books_count = getattr(request, 'param', None) or 2
+    books_data = [generate_book_data() for _ in range(books_count)]
+
+    # Отправка запросов на создание книг
+    responses = await asyncio.gather(*(
+        async_http_client.post(
+            url=FrVars.APP_HOST + "/v1/books",
+            headers={
+                "Access-Token": async_authorize_administrator.access_token
+            },
+            json=book_data
+        ) for book_data in books_data
+    ), return_exceptions=True)
+
+    # Идентификаторы всех созданных книг собираются до проверки ответов: при ошибке в любом из ответов созданные
+    # книги удаляются сразу, так как стадия очистки не будет вызвана.
+    created_books_ids = [
+        res.json()["book_id"] for res in responses
+        if not isinstance(res, BaseException) and res.status_code == 200
+    ]
+    created_books_data = []
+    try:
+        for book_data, res in zip(books_data, responses):
+            if isinstance(res, BaseException):
+                raise res
+            with allure.step("Создание книги"):
+                attach_request_data_to_report(res)
+
+                make_simple_assertion(
+                    expected_value=200,
+                    actual_value=res.status_code,
+                    assertion_name="Код ответа на запрос создания книги в фикстуре"
+                )
+
+                serialized_response = validate_response(
+                    model=CreateBookSuccessfulResponse,
+                    response=res
+                )
+
+            created_books_data.append(CreatedBookDataBundle(book_id=serialized_response.book_id, **book_data))
+    except Exception:
+        await async_delete_books(
+            async_http_client=async_http_client,
+            access_token=async_authorize_administrator.access_token,
+            books_ids=created_books_ids
+        )
+        raise
+
+    # Предоставление наборов для использования в тестах
+    yield created_books_data
+
+    # Стадия очистки
+    await async_delete_books(
+        async_http_client=async_http_client,
+        access_token=async_authorize_administrator.access_token,
+        books_ids=[book.book_id for book in created_books_data]
+    )
+
+
+@pytest.fixture(scope="function")
+@allure.title("Добавление тестовых книг в БД")
+def seed_books(database, request) -> list[CreatedBookDataBundle]:
+    """
+    Данная фикстура добавляет книги напрямую в БД одним запросом и удаляет их после завершения тестирования.
+    Фикстура предназначена для тестов, в которых книги являются лишь предусловием, и не подходит для тестов,
+    проверяющих создание книги.
+
+    Количество добавляемых книг (по умолчанию - одна) может быть изменено путём параметризации фикстуры следующим
+    образом::
+
+        @pytest.mark.parametrize("seed_books", [100], indirect=True)
+
+    :param database: Ссылка на фикстуру "database".
+    :param request: Ссылка на объект вызова фикстуры, содержащий количество добавляемых книг.
+    :return: Список наборов данных добавленных книг.
+    """
+    books_count = getattr(request, 'param', None) or 1
+
+    with allure.step(f"Добавление книг в БД ({books_count})"):
+        seeded_books = insert_books(db=database, books_data=[generate_book_data() for _ in range(books_count)])
+
+    yield seeded_books
+
+    with allure.step(f"Удаление книг из БД ({books_count})"):
+        delete_books(db=database, books_ids=[book.book_id for book in seeded_books])
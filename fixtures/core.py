@@ -1,17 +1,196 @@
+import json
+import warnings
+from pathlib import Path
 from platform import python_version
 
 import allure
 import pytest
+import pytest_asyncio
 import platform
 
-from database.db_baseclass import Database
+from database.db_baseclass import Database, AsyncDatabase
+from database.snapshot import DatabaseSnapshot
+from helpers.allure_report import attach_buffered_request_data_to_report, request_data_buffer
+from helpers.allure_writer import install_background_allure_writer
+from helpers.administrator_session import AdministratorSession, ADMINISTRATOR_SESSION_CACHE_FILE_NAME
+from helpers.async_http_client import AsyncHttpClient
+from helpers.http_client import HttpClient
+from helpers.latency_tracker import latency_tracker, make_worker_samples_path, LatencyTracker
+from helpers.performance_trends import (
+    PerformanceTrendStore, collect_run_metrics, find_regressions, report_regressions_to_allure
+)
+from helpers.phase_timing import phase_timing_tracker, make_worker_phase_timing_path, PhaseTimingTracker, TEST_PHASES
+from helpers.query_tracker import query_tracker, make_worker_query_stats_path, QueryTracker, RepeatedQueriesWarning
 from helpers.varirable_manager import VariableManager
+from helpers.workers import CrossWorkerLock, get_worker_id
 from data.framework_variables import FrameworkVariables as FrVars
 
 
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "exclusive: тест изменяет или проверяет глобальное состояние приложения и при параллельном запуске "
+        "(pytest-xdist) не должен исполняться одновременно с другими тестами"
+    )
+    # Вызов после pytest_configure плагина allure-pytest (trylast), который регистрирует штатную запись результатов.
+    if int(FrVars.ALLURE_WRITER_QUEUE_SIZE) > 0:
+        install_background_allure_writer(config, int(FrVars.ALLURE_WRITER_QUEUE_SIZE))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # В режиме ALLURE_ATTACHMENTS_MODE=on_failure данные запросов и ответов теста прикрепляются к отчёту только при
+    # неудаче любой из стадий теста (подготовки, исполнения или уборки), а по завершении теста буфер очищается.
+    outcome = yield
+    report = outcome.get_result()
+    phase_timing_tracker.set_phase_outcome(item.nodeid, report.when, report.outcome)
+    if report.failed:
+        attach_buffered_request_data_to_report()
+    if report.when == "teardown":
+        request_data_buffer.clear()
+        report_test_phase_timing(item)
+
+
+def measure_test_phase(item, phase: str):
+    phase_timing_tracker.start_phase()
+    yield
+    phase_timing_tracker.finish_phase(item.nodeid, phase)
+
+
+# Замеры стадий теста оборачивают остальные обёртки (tryfirst), чтобы во время фреймворка входила и работа
+# плагинов (например, allure-pytest).
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_setup(item):
+    yield from measure_test_phase(item, "setup")
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_call(item):
+    yield from measure_test_phase(item, "call")
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_teardown(item):
+    yield from measure_test_phase(item, "teardown")
+
+
+def report_test_phase_timing(item) -> None:
+    """
+    Данный метод прикрепляет к отчёту время стадий теста (подготовки, исполнения и уборки) с разделением на ожидание
+    ответов приложения, ожидание БД и время фреймворка, а также добавляет тесту метки с общим временем каждой стадии.
+
+    :param item: Тест.
+    :return: Метод ничего не возвращает.
+    """
+    test_timing = phase_timing_tracker.get_test_timing(item.nodeid)
+    if not test_timing:
+        return
+    for phase in TEST_PHASES:
+        if phase in test_timing:
+            allure.dynamic.label(f"{phase}_ms", str(test_timing[phase]["total_ms"]))
+    allure.attach(
+        json.dumps(test_timing, indent=3, ensure_ascii=False),
+        "Время стадий теста",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+def pytest_sessionfinish(session):
+    # При параллельном запуске каждый процесс-исполнитель записывает свои замеры времени ответа в отдельный файл,
+    # а общую сводку за запуск формирует управляющий процесс после завершения всех исполнителей.
+    if session.config.pluginmanager.hasplugin("dsession"):
+        run_latency_tracker = LatencyTracker()
+        run_latency_tracker.merge_samples_files(make_worker_samples_path(FrVars.LATENCY_SUMMARY_PATH, "*"))
+        run_latency_tracker.write_summary(FrVars.LATENCY_SUMMARY_PATH)
+
+        run_query_tracker = QueryTracker()
+        run_query_tracker.merge_stats_files(make_worker_query_stats_path(FrVars.DB_QUERY_SUMMARY_PATH, "*"))
+        run_query_tracker.write_summary(FrVars.DB_QUERY_SUMMARY_PATH, int(FrVars.DB_QUERY_SUMMARY_TOP_N))
+
+        run_phase_timing_tracker = PhaseTimingTracker(run_latency_tracker, run_query_tracker)
+        run_phase_timing_tracker.merge_stats_files(make_worker_phase_timing_path(FrVars.PHASE_TIMING_SUMMARY_PATH, "*"))
+        phase_timing_summary = run_phase_timing_tracker.write_summary(
+            FrVars.PHASE_TIMING_SUMMARY_PATH, int(FrVars.PHASE_TIMING_SUMMARY_TOP_N)
+        )
+        if run_phase_timing_tracker.tests:
+            record_performance_trends(run_latency_tracker, run_query_tracker, phase_timing_summary)
+
+        # Общая сессия администратора используется всеми процессами-исполнителями, поэтому выход из учётной записи
+        # выполняется только после завершения их всех. Процессы-исполнители используют в качестве общей директории
+        # базовую временную директорию управляющего процесса (см. фикстуру "shared_run_directory").
+        cache_file_path = session.config._tmp_path_factory.getbasetemp() / ADMINISTRATOR_SESSION_CACHE_FILE_NAME
+        if cache_file_path.exists():
+            with HttpClient(pool_size=1) as client:
+                AdministratorSession(client, cache_file_path).logout()
+    elif phase_timing_tracker.tests:
+        # Замеры стадий тестов записываются по завершении сессии, а не фикстурой сессии, так как фикстуры сессии
+        # завершаются внутри стадии уборки последнего теста, замер которой к этому моменту ещё не окончен.
+        worker_id = get_worker_id()
+        if worker_id == "master":
+            phase_timing_summary = phase_timing_tracker.write_summary(
+                FrVars.PHASE_TIMING_SUMMARY_PATH, int(FrVars.PHASE_TIMING_SUMMARY_TOP_N)
+            )
+            record_performance_trends(latency_tracker, query_tracker, phase_timing_summary)
+        else:
+            phase_timing_tracker.write_stats(make_worker_phase_timing_path(FrVars.PHASE_TIMING_SUMMARY_PATH, worker_id))
+
+
+def record_performance_trends(
+        run_latency_tracker: LatencyTracker,
+        run_query_tracker: QueryTracker,
+        phase_timing_summary: dict
+) -> None:
+    """
+    Данный метод сохраняет показатели производительности запуска (перцентили времени ответа эндпоинтов, время
+    исполнения и количество запросов к БД каждого пройденного теста) в хранилище PERFORMANCE_TRENDS_DB_PATH,
+    сравнивает их с базовой линией из последних PERFORMANCE_BASELINE_RUNS запусков против того же приложения
+    (APP_HOST) и добавляет результат сравнения в отчёт Allure. Если ни один показатель ещё не встречался в
+    PERFORMANCE_BASELINE_MIN_RUNS предыдущих запусках, то результат сравнения в отчёт не добавляется.
+
+    :param run_latency_tracker: Замеры времени ответа эндпоинтов за запуск.
+    :param run_query_tracker: Статистика запросов к БД за запуск.
+    :param phase_timing_summary: Сводка времени стадий тестов за запуск.
+    :return: Метод ничего не возвращает.
+    """
+    baseline_runs_count = int(FrVars.PERFORMANCE_BASELINE_RUNS)
+    if baseline_runs_count < 1:
+        return
+    metrics = collect_run_metrics(
+        latency_summary=run_latency_tracker.summary(),
+        phase_timing_summary=phase_timing_summary,
+        tests_queries_count=run_query_tracker.tests_queries_count
+    )
+    trend_store = PerformanceTrendStore(FrVars.PERFORMANCE_TRENDS_DB_PATH)
+    try:
+        run_id = trend_store.record_run(metrics, app_host=FrVars.APP_HOST)
+        baseline = trend_store.get_baseline(run_id, baseline_runs_count, app_host=FrVars.APP_HOST)
+    finally:
+        trend_store.close()
+    compared_metrics_count, regressions = find_regressions(
+        metrics=metrics,
+        baseline=baseline,
+        min_baseline_runs=int(FrVars.PERFORMANCE_BASELINE_MIN_RUNS),
+        mad_multiplier=float(FrVars.PERFORMANCE_REGRESSION_MAD_MULTIPLIER),
+        min_relative_increase=float(FrVars.PERFORMANCE_REGRESSION_MIN_INCREASE_PERCENT) / 100
+    )
+    if not compared_metrics_count:
+        return
+    report_regressions_to_allure(regressions, compared_metrics_count, baseline_runs_count)
+    for regression in regressions:
+        warnings.warn(
+            f"Performance regression: {regression.kind} {regression.name} {regression.metric} = {regression.value} "
+            f"(baseline median {regression.baseline_median}, threshold {regression.threshold})"
+        )
+
+
 @pytest.fixture(scope="session", autouse=True)
 @allure.title("Запись информации об окружении в отчёт")
 def report_environment_properties_generation():
+    # При параллельном запуске информация об окружении записывается только одним процессом-исполнителем.
+    if get_worker_id() not in ("master", "gw0"):
+        return
+
     f = open("allure-results/environment.properties", "a", encoding='utf-8')
     current_platform = platform.system()
 
@@ -24,11 +203,67 @@ def report_environment_properties_generation():
     f.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+@allure.title("Сводка времени ответа эндпоинтов")
+def report_endpoints_latency_summary():
+    """
+    Данная фикстура на стадии уборки формирует сводку времени ответа приложения (количество запросов, среднее значение,
+    перцентили p50/p95/p99 и максимальное значение) по каждому методу и шаблону маршрута за весь запуск.
+    Сводка записывается в файл, указанный в переменной LATENCY_SUMMARY_PATH, и прикрепляется к отчёту.
+
+    При параллельном запуске к отчёту прикрепляется сводка процесса-исполнителя, а его замеры записываются в отдельный
+    файл, из которых управляющий процесс формирует общую сводку за запуск.
+
+    :return: Данная фикстура ничего не возвращает.
+    """
+    yield
+    worker_id = get_worker_id()
+    if worker_id == "master":
+        summary = latency_tracker.write_summary(FrVars.LATENCY_SUMMARY_PATH)
+    else:
+        latency_tracker.write_samples(make_worker_samples_path(FrVars.LATENCY_SUMMARY_PATH, worker_id))
+        summary = latency_tracker.summary()
+    allure.attach(
+        json.dumps(summary, indent=3, ensure_ascii=False),
+        "Сводка времени ответа эндпоинтов",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+@allure.title("Сводка запросов к базе данных")
+def report_database_queries_summary():
+    """
+    Данная фикстура на стадии уборки формирует сводку запросов к БД за весь запуск: самые затратные (по суммарному
+    времени исполнения) и самые частые запросы (по DB_QUERY_SUMMARY_TOP_N в каждом списке), а также тесты, отмеченные
+    как содержащие N+1 запросов. Сводка записывается в файл, указанный в переменной DB_QUERY_SUMMARY_PATH,
+    и прикрепляется к отчёту.
+
+    При параллельном запуске сводка формируется так же, как и сводка времени ответа эндпоинтов.
+
+    :return: Данная фикстура ничего не возвращает.
+    """
+    yield
+    worker_id = get_worker_id()
+    top_n = int(FrVars.DB_QUERY_SUMMARY_TOP_N)
+    if worker_id == "master":
+        summary = query_tracker.write_summary(FrVars.DB_QUERY_SUMMARY_PATH, top_n)
+    else:
+        query_tracker.write_stats(make_worker_query_stats_path(FrVars.DB_QUERY_SUMMARY_PATH, worker_id))
+        summary = query_tracker.summary(top_n)
+    allure.attach(
+        json.dumps(summary, indent=3, ensure_ascii=False),
+        "Сводка запросов к базе данных",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
 @pytest.fixture(scope="session", autouse=True)
 @allure.title("Подключение к базе данных")
 def database() -> Database:
     """
-    Данная фикстура предоставляет единое подключение к базе данных.
+    Данная фикстура предоставляет единый пул подключений к базе данных (DB_POOL_MIN_SIZE - DB_POOL_MAX_SIZE
+    подключений).
 
     :return: Экземпляр класса Database.
     """
@@ -37,12 +272,221 @@ def database() -> Database:
     yield db
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+@allure.title("Асинхронное подключение к базе данных")
+async def async_database() -> AsyncDatabase:
+    """
+    Данная фикстура предоставляет пул асинхронных подключений к базе данных для асинхронных фикстур и тестов.
+
+    :return: Экземпляр класса AsyncDatabase.
+    """
+    db = AsyncDatabase()
+    await db.connect_to_database()
+    yield db
+    await db.close()
+
+
+def is_last_module_of_domain(request) -> bool:
+    """
+    Данный метод проверяет, является ли текущий тестовый модуль последним исполняемым модулем своего функционального
+    домена (директории tests/<домен>).
+
+    :param request: Ссылка на объект вызова фикстуры уровня модуля.
+    :return: True, если после текущего модуля исполняются тесты другого домена либо тестов больше нет, иначе - False.
+    """
+    module_path = request.node.path
+    items = request.session.items
+    last_index = max(index for index, item in enumerate(items) if item.path == module_path)
+    return last_index + 1 == len(items) or items[last_index + 1].path.parent != module_path.parent
+
+
+@pytest.fixture(scope="session", autouse=True)
+@allure.title("Снимок базы данных")
+def database_snapshot(database) -> DatabaseSnapshot | None:
+    """
+    Данная фикстура, если переменная DB_SNAPSHOT_RESTORE_SCOPE имеет значение "module" или "domain", создаёт снимок
+    базы данных приложения в начале сессии и удаляет его после её завершения.
+
+    Если снимок уже существует (предыдущий запуск был аварийно прерван и не удалил его), то база данных сначала
+    восстанавливается из этого снимка.
+
+    Восстановление закрывает все подключения к базе данных приложения, поэтому при параллельном запуске (pytest-xdist)
+    снимок не используется.
+
+    :param database: Ссылка на фикстуру "database".
+    :return: Экземпляр класса DatabaseSnapshot, либо None, если снимок не используется.
+    """
+    if FrVars.DB_SNAPSHOT_RESTORE_SCOPE not in ("module", "domain"):
+        yield None
+        return
+    if get_worker_id() != "master":
+        allure.attach(
+            "Восстановление базы данных из снимка несовместимо с параллельным запуском",
+            "Снимок базы данных не используется"
+        )
+        yield None
+        return
+
+    snapshot = DatabaseSnapshot(db=database)
+    if snapshot.exists():
+        with allure.step("Восстановление базы данных из снимка, оставшегося от прерванного запуска"):
+            snapshot.restore()
+    else:
+        with allure.step("Создание снимка базы данных"):
+            snapshot.create()
+
+    yield snapshot
+
+    with allure.step("Удаление снимка базы данных"):
+        snapshot.drop()
+
+
+@pytest.fixture(scope="module", autouse=True)
+@allure.title("Восстановление базы данных из снимка")
+def database_snapshot_restore(request, database_snapshot) -> None:
+    """
+    Данная фикстура восстанавливает базу данных приложения из снимка после каждого тестового модуля или после
+    последнего модуля каждого функционального домена (в зависимости от значения переменной DB_SNAPSHOT_RESTORE_SCOPE).
+
+    :param request: Ссылка на объект вызова фикстуры.
+    :param database_snapshot: Ссылка на фикстуру "database_snapshot".
+    :return: Данная фикстура ничего не возвращает.
+    """
+    yield
+    if database_snapshot is None:
+        return
+    if FrVars.DB_SNAPSHOT_RESTORE_SCOPE == "domain" and not is_last_module_of_domain(request):
+        return
+    with allure.step("Восстановление базы данных из снимка"):
+        database_snapshot.restore()
+
+
+@pytest.fixture(scope="session")
+@allure.title("HTTP-клиент")
+def http_client() -> HttpClient:
+    """
+    Данная фикстура предоставляет единый HTTP-клиент с пулом keep-alive соединений с сервером приложения.
+    Перед передачей клиента тестам часть соединений пула открывается заранее.
+
+    :return: Экземпляр класса HttpClient.
+    """
+    client = HttpClient()
+    client.warm_up()
+    yield client
+    client.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+@allure.title("Асинхронный HTTP-клиент")
+async def async_http_client() -> AsyncHttpClient:
+    """
+    Данная фикстура предоставляет единый асинхронный HTTP-клиент для асинхронных фикстур, отправляющих независимые
+    запросы одновременно.
+
+    :return: Экземпляр класса AsyncHttpClient.
+    """
+    client = AsyncHttpClient()
+    await client.warm_up()
+    yield client
+    await client.aclose()
+
+
 @pytest.fixture(scope="session")
-@allure.title("Менеджер переменных сессии")
-def variable_manager(database) -> VariableManager:
+def shared_run_directory(tmp_path_factory) -> Path | None:
+    """
+    Данная фикстура предоставляет директорию, общую для всех процессов-исполнителей pytest-xdist.
+
+    :param tmp_path_factory: Ссылка на встроенную фикстуру "tmp_path_factory". При параллельном запуске родительская
+        директория её базовой временной директории является общей для всех процессов-исполнителей.
+    :return: Путь к общей директории, либо None, если тесты запущены без pytest-xdist.
+    """
+    if get_worker_id() == "master":
+        return None
+    return tmp_path_factory.getbasetemp().parent
+
+
+@pytest.fixture(scope="session")
+@allure.title("Блокировка глобального состояния")
+def cross_worker_lock(shared_run_directory) -> CrossWorkerLock | None:
+    """
+    Данная фикстура предоставляет блокировку, общую для всех процессов-исполнителей pytest-xdist.
+
+    :param shared_run_directory: Ссылка на фикстуру "shared_run_directory".
+    :return: Экземпляр класса CrossWorkerLock, либо None, если тесты запущены без pytest-xdist.
+    """
+    if shared_run_directory is None:
+        return None
+    return CrossWorkerLock(shared_run_directory)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def global_state_isolation(request, cross_worker_lock) -> None:
     """
-    Данная фикстура предоставляет менеджер переменных.
+    Данная фикстура при параллельном запуске не допускает одновременного исполнения тестов, помеченных маркером
+    "exclusive", с любыми другими тестами. Остальные тесты исполняются параллельно друг с другом.
+
+    Блокировка удерживается до завершения стадии уборки всех фикстур теста уровня функции.
+
+    :param request: Ссылка на объект вызова фикстуры.
+    :param cross_worker_lock: Ссылка на фикстуру "cross_worker_lock".
+    :return: Данная фикстура ничего не возвращает.
+    """
+    if cross_worker_lock is None:
+        yield
+    elif request.node.get_closest_marker("exclusive") is not None:
+        with cross_worker_lock.exclusive():
+            yield
+    else:
+        with cross_worker_lock.shared():
+            yield
+
+
+@pytest.fixture(scope="function", autouse=True)
+def database_queries_tracking(request) -> None:
+    """
+    Данная фикстура учитывает запросы к БД, исполненные тестом и его фикстурами (включая их стадии уборки), и на
+    стадии уборки прикрепляет к отчёту статистику запросов теста.
+
+    Если тест исполнил одну и ту же инструкцию больше DB_QUERY_REPEAT_THRESHOLD раз, то к отчёту прикрепляется
+    перечень таких инструкций, а pytest выводит предупреждение RepeatedQueriesWarning.
+
+    :param request: Ссылка на объект вызова фикстуры.
+    :return: Данная фикстура ничего не возвращает.
+    """
+    query_tracker.start_test()
+    yield
+    summary, repeated_statements = query_tracker.finish_test(
+        test_id=request.node.nodeid,
+        repeat_threshold=int(FrVars.DB_QUERY_REPEAT_THRESHOLD)
+    )
+    if summary:
+        allure.attach(
+            json.dumps(summary, indent=3, ensure_ascii=False),
+            "Запросы к базе данных",
+            attachment_type=allure.attachment_type.JSON
+        )
+    if repeated_statements:
+        allure.attach(
+            json.dumps(repeated_statements, indent=3, ensure_ascii=False),
+            "Повторяющиеся запросы к базе данных (N+1)",
+            attachment_type=allure.attachment_type.JSON
+        )
+        warnings.warn(
+            f"{request.node.nodeid} executed the same statement more than {FrVars.DB_QUERY_REPEAT_THRESHOLD} times: "
+            + "; ".join(f"{count} x {statement}" for statement, count in repeated_statements.items()),
+            RepeatedQueriesWarning
+        )
+
+
+@pytest.fixture(scope="function")
+@allure.title("Менеджер переменных теста")
+def variable_manager(request) -> VariableManager:
+    """
+    Данная фикстура предоставляет менеджер переменных, отдельный для каждого теста.
+    Пространство имён менеджера включает идентификатор процесса-исполнителя и идентификатор теста.
+
+    :param request: Ссылка на объект вызова фикстуры.
     :return: Экземпляр класса VariableManager.
     """
-    vman = VariableManager()
+    vman = VariableManager(namespace=f"{get_worker_id()}::{request.node.nodeid}")
     yield vman
@@ -1,32 +1,102 @@
+import asyncio
 import random
+from contextlib import nullcontext
 
 import allure
 import pytest
-import requests
+import pytest_asyncio
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
-from database.users import get_user_data_by_email, get_user_data_by_id
+from database.users import get_user_data_by_email, get_user_data_by_id, insert_users, delete_users, \
+    async_get_users_by_ids
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion
-from helpers.validate_response import validate_response_model
+from helpers.data_generators import generate_user_data
+from helpers.user_pool import UserPool
+from helpers.validate_response import validate_response
 from models.authorization import AuthSuccessfulResponse
 from models.users import CreatedUserDataBundle, CreateUserSuccessfulResponse, DeleteUserSuccessfulResponse, \
     CreatedUserDataBundleWithTokens
 
 
+REAL_USER_CREATION_DIRECTIVE = "real user should be created"
+''' Директива indirect-параметризации, отключающая получение пользователя из пула тестовых пользователей '''
+
+
+@pytest.fixture(scope="session")
+@allure.title("Пул тестовых пользователей")
+def user_pool(http_client, database, administrator_session, cross_worker_lock, database_snapshot) -> UserPool:
+    """
+    Данная фикстура создаёт пул пользователей без прав администратора (USER_POOL_SIZE пользователей) и удаляет их
+    после завершения сессии.
+
+    Создание и удаление пользователей пула изменяет общее количество пользователей, поэтому при параллельном запуске
+    они выполняются под совместным захватом блокировки глобального состояния, то есть не одновременно с тестами,
+    помеченными маркером "exclusive".
+
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
+    :param database: Ссылка на фикстуру "database".
+        Необходима для проверки состояния пользователей пула и отзыва их токенов.
+    :param administrator_session: Ссылка на фикстуру "administrator_session".
+        Используется данной фикстурой, так как создание пользователей требует авторизации администратора.
+    :param cross_worker_lock: Ссылка на фикстуру "cross_worker_lock".
+    :param database_snapshot: Ссылка на фикстуру "database_snapshot".
+        После восстановления базы данных из снимка пользователи пула перестают существовать и исключаются из него.
+    :return: Экземпляр класса UserPool.
+    """
+    pool = UserPool(http_client=http_client, database=database, administrator=administrator_session)
+    if database_snapshot is not None:
+        database_snapshot.add_restore_callback(pool.reset)
+
+    with allure.step("Создание пользователей пула"):
+        with cross_worker_lock.shared() if cross_worker_lock is not None else nullcontext():
+            pool.fill()
+
+    yield pool
+
+    with allure.step("Удаление пользователей пула"):
+        with cross_worker_lock.shared() if cross_worker_lock is not None else nullcontext():
+            pool.close()
+
+
 @pytest.fixture(scope="function")
 @allure.title("Создание тестового пользователя")
-def create_user(database, authorize_administrator, request) -> CreatedUserDataBundle:
+def create_user(http_client, database, authorize_administrator, user_pool, request) -> CreatedUserDataBundle:
     """
-    Данная фикстура обеспечивает создание пользователя без прав администратора и его удаление после завершения
-    тестирования.
+    Данная фикстура предоставляет пользователя без прав администратора.
+
+    По умолчанию пользователь берётся из пула тестовых пользователей и после завершения тестирования возвращается
+    в пул, будучи приведённым к исходному состоянию (права администратора отзываются, токены - помечаются отозванными).
+
+    Тесты, проверяющие создание или удаление пользователя, могут получить нового пользователя, который будет создан
+    запросом POST /v1/users и удалён после завершения тестирования, путём параметризации фикстуры следующим образом::
+
+        @pytest.mark.parametrize("create_user", ["real user should be created"], indirect=True)
+
+    Директива "fixture user deletion should be skipped" также создаёт нового пользователя, но пропускает его удаление.
+
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param database: Ссылка на фикстуру "database".
         Необходима для запроса уровня прав пользователя перед отправкой запроса на удаление пользователя.
     :param authorize_administrator: Ссылка на фикстуру "variable_manager".
         Используется данной фикстурой, так как создание пользователя требует авторизации администратора.
+    :param user_pool: Ссылка на фикстуру "user_pool".
+    :param request: Ссылка на объект вызова фикстуры, содержащий директиву создания или удаления пользователя.
     :return: Набор данных зарегистрированного пользователя.
     """
+    deletion_skip_directive = getattr(request, 'param', None)
+
+    if deletion_skip_directive not in (REAL_USER_CREATION_DIRECTIVE, "fixture user deletion should be skipped"):
+        with allure.step("Получение пользователя из пула"):
+            leased_user = user_pool.lease()
+        yield leased_user
+        with allure.step("Возврат пользователя в пул"):
+            user_pool.release(leased_user)
+        return
+
     # Стадия подготовки
     # Подготовка данных создаваемого пользователя
     fake = Faker()
@@ -36,11 +106,9 @@ def create_user(database, authorize_administrator, request) -> CreatedUserDataBu
     new_user_random_surname = fake.last_name()
     new_user_random_password = fake.password()
 
-    deletion_skip_directive = getattr(request, 'param', None)
-
     # Отправка запроса на создание пользователя
     with allure.step("Создание пользователя"):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/users",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -61,9 +129,9 @@ def create_user(database, authorize_administrator, request) -> CreatedUserDataBu
             assertion_name="Код ответа на запрос создания пользователя в фикстуре"
         )
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=CreateUserSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
     # Сериализация данных созданного пользователя в набор
@@ -95,7 +163,7 @@ def create_user(database, authorize_administrator, request) -> CreatedUserDataBu
         # В случае, если пользователь за время жизни приобрёл права администратора - отзыв прав администратора
         if user_has_administrator_permissions is True:
             with allure.step("Отзыв у удаляемого пользователя прав администратора"):
-                res = requests.patch(
+                res = http_client.patch(
                     url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{created_user_data.user_id}/revoke",
                     headers={
                         "Access-Token": authorize_administrator.access_token
@@ -111,7 +179,7 @@ def create_user(database, authorize_administrator, request) -> CreatedUserDataBu
 
         # Отправка запроса на удаление пользователя
         with allure.step("Удаление пользователя"):
-            res = requests.delete(
+            res = http_client.delete(
                 url=FrVars.APP_HOST + f"/v1/users/{created_user_data.user_id}",
                 headers={
                     "Access-Token": authorize_administrator.access_token
@@ -125,25 +193,40 @@ def create_user(database, authorize_administrator, request) -> CreatedUserDataBu
                 assertion_name="Код ответа на запрос удаления пользователя в фикстуре"
             )
 
-            validate_response_model(
+            validate_response(
                 model=DeleteUserSuccessfulResponse,
-                data=res.json()
+                response=res
             )
 
 # TODO: Оптимизировать фикстуры создания пользователей таким образом, чтобы одна фикстура создавала и удаляла сразу
 #  двоих тестовых пользователей.
 @pytest.fixture(scope="function")
 @allure.title("Создание второго тестового пользователя")
-def create_second_user(database, authorize_administrator) -> CreatedUserDataBundle:
+def create_second_user(
+        http_client, database, authorize_administrator, user_pool, request
+) -> CreatedUserDataBundle:
     """
-    Данная фикстура обеспечивает создание ещё одного пользователя без прав администратора и его удаление после
-    завершения тестирования.
+    Данная фикстура предоставляет ещё одного пользователя без прав администратора. Как и фикстура "create_user",
+    по умолчанию она берёт пользователя из пула тестовых пользователей, а при параметризации директивой
+    "real user should be created" - создаёт нового пользователя и удаляет его после завершения тестирования.
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param database: Ссылка на фикстуру "database".
         Необходима для запроса уровня прав пользователя перед отправкой запроса на удаление пользователя.
     :param authorize_administrator: Ссылка на фикстуру "variable_manager".
         Используется данной фикстурой, так как создание пользователя требует авторизации администратора.
+    :param user_pool: Ссылка на фикстуру "user_pool".
+    :param request: Ссылка на объект вызова фикстуры, содержащий директиву создания пользователя.
     :return: Набор данных зарегистрированного пользователя.
     """
+    if getattr(request, 'param', None) != REAL_USER_CREATION_DIRECTIVE:
+        with allure.step("Получение пользователя из пула"):
+            leased_user = user_pool.lease()
+        yield leased_user
+        with allure.step("Возврат пользователя в пул"):
+            user_pool.release(leased_user)
+        return
+
     # Стадия подготовки
     # Подготовка данных создаваемого пользователя
     fake = Faker()
@@ -155,7 +238,7 @@ def create_second_user(database, authorize_administrator) -> CreatedUserDataBund
 
     # Отправка запроса на создание пользователя
     with allure.step("Создание пользователя"):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/users",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -176,9 +259,9 @@ def create_second_user(database, authorize_administrator) -> CreatedUserDataBund
             assertion_name="Код ответа на запрос создания пользователя в фикстуре"
         )
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=CreateUserSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
     # Сериализация данных созданного пользователя в набор
@@ -203,7 +286,7 @@ def create_second_user(database, authorize_administrator) -> CreatedUserDataBund
     # В случае, если пользователь за время жизни приобрёл права администратора - отзыв прав администратора
     if user_has_administrator_permissions is True:
         with allure.step("Отзыв у удаляемого пользователя прав администратора"):
-            res = requests.patch(
+            res = http_client.patch(
                 url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{created_user_data.user_id}/revoke",
                 headers={
                     "Access-Token": authorize_administrator.access_token
@@ -219,7 +302,7 @@ def create_second_user(database, authorize_administrator) -> CreatedUserDataBund
 
     # Отправка запроса на удаление пользователя
     with allure.step("Удаление пользователя"):
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/users/{created_user_data.user_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -233,14 +316,14 @@ def create_second_user(database, authorize_administrator) -> CreatedUserDataBund
             assertion_name="Код ответа на запрос удаления пользователя в фикстуре"
         )
 
-        validate_response_model(
+        validate_response(
             model=DeleteUserSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
 @pytest.fixture(scope="function")
 @allure.title("Создание и авторизация тестового пользователя")
-def create_and_authorize_user(create_user, request) -> CreatedUserDataBundleWithTokens:
+def create_and_authorize_user(http_client, create_user, request) -> CreatedUserDataBundleWithTokens:
     """
     Данная фикстура обеспечивает создание пользователя без прав администратора и его авторизацию, а также его выход из
     системы и удаление после завершения тестирования.
@@ -251,6 +334,8 @@ def create_and_authorize_user(create_user, request) -> CreatedUserDataBundleWith
 
         @pytest.mark.parametrize("create_and_authorize_user", ["fixture logout should be skipped"], indirect=True)
 
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param create_user: Ссылка на фикстуру "create_user".
         Используется для создания и удаления пользователя.
     :param request: Ссылка на объект вызова фикстуры.
@@ -259,7 +344,7 @@ def create_and_authorize_user(create_user, request) -> CreatedUserDataBundleWith
     :return: Набор данных зарегистрированного пользователя.
     """
     logout_skip_directive = getattr(request, 'param', None)
-    res = requests.post(
+    res = http_client.post(
         url=FrVars.APP_HOST + "/v1/authorize",
         json={
             "email": create_user.email,
@@ -274,9 +359,9 @@ def create_and_authorize_user(create_user, request) -> CreatedUserDataBundleWith
         assertion_name="Код ответа на запрос фикстуры"
     )
 
-    serialized_response = validate_response_model(
+    serialized_response = validate_response(
         model=AuthSuccessfulResponse,
-        data=res.json()
+        response=res
     )
 
     yield CreatedUserDataBundleWithTokens(
@@ -298,7 +383,7 @@ def create_and_authorize_user(create_user, request) -> CreatedUserDataBundleWith
             "Выход из учётной записи был пропущен"
         )
     else:
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + "/v1/logout",
             headers={
                 "Access-Token": serialized_response.access_token
@@ -315,17 +400,19 @@ def create_and_authorize_user(create_user, request) -> CreatedUserDataBundleWith
 #  двоих тестовых пользователей.
 @pytest.fixture(scope="function")
 @allure.title("Создание и авторизация второго тестового пользователя")
-def create_and_authorize_second_user(create_second_user) -> CreatedUserDataBundleWithTokens:
+def create_and_authorize_second_user(http_client, create_second_user) -> CreatedUserDataBundleWithTokens:
     """
     Данная фикстура обеспечивает создание ещё одного пользователя без прав администратора и его авторизацию,
     а также его выход из системы и удаление после завершения тестирования.
     Для создания пользователя данная фикстура вызывает существующую фикстуру "create_second_user", реализуя на своей
     стороне только авторизацию и выход из системы.
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param create_second_user: Ссылка на фикстуру "create_user".
         Используется для создания и удаления пользователя.
     :return: Набор данных зарегистрированного пользователя.
     """
-    res = requests.post(
+    res = http_client.post(
         url=FrVars.APP_HOST + "/v1/authorize",
         json={
             "email": create_second_user.email,
@@ -340,9 +427,9 @@ def create_and_authorize_second_user(create_second_user) -> CreatedUserDataBundl
         assertion_name="Код ответа на запрос фикстуры"
     )
 
-    serialized_response = validate_response_model(
+    serialized_response = validate_response(
         model=AuthSuccessfulResponse,
-        data=res.json()
+        response=res
     )
 
     yield CreatedUserDataBundleWithTokens(
@@ -356,7 +443,7 @@ def create_and_authorize_second_user(create_second_user) -> CreatedUserDataBundl
         refresh_token=serialized_response.refresh_token
     )
 
-    res = requests.delete(
+    res = http_client.delete(
         url=FrVars.APP_HOST + "/v1/logout",
         headers={
             "Access-Token": serialized_response.access_token
@@ -371,7 +458,7 @@ def create_and_authorize_second_user(create_second_user) -> CreatedUserDataBundl
 
 @pytest.fixture(scope="function")
 @allure.title("Удаление тестового пользователя")
-def delete_user(database, variable_manager, authorize_administrator) -> None:
+def delete_user(http_client, database, variable_manager, authorize_administrator) -> None:
     """
     Данная фикстура обеспечивает вызов эндпоинта DELETE /users/{user_id} для тестовых функций, которые завершились
     корректным созданием пользователя и требуют его удаления.
@@ -380,6 +467,8 @@ def delete_user(database, variable_manager, authorize_administrator) -> None:
     delete_user требуется, чтобы перед её вызовом в variable_manager была записана переменная 'user_id' c ID,
     пользователя, которого необходимо удалить.
 
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param database: Ссылка на фикстуру "database".
         Необходима для запроса уровня прав пользователя перед отправкой запроса на удаление пользователя.
     :param authorize_administrator: Ссылка на фикстуру "authorize_administrator".
@@ -403,7 +492,7 @@ def delete_user(database, variable_manager, authorize_administrator) -> None:
 
     if user_has_administrator_permissions is True:
         with allure.step("Отзыв у удаляемого пользователя прав администратора"):
-            res = requests.patch(
+            res = http_client.patch(
                 url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{user_id}/revoke",
                 headers={
                     "Access-Token": authorize_administrator.access_token
@@ -419,7 +508,7 @@ def delete_user(database, variable_manager, authorize_administrator) -> None:
 
     # Отправка запроса на удаление пользователя
     with allure.step("Удаление пользователя"):
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/users/{user_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -433,10 +522,245 @@ def delete_user(database, variable_manager, authorize_administrator) -> None:
             assertion_name="Код ответа на запрос удаления пользователя в фикстуре"
         )
 
-        validate_response_model(
+        validate_response(
             model=DeleteUserSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
     # Очистка переменной user_id из менеджера переменных
     variable_manager.unset('user_id')
+
+
+async def async_delete_users(async_http_client, async_database, access_token: str, users_ids: list) -> None:
+    """
+    Данный метод одновременно удаляет переданных пользователей, предварительно отзывая права администратора у тех из
+    них, кто приобрёл их за время жизни.
+
+    Запросы отправляются одновременно, а их результаты проверяются и прикрепляются к отчёту последовательно,
+    чтобы шаги отчёта не перемешивались.
+
+    :param async_http_client: Экземпляр класса AsyncHttpClient.
+    :param async_database: Экземпляр класса AsyncDatabase.
+    :param access_token: Токен доступа администратора.
+    :param users_ids: Список ID удаляемых пользователей.
+    :return: Метод ничего не возвращает.
+    """
+    headers = {"Access-Token": access_token}
+
+    # Уровень прав всех удаляемых пользователей запрашивается одним запросом.
+    users_data_from_db = await async_get_users_by_ids(db=async_database, users_ids=users_ids)
+    administrators_ids = [
+        user_id for user_id, user_data in users_data_from_db.items() if user_data.is_admin is True
+    ]
+    if administrators_ids:
+        responses = await asyncio.gather(*(
+            async_http_client.patch(
+                url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{user_id}/revoke",
+                headers=headers
+            ) for user_id in administrators_ids
+        ))
+        for res in responses:
+            with allure.step("Отзыв у удаляемого пользователя прав администратора"):
+                attach_request_data_to_report(res)
+                make_simple_assertion(
+                    expected_value=200,
+                    actual_value=res.status_code,
+                    assertion_name="Код ответа на запрос отзыва прав администратора у пользователя в фикстуре"
+                )
+
+    responses = await asyncio.gather(*(
+        async_http_client.delete(
+            url=FrVars.APP_HOST + f"/v1/users/{user_id}",
+            headers=headers
+        ) for user_id in users_ids
+    ))
+    for res in responses:
+        with allure.step("Удаление пользователя"):
+            attach_request_data_to_report(res)
+            make_simple_assertion(
+                expected_value=200,
+                actual_value=res.status_code,
+                assertion_name="Код ответа на запрос удаления пользователя в фикстуре"
+            )
+            validate_response(
+                model=DeleteUserSuccessfulResponse,
+                response=res
+            )
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+@allure.title("Создание тестовых пользователей (асинхронное)")
+async def async_create_users(
+        async_http_client, async_database, async_authorize_administrator, request
+) -> list[CreatedUserDataBundle]:
+    """
+    Данная фикстура является асинхронным вариантом фикстур "create_user" и "create_second_user": она одновременно
+    создаёт несколько пользователей без прав администратора и одновременно удаляет их после завершения тестирования.
+
+    Количество создаваемых пользователей (по умолчанию - два) может быть изменено путём параметризации фикстуры
+    следующим образом::
+
+        @pytest.mark.parametrize("async_create_users", [3], indirect=True)
+
+    :param async_http_client: Ссылка на фикстуру "async_http_client".
+        Используется для отправки запросов к приложению.
+    :param async_database: Ссылка на фикстуру "async_database".
+        Необходима для запроса уровня прав пользователей перед отправкой запросов на их удаление.
+    :param async_authorize_administrator: Ссылка на фикстуру "async_authorize_administrator".
+        Используется данной фикстурой, так как создание пользователей требует авторизации администратора.
+    :param request: Ссылка на объект вызова фикстуры, содержащий количество создаваемых пользователей.
+    :return: Список наборов данных зарегистрированных пользователей.
+    """
+    users_count = getattr(request, 'param', None) or 2
+    users_data = [generate_user_data() for _ in range(users_count)]
+
+    # Отправка запросов на создание пользователей
+    responses = await asyncio.gather(*(
+        async_http_client.post(
+            url=FrVars.APP_HOST + "/v1/users",
+            headers={
+                "Access-Token": async_authorize_administrator.access_token
+            },
+            json=user_data
+        ) for user_data in users_data
+    ), return_exceptions=True)
+
+    # Идентификаторы всех созданных пользователей собираются до проверки ответов: при ошибке в любом из ответов
+    # созданные пользователи удаляются сразу, так как стадия очистки не будет вызвана.
+    created_users_ids = [
+        res.json()["user_id"] for res in responses
+        if not isinstance(res, BaseException) and res.status_code == 200
+    ]
+    created_users_data = []
+    try:
+        for user_data, res in zip(users_data, responses):
+            if isinstance(res, BaseException):
+                raise res
+            with allure.step("Создание пользователя"):
+                attach_request_data_to_report(res)
+
+                make_simple_assertion(
+                    expected_value=200,
+                    actual_value=res.status_code,
+                    assertion_name="Код ответа на запрос создания пользователя в фикстуре"
+                )
+
+                serialized_response = validate_response(
+                    model=CreateUserSuccessfulResponse,
+                    response=res
+                )
+
+            created_users_data.append(CreatedUserDataBundle(user_id=serialized_response.user_id, **user_data))
+    except Exception:
+        await async_delete_users(
+            async_http_client=async_http_client,
+            async_database=async_database,
+            access_token=async_authorize_administrator.access_token,
+            users_ids=created_users_ids
+        )
+        raise
+
+    # Предоставление наборов для использования в тестах
+    yield created_users_data
+
+    # Стадия очистки
+    await async_delete_users(
+        async_http_client=async_http_client,
+        async_database=async_database,
+        access_token=async_authorize_administrator.access_token,
+        users_ids=[user.user_id for user in created_users_data]
+    )
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+@allure.title("Создание и авторизация тестовых пользователей (асинхронное)")
+async def async_create_and_authorize_users(
+        async_http_client, async_create_users
+) -> list[CreatedUserDataBundleWithTokens]:
+    """
+    Данная фикстура является асинхронным вариантом фикстур "create_and_authorize_user" и
+    "create_and_authorize_second_user": она одновременно авторизует пользователей, созданных фикстурой
+    "async_create_users", и одновременно завершает их сессии после завершения тестирования.
+
+    :param async_http_client: Ссылка на фикстуру "async_http_client".
+        Используется для отправки запросов к приложению.
+    :param async_create_users: Ссылка на фикстуру "async_create_users".
+        Используется для создания и удаления пользователей.
+    :return: Список наборов данных зарегистрированных и авторизованных пользователей.
+    """
+    responses = await asyncio.gather(*(
+        async_http_client.post(
+            url=FrVars.APP_HOST + "/v1/authorize",
+            json={
+                "email": user.email,
+                "password": user.password
+            }
+        ) for user in async_create_users
+    ))
+
+    authorized_users_data = []
+    for user, res in zip(async_create_users, responses):
+        attach_request_data_to_report(res)
+
+        make_simple_assertion(
+            expected_value=200,
+            actual_value=res.status_code,
+            assertion_name="Код ответа на запрос фикстуры"
+        )
+
+        serialized_response = validate_response(
+            model=AuthSuccessfulResponse,
+            response=res
+        )
+
+        authorized_users_data.append(CreatedUserDataBundleWithTokens(
+            **user.model_dump(),
+            access_token=serialized_response.access_token,
+            refresh_token=serialized_response.refresh_token
+        ))
+
+    yield authorized_users_data
+
+    responses = await asyncio.gather(*(
+        async_http_client.delete(
+            url=FrVars.APP_HOST + "/v1/logout",
+            headers={
+                "Access-Token": user.access_token
+            }
+        ) for user in authorized_users_data
+    ))
+    for res in responses:
+        attach_request_data_to_report(res)
+        make_simple_assertion(
+            expected_value=200,
+            actual_value=res.status_code,
+            assertion_name="Код ответа на запрос фикстуры"
+        )
+
+
+@pytest.fixture(scope="function")
+@allure.title("Добавление тестовых пользователей в БД")
+def seed_users(database, request) -> list[CreatedUserDataBundle]:
+    """
+    Данная фикстура добавляет пользователей без прав администратора напрямую в БД одним запросом и удаляет их (вместе
+    с выпущенными на них токенами) после завершения тестирования. Фикстура предназначена для тестов, в которых
+    пользователи являются лишь предусловием, и не подходит для тестов, проверяющих создание пользователя.
+
+    Количество добавляемых пользователей (по умолчанию - один) может быть изменено путём параметризации фикстуры
+    следующим образом::
+
+        @pytest.mark.parametrize("seed_users", [100], indirect=True)
+
+    :param database: Ссылка на фикстуру "database".
+    :param request: Ссылка на объект вызова фикстуры, содержащий количество добавляемых пользователей.
+    :return: Список наборов данных добавленных пользователей.
+    """
+    users_count = getattr(request, 'param', None) or 1
+
+    with allure.step(f"Добавление пользователей в БД ({users_count})"):
+        seeded_users = insert_users(db=database, users_data=[generate_user_data() for _ in range(users_count)])
+
+    yield seeded_users
+
+    with allure.step(f"Удаление пользователей из БД ({users_count})"):
+        delete_users(db=database, users_ids=[user.user_id for user in seeded_users])
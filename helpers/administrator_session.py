@@ -0,0 +1,161 @@
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import allure
+
+from data.framework_variables import FrameworkVariables as FrVars
+from helpers.allure_report import attach_request_data_to_report
+from helpers.assertions import make_simple_assertion
+from helpers.http_client import HttpClient
+from helpers.validate_response import validate_response
+from helpers.workers import fcntl
+from models.authorization import AuthSuccessfulResponse
+
+ADMINISTRATOR_SESSION_CACHE_FILE_NAME = "administrator_session.json"
+''' Имя файла общей сессии администратора в директории, общей для всех процессов-исполнителей '''
+
+
+class AdministratorSession:
+    """
+    Данный класс представляет собой сессию стандартного администратора приложения, общую для всего запуска.
+
+    Авторизация выполняется один раз, при первом обращении к токену доступа. Незадолго до истечения времени жизни
+    токена доступа (ACCESS_TOKEN_TTL_IN_MINUTES) пара токенов обновляется запросом POST /v1/refresh.
+
+    При параллельном запуске (pytest-xdist) пара токенов хранится в файле, общем для всех процессов-исполнителей,
+    поэтому авторизация и обновление токенов выполняются одним исполнителем, а остальные читают актуальную пару
+    из файла при каждом обращении к токену.
+
+    Свойства access_token и refresh_token совпадают с полями модели AuthSuccessfulResponse, поэтому экземпляр класса
+    может использоваться везде, где ожидается сериализованный ответ на запрос авторизации.
+    """
+
+    def __init__(self, http_client: HttpClient, cache_file_path: Path | None = None):
+        """
+        :param http_client: HTTP-клиент, через который отправляются запросы авторизации и обновления токенов.
+        :param cache_file_path: Путь к файлу, общему для всех процессов-исполнителей. Если значение не передано,
+            то пара токенов хранится только в памяти текущего процесса.
+        """
+        self.http_client = http_client
+        self.cache_file_path = cache_file_path
+        self._tokens: AuthSuccessfulResponse | None = None
+        self._issued_at: float | None = None
+
+    @property
+    def access_token(self) -> str:
+        """ Актуальный токен доступа администратора. """
+        return self._get_tokens().access_token
+
+    @property
+    def refresh_token(self) -> str:
+        """ Актуальный токен обновления администратора. """
+        return self._get_tokens().refresh_token
+
+    def logout(self) -> None:
+        """
+        Метод для выхода из учётной записи администратора. Если авторизация не выполнялась, то метод ничего не делает.
+
+        :return: Метод ничего не возвращает.
+        """
+        with self._cache_lock():
+            self._read_cache()
+            if self._tokens is None:
+                return
+
+            res = self.http_client.delete(
+                url=FrVars.APP_HOST + "/v1/logout",
+                headers={
+                    "Access-Token": self._tokens.access_token
+                }
+            )
+            attach_request_data_to_report(res)
+            make_simple_assertion(
+                expected_value=200,
+                actual_value=res.status_code,
+                assertion_name="Код ответа на запрос фикстуры"
+            )
+
+            self._tokens, self._issued_at = None, None
+            self._write_cache()
+
+    def reset(self) -> None:
+        """
+        Метод для сброса закешированной пары токенов без выхода из учётной записи (например, после восстановления базы
+        данных из снимка, в котором этих токенов не существует). При следующем обращении к токену будет выполнена
+        повторная авторизация.
+
+        :return: Метод ничего не возвращает.
+        """
+        with self._cache_lock():
+            self._tokens, self._issued_at = None, None
+            self._write_cache()
+
+    def _get_tokens(self) -> AuthSuccessfulResponse:
+        with self._cache_lock():
+            self._read_cache()
+            if self._tokens is None:
+                with allure.step("Авторизация в системе"):
+                    self._request_tokens("/v1/authorize", {
+                        "email": FrVars.APP_DEFAULT_USER_EMAIL,
+                        "password": FrVars.APP_DEFAULT_USER_PASSWORD
+                    })
+            elif self._is_expiring():
+                with allure.step("Обновление токенов администратора"):
+                    self._request_tokens("/v1/refresh", {
+                        "refresh_token": self._tokens.refresh_token
+                    })
+            return self._tokens
+
+    def _is_expiring(self) -> bool:
+        expires_at = self._issued_at + float(FrVars.ACCESS_TOKEN_TTL_IN_MINUTES) * 60
+        return time.time() >= expires_at - float(FrVars.ADMIN_TOKEN_REFRESH_MARGIN_IN_SECONDS)
+
+    def _request_tokens(self, path: str, body: dict) -> None:
+        issued_at = time.time()
+        res = self.http_client.post(url=FrVars.APP_HOST + path, json=body)
+        attach_request_data_to_report(res)
+
+        make_simple_assertion(
+            expected_value=200,
+            actual_value=res.status_code,
+            assertion_name="Код ответа на запрос фикстуры"
+        )
+
+        self._tokens = validate_response(
+            model=AuthSuccessfulResponse,
+            response=res
+        )
+        self._issued_at = issued_at
+        self._write_cache()
+
+    @contextmanager
+    def _cache_lock(self):
+        if self.cache_file_path is None:
+            yield
+            return
+        with open(str(self.cache_file_path) + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_cache(self) -> None:
+        if self.cache_file_path is None or not self.cache_file_path.exists():
+            return
+        cache = json.loads(self.cache_file_path.read_text(encoding="utf-8"))
+        if cache["tokens"] is None:
+            self._tokens, self._issued_at = None, None
+        else:
+            self._tokens = AuthSuccessfulResponse.model_validate(cache["tokens"])
+            self._issued_at = cache["issued_at"]
+
+    def _write_cache(self) -> None:
+        if self.cache_file_path is None:
+            return
+        self.cache_file_path.write_text(json.dumps({
+            "tokens": self._tokens.model_dump() if self._tokens is not None else None,
+            "issued_at": self._issued_at
+        }), encoding="utf-8")
@@ -1,32 +1,177 @@
+import gzip
+
 import allure
 import json
+from collections import deque
+from typing import NamedTuple
+
+from httpx import Response as AsyncResponse
 from requests import Response
-from helpers.json_tools import format_json, is_json
+from data.framework_variables import FrameworkVariables as FrVars
+from helpers.latency_tracker import latency_tracker
+
+
+class RequestData(NamedTuple):
+    """
+    Данные запроса и ответа в исходном (неформатированном) виде.
+    """
+    url: str
+    method: str
+    request_headers: dict
+    request_body: str | bytes | None
+    status_code: int
+    response_headers: dict
+    response_body: bytes
+
+
+request_data_buffer: deque[RequestData] = deque(maxlen=int(FrVars.ALLURE_REQUEST_DATA_BUFFER_SIZE))
+''' Буфер данных запросов и ответов текущего теста, прикрепляемых к отчёту только при неудаче теста '''
+
+
+def get_request_body(response: Response | AsyncResponse) -> str | bytes | None:
+    """
+    Данный метод возвращает тело отправленного запроса как для ответов синхронного клиента (requests),
+    так и для ответов асинхронного клиента (httpx).
+
+    :param response: Ответ, тело запроса которого необходимо получить.
+    :return: Тело запроса, либо None, если запрос был отправлен без тела.
+    """
+    request_body = getattr(response.request, 'body', None)
+    if request_body is None:
+        request_body = getattr(response.request, 'content', None) or None
+    return request_body
+
+
+def attach_request_data_to_report(response: Response | AsyncResponse):
+    """
+    Данный метод сохраняет время ответа и прикрепляет данные запроса и ответа к отчёту.
+
+    В режиме ALLURE_ATTACHMENTS_MODE=on_failure данные не форматируются, а сохраняются в буфер текущего теста
+    (не более ALLURE_REQUEST_DATA_BUFFER_SIZE последних запросов) и прикрепляются к отчёту только в случае неудачи
+    теста (см. attach_buffered_request_data_to_report). В режиме verbose данные прикрепляются сразу.
+
+    :param response: Ответ синхронного (requests) или асинхронного (httpx) клиента.
+    """
+    latency_tracker.record_response(response)
+
+    request_data = RequestData(
+        url=str(response.url),
+        method=response.request.method,
+        request_headers=dict(response.request.headers),
+        request_body=get_request_body(response),
+        status_code=response.status_code,
+        response_headers=dict(response.headers),
+        response_body=response.content
+    )
+    if FrVars.ALLURE_ATTACHMENTS_MODE == 'verbose':
+        with allure.step("Данные запроса и ответа"):
+            _attach_request_data(request_data)
+    else:
+        request_data_buffer.append(request_data)
+
+
+def attach_text_to_report(body: str, name: str, attachment_type: allure.attachment_type | None = None) -> None:
+    """
+    Данный метод прикрепляет текстовое вложение к отчёту с ограничением его размера.
+
+    Если размер вложения превышает ALLURE_ATTACHMENT_SIZE_LIMIT_IN_KB, то вместо него прикрепляется превью
+    (первые ALLURE_ATTACHMENT_PREVIEW_SIZE_IN_KB килобайт), а полное содержимое прикрепляется отдельным сжатым
+    (gzip) файлом. Такие вложения не увеличивают объём allure-results и время генерации отчёта пропорционально
+    размеру данных.
+
+    :param body: Содержимое вложения.
+    :param name: Название вложения.
+    :param attachment_type: Тип вложения (применяется, только если вложение не превышает ограничение).
+    :return: Метод ничего не возвращает.
+    """
+    encoded_body = body.encode("utf-8")
+    size_limit = int(FrVars.ALLURE_ATTACHMENT_SIZE_LIMIT_IN_KB) * 1024
+    if len(encoded_body) <= size_limit:
+        allure.attach(body, name, attachment_type=attachment_type)
+        return
+
+    full_body_name = f"{name} (полностью, gzip)"
+    preview_size = int(FrVars.ALLURE_ATTACHMENT_PREVIEW_SIZE_IN_KB) * 1024
+    preview = encoded_body[:preview_size].decode("utf-8", errors="ignore")
+    allure.attach(
+        f"{preview}\n\n... [показано {len(preview.encode('utf-8')) // 1024} КБ из {len(encoded_body) // 1024} КБ, "
+        f"полное содержимое - во вложении «{full_body_name}»]",
+        name
+    )
+    allure.attach(gzip.compress(encoded_body), full_body_name, attachment_type="application/gzip", extension="gz")
+
+
+def attach_json_to_report(json_string: str | bytes, name: str) -> None:
+    """
+    Данный метод прикрепляет JSON к отчёту с ограничением размера вложения (см. attach_text_to_report).
+    JSON, не превышающий ограничение, форматируется, а превышающий - прикрепляется без форматирования, чтобы не
+    тратить время на форматирование данных, которые не попадут в превью.
+
+    :param json_string: JSON-строка.
+    :param name: Название вложения.
+    :return: Метод ничего не возвращает.
+    """
+    if len(json_string) > int(FrVars.ALLURE_ATTACHMENT_SIZE_LIMIT_IN_KB) * 1024:
+        if isinstance(json_string, bytes):
+            json_string = json_string.decode("utf-8")
+        attach_text_to_report(json_string, name)
+    else:
+        attach_text_to_report(_format_json_value(json.loads(json_string)), name)
+
+
+def attach_buffered_request_data_to_report() -> None:
+    """
+    Данный метод прикрепляет к отчёту данные запросов и ответов, сохранённые в буфер текущего теста, и очищает буфер.
+
+    :return: Метод ничего не возвращает.
+    """
+    if not request_data_buffer:
+        return
+    with allure.step(f"Данные запросов и ответов теста (последние {len(request_data_buffer)})"):
+        while request_data_buffer:
+            request_data = request_data_buffer.popleft()
+            with allure.step(f"{request_data.method} {request_data.url} - {request_data.status_code}"):
+                _attach_request_data(request_data)
+
+
+def _attach_request_data(request_data: RequestData) -> None:
+    request_string = f"URL: {request_data.url}\n"
+    request_string = request_string + f"Method: {request_data.method}\n"
+    request_string = request_string + f"Headers:\n{_format_json_value(request_data.request_headers)}\n"
+
+    formatted_request_body = _format_json_body(request_data.request_body)
+    if formatted_request_body is not None:
+        request_string = request_string + f"Body:\n{formatted_request_body}"
+    elif isinstance(request_data.request_body, str):
+        request_string = request_string + f"Body:\n{request_data.request_body}"
+    else:
+        request_string = request_string + f"Body: Request has no body\n"
+
+    attach_text_to_report(request_string, "Данные запроса")
 
+    response_string = f"Status: {request_data.status_code}\n"
+    response_string = response_string + f"Headers:\n{_format_json_value(request_data.response_headers)}\n"
 
-def attach_request_data_to_report(response: Response):
-    with allure.step("Данные запроса и ответа"):
-        request_string = f"URL: {response.url}\n"
-        request_string = request_string + f"Method: {response.request.method}\n"
-        request_string = request_string + f"Headers:\n{format_json(json.dumps(dict(response.request.headers)))}\n"
+    formatted_response_body = _format_json_body(request_data.response_body)
+    if formatted_response_body is not None:
+        response_string = response_string + f"Body:\n{formatted_response_body}"
+    elif isinstance(request_data.response_body, str):
+        response_string = response_string + f"Body:\n{str(request_data.response_body)}"
+    else:
+        response_string = response_string + f"Body: Response has no body\n"
 
-        if is_json(response.request.body):
-            request_string = request_string + f"Body:\n{format_json(response.request.body)}"
-        elif isinstance(response.request.body, str):
-            request_string = request_string + f"Body:\n{response.request.body}"
-        else:
-            request_string = request_string + f"Body: Request has no body\n"
+    attach_text_to_report(response_string, "Данные ответа")
 
-        allure.attach(request_string, "Данные запроса")
 
-        response_string = f"Status: {response.status_code}\n"
-        response_string = response_string + f"Headers:\n{format_json(json.dumps(dict(response.headers)))}\n"
+def _format_json_value(value) -> str:
+    return json.dumps(value, indent=3, ensure_ascii=False)
 
-        if is_json(response.content):
-            response_string = response_string + f"Body:\n{format_json(response.content)}"
-        elif isinstance(response.content, str):
-            response_string = response_string + f"Body:\n{str(response.content)}"
-        else:
-            response_string = response_string + f"Body: Response has no body\n"
 
-        allure.attach(response_string, "Данные ответа")
+def _format_json_body(body: str | bytes | None) -> str | None:
+    # Тело разбирается один раз: при успешном разборе возвращается отформатированный JSON, иначе - None.
+    if body is None:
+        return None
+    try:
+        return _format_json_value(json.loads(body))
+    except (TypeError, ValueError):
+        return None
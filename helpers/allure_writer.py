@@ -0,0 +1,115 @@
+import atexit
+import queue
+import threading
+import warnings
+
+import allure_commons
+from allure_commons import hookimpl
+from allure_commons.logger import AllureFileLogger
+
+
+class BackgroundAllureFileLogger:
+    """
+    Данный класс переносит запись результатов Allure (результатов тестов, контейнеров фикстур и вложений) в файлы
+    allure-results из потока теста в отдельный фоновый поток.
+
+    Записи передаются фоновому потоку через очередь ограниченного размера: если запись не успевает за тестами, то
+    поток теста ожидает освобождения места в очереди, а объём неотправленных данных в памяти остаётся ограниченным.
+    Очередь записывается полностью при завершении сессии pytest, а также при аварийном завершении интерпретатора.
+    """
+
+    def __init__(self, file_logger: AllureFileLogger, queue_size: int):
+        """
+        :param file_logger: Штатный экземпляр AllureFileLogger, выполняющий запись в файлы.
+        :param queue_size: Максимальное количество записей в очереди.
+        """
+        self.file_logger = file_logger
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._write_records, name="allure-results-writer", daemon=True)
+        self._thread.start()
+
+    @hookimpl
+    def report_result(self, result):
+        self._queue.put((self.file_logger.report_result, {"result": result}))
+
+    @hookimpl
+    def report_container(self, container):
+        self._queue.put((self.file_logger.report_container, {"container": container}))
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        self._queue.put((self.file_logger.report_attached_data, {"body": body, "file_name": file_name}))
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        # Исходный файл может быть удалён тестом сразу после прикрепления, поэтому он копируется немедленно.
+        self.file_logger.report_attached_file(source=source, file_name=file_name)
+
+    @hookimpl
+    def report_globals(self, globals_item):
+        self._queue.put((self.file_logger.report_globals, {"globals_item": globals_item}))
+
+    def flush(self) -> None:
+        """
+        Метод для ожидания записи всех находящихся в очереди записей.
+
+        :return: Метод ничего не возвращает.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Метод для записи оставшихся записей и завершения фонового потока. Повторный вызов ничего не делает.
+
+        :return: Метод ничего не возвращает.
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _write_records(self) -> None:
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                write, kwargs = record
+                write(**kwargs)
+            except Exception as e:
+                warnings.warn(f"Allure results writing is failed: {e!r}")
+            finally:
+                self._queue.task_done()
+
+
+def install_background_allure_writer(config, queue_size: int) -> None:
+    """
+    Данный метод заменяет штатную запись результатов Allure (AllureFileLogger, регистрируемый плагином allure-pytest)
+    фоновой записью (BackgroundAllureFileLogger). Должен вызываться после pytest_configure плагина allure-pytest.
+    Если отчёт Allure не формируется (не передан параметр --alluredir), то метод ничего не делает.
+
+    :param config: Объект конфигурации pytest.
+    :param queue_size: Максимальное количество записей в очереди.
+    :return: Метод ничего не возвращает.
+    """
+    file_loggers = [
+        plugin for plugin in allure_commons.plugin_manager.get_plugins() if isinstance(plugin, AllureFileLogger)
+    ]
+    for file_logger in file_loggers:
+        background_file_logger = BackgroundAllureFileLogger(file_logger, queue_size)
+        allure_commons.plugin_manager.unregister(file_logger)
+        allure_commons.plugin_manager.register(background_file_logger)
+        atexit.register(background_file_logger.close)
+
+        def uninstall(file_logger=file_logger, background_file_logger=background_file_logger):
+            # Штатный экземпляр регистрируется обратно, так как allure-pytest снимает его с регистрации при
+            # завершении своей работы.
+            background_file_logger.close()
+            allure_commons.plugin_manager.unregister(background_file_logger)
+            allure_commons.plugin_manager.register(file_logger)
+
+        config.add_cleanup(uninstall)
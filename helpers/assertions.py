@@ -1,8 +1,17 @@
-from typing import Any
+import csv
+import io
+from typing import Any, Callable, NamedTuple
 
 import allure
+import operator
 from enum import Enum, auto
 
+from data.framework_variables import FrameworkVariables as FrVars
+from helpers.allure_report import attach_text_to_report
+
+BULK_ASSERTION_FAILURES_IN_MESSAGE = 10
+''' Количество несовпадений, перечисляемых в тексте ошибки агрегированного массового сравнения '''
+
 
 class AssertionModes(Enum):
     """ Данный класс содержит возможные режимы сравнения значений, производимых функцией make_simple_assertion() """
@@ -25,6 +34,48 @@ class AssertionModes(Enum):
     ACTUAL_VALUE_GREATER_THAN_EXPECTED_OR_EQUAL_TO_IT = auto()
     """ Проверка большинства фактического значения над ожидаемым значением либо равенства ему """
 
+
+class _AssertionOperation(NamedTuple):
+    check: Callable[[Any, Any], bool]
+    description: str
+    failure_message: str
+
+
+_ASSERTION_OPERATIONS = {
+    AssertionModes.VALUES_ARE_EQUAL: _AssertionOperation(
+        operator.eq,
+        'Проверка эквивалентности значений',
+        'Значения сравнения "{assertion_name}" должны быть эквивалентны.'
+    ),
+    AssertionModes.VALUES_ARE_NOT_EQUAL: _AssertionOperation(
+        operator.ne,
+        'Проверка отсутствия эквивалентности значений',
+        'Значения сравнения "{assertion_name}" не должны быть эквивалентны.'
+    ),
+    AssertionModes.EXPECTED_VALUE_GREATER_THAN_ACTUAL: _AssertionOperation(
+        operator.gt,
+        'Проверка большинства ожидаемого значения над фактическим значением',
+        'Фактическое значение сравнения "{assertion_name}" должно быть меньше ожидаемого.'
+    ),
+    AssertionModes.EXPECTED_VALUE_GREATER_THAN_ACTUAL_OR_EQUAL_TO_IT: _AssertionOperation(
+        operator.ge,
+        'Проверка большинства ожидаемого значения над фактическим значением либо равенства ему',
+        'Фактическое значение сравнения "{assertion_name}" должно быть меньше ожидаемого либо равно ему.'
+    ),
+    AssertionModes.ACTUAL_VALUE_GREATER_THAN_EXPECTED: _AssertionOperation(
+        operator.lt,
+        'Проверка большинства фактического значения над ожидаемым значением',
+        'Фактическое значение сравнения "{assertion_name}" должно быть больше ожидаемого.'
+    ),
+    AssertionModes.ACTUAL_VALUE_GREATER_THAN_EXPECTED_OR_EQUAL_TO_IT: _AssertionOperation(
+        operator.le,
+        'Проверка большинства фактического значения над ожидаемым значением либо равенства ему',
+        'Фактическое значение сравнения "{assertion_name}" должно быть больше ожидаемого либо равно ему.'
+    ),
+}
+''' Проверки и тексты режимов сравнения (общие для make_simple_assertion и make_bulk_assertion) '''
+
+
 class AssertionBundle:
     """ Данный класс представляет собой коллекцию данных для массовой проверки.
 
@@ -74,6 +125,8 @@ def make_simple_assertion(
         допустимых режимов.
     :returns: Метод ничего не возвращает.
     """
+    operation = _ASSERTION_OPERATIONS.get(mode)
+
     with allure.step(assertion_name):
 
         def make_attachment(
@@ -89,93 +142,111 @@ def make_simple_assertion(
                           f"Операция: {attachment_operation}",
                           "Детали сравнения")
 
-        match mode:
-
-            case AssertionModes.VALUES_ARE_EQUAL:
-                try:
-                    operation = 'Проверка эквивалентности значений'
-                    assert expected_value == actual_value
-                    make_attachment(expected_value, actual_value, operation)
-                except Exception as e:
-                    make_attachment(expected_value, actual_value, operation)
-                    raise AssertionError(
-                        f"Значения сравнения \"{assertion_name}\" должны быть эквивалентны.\n{e}"
-                    )
-
-            case AssertionModes.VALUES_ARE_NOT_EQUAL:
-                try:
-                    operation = 'Проверка отсутствия эквивалентности значений'
-                    assert expected_value != actual_value
-                    make_attachment(
-                        expected_value,
-                        actual_value,
-                        operation,
-                        attachment_expected_value_label = "Недопустимое значение"
-                    )
-                except Exception as e:
-                    make_attachment(expected_value, actual_value, operation)
-                    raise AssertionError(
-                        f"Значения сравнения \"{assertion_name}\" не должны быть эквивалентны.\n{e}"
-                    )
-
-            case AssertionModes.EXPECTED_VALUE_GREATER_THAN_ACTUAL:
-                try:
-                    operation = 'Проверка большинства ожидаемого значения над фактическим значением'
-                    assert expected_value > actual_value
-                    make_attachment(expected_value, actual_value, operation)
-                except Exception as e:
-                    make_attachment(expected_value, actual_value, operation)
-                    raise AssertionError(
-                        f"Фактическое значение сравнения \"{assertion_name}\" должно быть меньше ожидаемого.\n{e}"
-                    )
-
-            case AssertionModes.EXPECTED_VALUE_GREATER_THAN_ACTUAL_OR_EQUAL_TO_IT:
-                try:
-                    operation = 'Проверка большинства ожидаемого значения над фактическим значением либо равенства ему'
-                    assert expected_value >= actual_value
-                    make_attachment(expected_value, actual_value, operation)
-                except Exception as e:
-                    make_attachment(expected_value, actual_value, operation)
-                    raise AssertionError(
-                        f"Фактическое значение сравнения \"{assertion_name}\" должно быть меньше ожидаемого либо равно "
-                        f"ему.\n{e}"
-                    )
-
-            case AssertionModes.ACTUAL_VALUE_GREATER_THAN_EXPECTED:
-                try:
-                    operation = 'Проверка большинства фактического значения над ожидаемым значением'
-                    assert expected_value < actual_value
-                    make_attachment(expected_value, actual_value, operation)
-                except Exception as e:
-                    make_attachment(expected_value, actual_value, operation)
-                    raise AssertionError(
-                        f"Фактическое значение сравнения \"{assertion_name}\" должно быть больше ожидаемого.\n{e}"
-                    )
-
-            case AssertionModes.ACTUAL_VALUE_GREATER_THAN_EXPECTED_OR_EQUAL_TO_IT:
-                try:
-                    operation = 'Проверка большинства фактического значения над ожидаемым значением либо равенства ему'
-                    assert expected_value <= actual_value
-                    make_attachment(expected_value, actual_value, operation)
-                except Exception as e:
-                    make_attachment(expected_value, actual_value, operation)
-                    raise AssertionError(
-                        f"Фактическое значение сравнения \"{assertion_name}\" должно быть больше ожидаемого либо равно "
-                        f"ему.\n{e}"
-                    )
-
-            case _:
-                raise ValueError(
-                    f"Режим сравнения \"{mode}\" не является допустимым."
+        if operation is None:
+            raise ValueError(
+                f"Режим сравнения \"{mode}\" не является допустимым."
+            )
+
+        try:
+            assert operation.check(expected_value, actual_value)
+            if mode is AssertionModes.VALUES_ARE_NOT_EQUAL:
+                make_attachment(
+                    expected_value,
+                    actual_value,
+                    operation.description,
+                    attachment_expected_value_label="Недопустимое значение"
                 )
+            else:
+                make_attachment(expected_value, actual_value, operation.description)
+        except Exception as e:
+            make_attachment(expected_value, actual_value, operation.description)
+            raise AssertionError(f"{operation.failure_message.format(assertion_name=assertion_name)}\n{e}")
 
 
-def make_bulk_assertion(data: list[AssertionBundle], group_name: str = "Сравнение группы данных"):
-    with allure.step(group_name):
-        for bundle in data:
-            make_simple_assertion(
-                expected_value=bundle.expected_value,
-                actual_value=bundle.actual_value,
-                assertion_name=bundle.assertion_name,
-                mode=bundle.assertion_mode
+def make_bulk_assertion(
+        data: list[AssertionBundle],
+        group_name: str = "Сравнение группы данных",
+        aggregated: bool | None = None
+):
+    """
+    Данный метод обеспечивает массовое сравнение данных.
+
+    Метод имеет два режима:
+
+    - пошаговый: каждое сравнение производится методом make_simple_assertion (отдельный шаг отчёта с деталями
+      сравнения), проверка прекращается на первом несовпадении;
+    - агрегированный: все сравнения производятся за один проход без создания шагов отчёта, несовпадения
+      накапливаются, а к отчёту прикрепляется одна сводная таблица (количество успешных сравнений и строки
+      несовпавших сравнений). Режим предназначен для больших наборов данных, для которых создание шага и вложения
+      на каждое сравнение занимает больше времени, чем сами сравнения.
+
+    :param data: Список наборов данных для сравнения.
+    :param group_name: Название группы сравнений в отчёте.
+    :param aggregated: Признак агрегированного режима. По умолчанию агрегированный режим применяется, если количество
+        сравнений превышает BULK_ASSERTION_AGGREGATION_THRESHOLD.
+    :raises AssertionError: Ошибка, возвращаемая при несовпадении (в агрегированном режиме - после выполнения всех
+        сравнений, с перечнем всех несовпадений).
+    :returns: Метод ничего не возвращает.
+    """
+    if aggregated is None:
+        aggregated = len(data) > int(FrVars.BULK_ASSERTION_AGGREGATION_THRESHOLD)
+
+    if not aggregated:
+        with allure.step(group_name):
+            for bundle in data:
+                make_simple_assertion(
+                    expected_value=bundle.expected_value,
+                    actual_value=bundle.actual_value,
+                    assertion_name=bundle.assertion_name,
+                    mode=bundle.assertion_mode
+                )
+        return
+
+    failures = []
+    for index, bundle in enumerate(data, start=1):
+        operation = _ASSERTION_OPERATIONS.get(bundle.assertion_mode)
+        if operation is None:
+            raise ValueError(
+                f"Режим сравнения \"{bundle.assertion_mode}\" не является допустимым."
+            )
+        try:
+            if operation.check(bundle.expected_value, bundle.actual_value):
+                continue
+            error = ""
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        failures.append((index, bundle, operation, error))
+
+    passed_count = len(data) - len(failures)
+    with allure.step(f"{group_name}: успешно {passed_count} из {len(data)}"):
+        if not failures:
+            return
+
+        table = io.StringIO()
+        writer = csv.writer(table)
+        writer.writerow(
+            ["№", "Название сравнения", "Ожидаемое значение", "Фактическое значение", "Операция", "Ошибка сравнения"]
+        )
+        for index, bundle, operation, error in failures:
+            writer.writerow([
+                index,
+                bundle.assertion_name,
+                f"[{type(bundle.expected_value).__name__}] {bundle.expected_value}",
+                f"[{type(bundle.actual_value).__name__}] {bundle.actual_value}",
+                operation.description,
+                error
+            ])
+        attach_text_to_report(table.getvalue(), "Несовпавшие сравнения", attachment_type=allure.attachment_type.CSV)
+
+        failure_messages = [
+            operation.failure_message.format(assertion_name=bundle.assertion_name) + (f" {error}" if error else "")
+            for _, bundle, operation, error in failures[:BULK_ASSERTION_FAILURES_IN_MESSAGE]
+        ]
+        if len(failures) > BULK_ASSERTION_FAILURES_IN_MESSAGE:
+            failure_messages.append(
+                f"... и ещё {len(failures) - BULK_ASSERTION_FAILURES_IN_MESSAGE} (см. вложение «Несовпавшие сравнения»)"
             )
+        raise AssertionError(
+            f"Группа сравнений \"{group_name}\": не совпало {len(failures)} из {len(data)}.\n"
+            + "\n".join(failure_messages)
+        )
@@ -0,0 +1,48 @@
+import asyncio
+
+import httpx
+
+from data.framework_variables import FrameworkVariables as FrVars
+
+
+class AsyncHttpClient(httpx.AsyncClient):
+    """
+    Данный класс представляет собой асинхронный HTTP-клиент фреймворка с пулом keep-alive соединений.
+
+    Клиент предназначен для асинхронных фикстур, в которых независимые запросы (например, создание нескольких
+    пользователей) отправляются одновременно. Его методы (get, post, patch, delete, request) принимают аргументы
+    url, headers и json так же, как и синхронный HttpClient.
+    """
+
+    def __init__(self, pool_size: int | None = None):
+        """
+        :param pool_size: Максимальное количество одновременно удерживаемых соединений с сервером приложения.
+            Если значение не передано, то используется значение переменной HTTP_POOL_SIZE.
+        """
+        self.pool_size = int(pool_size or FrVars.HTTP_POOL_SIZE)
+        super().__init__(
+            limits=httpx.Limits(
+                max_connections=self.pool_size,
+                max_keepalive_connections=self.pool_size
+            ),
+            timeout=httpx.Timeout(float(FrVars.HTTP_TIMEOUT_IN_SECONDS))
+        )
+
+    async def warm_up(self, connections: int | None = None) -> None:
+        """
+        Данный метод заранее открывает соединения с сервером приложения запросами GET /v1/users/me без токена доступа.
+
+        :param connections: Количество соединений, которые необходимо открыть.
+            Если значение не передано, то используется значение переменной HTTP_POOL_WARMUP_CONNECTIONS.
+        :return: Метод ничего не возвращает.
+        """
+        connections = min(int(connections or FrVars.HTTP_POOL_WARMUP_CONNECTIONS), self.pool_size)
+
+        async def send_warm_up_request():
+            try:
+                await self.get(url=FrVars.APP_HOST + "/v1/users/me")
+            except httpx.HTTPError:
+                # Недоступность сервера на этапе прогрева не должна прерывать сессию: тесты сообщат о ней сами.
+                pass
+
+        await asyncio.gather(*(send_warm_up_request() for _ in range(connections)))
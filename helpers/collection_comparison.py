@@ -0,0 +1,203 @@
+import csv
+import io
+from typing import Any, Callable, Iterable, NamedTuple
+
+import allure
+from pydantic import BaseModel
+
+from helpers.allure_report import attach_text_to_report
+
+COLLECTION_DIFFERENCES_IN_MESSAGE = 10
+''' Количество расхождений, перечисляемых в тексте ошибки сравнения коллекций '''
+
+_ABSENT = object()
+
+
+class RecordMismatch(NamedTuple):
+    """
+    Расхождение значения одного поля записи, присутствующей в обеих коллекциях.
+    """
+    key: str
+    field: str
+    expected_value: Any
+    actual_value: Any
+
+
+class CollectionComparison(NamedTuple):
+    """
+    Результат сравнения коллекций записей.
+    """
+    matched_count: int
+    ''' Количество записей, присутствующих в обеих коллекциях и совпавших по всем полям '''
+    missing: list
+    ''' Записи ожидаемой коллекции, отсутствующие в фактической '''
+    extra: list
+    ''' Записи фактической коллекции, отсутствующие в ожидаемой '''
+    mismatches: list[RecordMismatch]
+    ''' Расхождения полей записей, присутствующих в обеих коллекциях '''
+    duplicated_keys: list[str]
+    ''' Ключи, встречающиеся в одной из коллекций более одного раза '''
+
+    @property
+    def is_equal(self) -> bool:
+        return not (self.missing or self.extra or self.mismatches or self.duplicated_keys)
+
+
+def compare_collections(
+        expected: Iterable,
+        actual: Iterable,
+        key: str | Callable[[Any], Any] = "id",
+        fields: Iterable[str] | None = None
+) -> CollectionComparison:
+    """
+    Данный метод сравнивает две коллекции записей (pydantic-моделей, словарей или namedtuple) по первичному ключу.
+
+    Ожидаемая коллекция индексируется по ключу, после чего фактическая коллекция проходится один раз, поэтому время
+    сравнения линейно зависит от размера коллекций, а порядок записей в коллекциях не важен. Фактическая коллекция
+    может быть генератором (например, порционным чтением из БД) и не хранится в памяти целиком.
+
+    Значения ключей приводятся к строке, чтобы UUID из БД совпадали с ID из ответа, не приведёнными к UUID.
+
+    :param expected: Ожидаемая коллекция записей.
+    :param actual: Фактическая коллекция записей.
+    :param key: Название поля первичного ключа, либо функция, возвращающая ключ записи.
+    :param fields: Сравниваемые поля. По умолчанию сравниваются все поля первой записи ожидаемой коллекции,
+        кроме поля ключа.
+    :return: Результат сравнения.
+    """
+    get_key = key if callable(key) else (lambda record: _get_field_value(record, key))
+
+    expected_index = {}
+    duplicated_keys = {}
+    for record in expected:
+        record_key = str(get_key(record))
+        if record_key in expected_index:
+            duplicated_keys[record_key] = None
+        else:
+            expected_index[record_key] = record
+
+    if fields is None:
+        first_record = next(iter(expected_index.values()), None)
+        fields = [field for field in _get_record_fields(first_record) if callable(key) or field != key]
+    else:
+        fields = list(fields)
+
+    matched_count = 0
+    extra = []
+    mismatches = []
+    actual_keys = set()
+    for record in actual:
+        record_key = str(get_key(record))
+        if record_key in actual_keys:
+            duplicated_keys[record_key] = None
+            continue
+        actual_keys.add(record_key)
+        expected_record = expected_index.pop(record_key, _ABSENT)
+        if expected_record is _ABSENT:
+            extra.append(record)
+            continue
+
+        record_mismatches = [
+            RecordMismatch(record_key, field, expected_value, actual_value)
+            for field in fields
+            if (expected_value := _get_field_value(expected_record, field))
+            != (actual_value := _get_field_value(record, field))
+        ]
+        if record_mismatches:
+            mismatches.extend(record_mismatches)
+        else:
+            matched_count += 1
+
+    return CollectionComparison(
+        matched_count=matched_count,
+        missing=list(expected_index.values()),
+        extra=extra,
+        mismatches=mismatches,
+        duplicated_keys=list(duplicated_keys)
+    )
+
+
+def make_collection_assertion(
+        expected: Iterable,
+        actual: Iterable,
+        assertion_name: str,
+        key: str | Callable[[Any], Any] = "id",
+        fields: Iterable[str] | None = None
+) -> CollectionComparison:
+    """
+    Данный метод сравнивает две коллекции записей методом compare_collections и отражает результат в отчёте одним
+    шагом. При наличии расхождений к шагу прикрепляется таблица расхождений (отсутствующие и лишние записи,
+    расхождения полей, повторяющиеся ключи).
+
+    :param expected: Ожидаемая коллекция записей.
+    :param actual: Фактическая коллекция записей.
+    :param assertion_name: Название сравнения в отчёте.
+    :param key: Название поля первичного ключа, либо функция, возвращающая ключ записи.
+    :param fields: Сравниваемые поля (см. compare_collections).
+    :raises AssertionError: Ошибка, возвращаемая при наличии расхождений между коллекциями.
+    :return: Результат сравнения.
+    """
+    get_key = key if callable(key) else (lambda record: _get_field_value(record, key))
+    comparison = compare_collections(expected=expected, actual=actual, key=key, fields=fields)
+
+    differences = [
+        *((str(get_key(record)), "Отсутствует в фактических данных", "", record, "") for record in comparison.missing),
+        *((str(get_key(record)), "Отсутствует в ожидаемых данных", "", "", record) for record in comparison.extra),
+        *((mismatch.key, "Расхождение значения поля", mismatch.field, mismatch.expected_value, mismatch.actual_value)
+          for mismatch in comparison.mismatches),
+        *((duplicated_key, "Ключ повторяется", "", "", "") for duplicated_key in comparison.duplicated_keys)
+    ]
+
+    step_name = f"{assertion_name}: совпало записей - {comparison.matched_count}, расхождений - {len(differences)}"
+    with allure.step(step_name):
+        if comparison.is_equal:
+            return comparison
+
+        table = io.StringIO()
+        writer = csv.writer(table)
+        writer.writerow(["Ключ", "Расхождение", "Поле", "Ожидаемое значение", "Фактическое значение"])
+        writer.writerows(
+            (record_key, difference, field, _format_value(expected_value), _format_value(actual_value))
+            for record_key, difference, field, expected_value, actual_value in differences
+        )
+        attach_text_to_report(table.getvalue(), "Расхождения коллекций", attachment_type=allure.attachment_type.CSV)
+
+        differences_messages = [
+            f"{record_key}: {difference}" + (f" \"{field}\"" if field else "")
+            for record_key, difference, field, _, _ in differences[:COLLECTION_DIFFERENCES_IN_MESSAGE]
+        ]
+        if len(differences) > COLLECTION_DIFFERENCES_IN_MESSAGE:
+            differences_messages.append(
+                f"... и ещё {len(differences) - COLLECTION_DIFFERENCES_IN_MESSAGE} "
+                f"(см. вложение «Расхождения коллекций»)"
+            )
+        raise AssertionError(
+            f"Коллекции сравнения \"{assertion_name}\" должны совпадать. Отсутствует в фактических данных: "
+            f"{len(comparison.missing)}, отсутствует в ожидаемых данных: {len(comparison.extra)}, расхождений полей: "
+            f"{len(comparison.mismatches)}, повторяющихся ключей: {len(comparison.duplicated_keys)}.\n"
+            + "\n".join(differences_messages)
+        )
+
+
+def _get_field_value(record, field: str):
+    if isinstance(record, dict):
+        return record.get(field, _ABSENT)
+    return getattr(record, field, _ABSENT)
+
+
+def _get_record_fields(record) -> list[str]:
+    if record is None:
+        return []
+    if isinstance(record, BaseModel):
+        return list(type(record).model_fields)
+    if isinstance(record, dict):
+        return list(record)
+    return list(record._fields)
+
+
+def _format_value(value) -> str:
+    if value is _ABSENT:
+        return "<поле отсутствует>"
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return str(value)
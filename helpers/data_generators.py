@@ -0,0 +1,37 @@
+import random
+
+from faker import Faker
+
+fake = Faker()
+
+
+def generate_user_data() -> dict:
+    """
+    Данный метод генерирует случайные данные пользователя без прав администратора в формате тела запроса
+    POST /v1/users.
+
+    :return: Словарь с полями email, firstname, middlename, surname и password.
+    """
+    return {
+        "email": fake.email(),
+        "firstname": fake.first_name(),
+        "middlename": random.choice([fake.first_name(), None]),
+        "surname": fake.last_name(),
+        "password": fake.password()
+    }
+
+
+def generate_book_data() -> dict:
+    """
+    Данный метод генерирует случайные данные книги в формате тела запроса POST /v1/books.
+
+    :return: Словарь с полями title, author и isbn.
+    """
+    return {
+        "title": fake.catch_phrase(),
+        "author": fake.name(),
+        "isbn": random.choice([
+            fake.isbn10(separator=""),
+            fake.isbn13(separator="")
+        ])
+    }
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from data.framework_variables import FrameworkVariables as FrVars
+
+
+class HttpClient(requests.Session):
+    """
+    Данный класс представляет собой HTTP-клиент фреймворка, который удерживает открытые (keep-alive) соединения
+    с сервером приложения и переиспользует их между запросами.
+
+    Клиент является наследником requests.Session, поэтому его методы (get, post, patch, delete, request) принимают
+    те же аргументы, что и одноимённые функции модуля requests.
+    """
+
+    def __init__(self, pool_size: int | None = None):
+        """
+        :param pool_size: Максимальное количество одновременно удерживаемых соединений с одним хостом.
+            Если значение не передано, то используется значение переменной HTTP_POOL_SIZE.
+        """
+        super().__init__()
+        self.pool_size = int(pool_size or FrVars.HTTP_POOL_SIZE)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            pool_block=True
+        )
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def warm_up(self, connections: int | None = None) -> None:
+        """
+        Данный метод заранее открывает соединения с сервером приложения, чтобы первые запросы тестов не тратили время
+        на их установку.
+
+        Для прогрева используется запрос GET /v1/users/me без токена доступа: он не изменяет данные приложения
+        и обрабатывается сервером быстрее остальных запросов.
+
+        :param connections: Количество соединений, которые необходимо открыть.
+            Если значение не передано, то используется значение переменной HTTP_POOL_WARMUP_CONNECTIONS.
+        :return: Метод ничего не возвращает.
+        """
+        connections = min(int(connections or FrVars.HTTP_POOL_WARMUP_CONNECTIONS), self.pool_size)
+        if connections < 1:
+            return
+
+        def send_warm_up_request(_):
+            try:
+                self.get(url=FrVars.APP_HOST + "/v1/users/me").close()
+            except requests.RequestException:
+                # Недоступность сервера на этапе прогрева не должна прерывать сессию: тесты сообщат о ней сами.
+                pass
+
+        # Соединения открываются параллельно, иначе все запросы прогрева переиспользуют одно и то же соединение.
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(send_warm_up_request, range(connections)))
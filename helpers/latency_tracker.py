@@ -0,0 +1,167 @@
+import glob
+import json
+import math
+import os
+import re
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from httpx import Response as AsyncResponse
+from requests import Response
+
+UUID_PATTERN = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+NUMERIC_SEGMENT_PATTERN = re.compile(r'(?<=/)\d+(?=/|$)')
+
+
+def make_route_template(url: str) -> str:
+    """
+    Данный метод приводит URL запроса к шаблону маршрута, заменяя идентификаторы в пути на "{id}".
+    Например, "http://127.0.0.1:8080/v1/users/47d9ba5e-7a97-473f-850a-65c422e32279" приводится к "/v1/users/{id}".
+
+    :param url: URL запроса.
+    :return: Шаблон маршрута.
+    """
+    path = urlsplit(str(url)).path or "/"
+    path = UUID_PATTERN.sub("{id}", path)
+    return NUMERIC_SEGMENT_PATTERN.sub("{id}", path)
+
+
+def calculate_percentile(sorted_values: list[float], percentile: float) -> float:
+    """
+    Данный метод вычисляет перцентиль отсортированного списка значений с линейной интерполяцией между соседними
+    значениями.
+
+    :param sorted_values: Отсортированный по возрастанию непустой список значений.
+    :param percentile: Искомый перцентиль (от 0 до 100).
+    :return: Значение перцентиля.
+    """
+    rank = (len(sorted_values) - 1) * percentile / 100
+    lower_index = math.floor(rank)
+    upper_index = math.ceil(rank)
+    lower_value = sorted_values[lower_index]
+    upper_value = sorted_values[upper_index]
+    return lower_value + (upper_value - lower_value) * (rank - lower_index)
+
+
+def summarize_samples(samples: list[float]) -> dict:
+    """
+    Данный метод рассчитывает сводные показатели по списку замеров времени ответа (в миллисекундах).
+
+    :param samples: Непустой список замеров.
+    :return: Словарь с количеством замеров, средним значением, перцентилями p50/p95/p99 и максимальным значением.
+    """
+    sorted_samples = sorted(samples)
+    return {
+        "count": len(sorted_samples),
+        "mean_ms": round(sum(sorted_samples) / len(sorted_samples), 3),
+        "p50_ms": round(calculate_percentile(sorted_samples, 50), 3),
+        "p95_ms": round(calculate_percentile(sorted_samples, 95), 3),
+        "p99_ms": round(calculate_percentile(sorted_samples, 99), 3),
+        "max_ms": round(sorted_samples[-1], 3)
+    }
+
+
+def make_worker_samples_path(summary_path: str, worker_id: str) -> str:
+    """
+    Данный метод возвращает путь к файлу замеров процесса-исполнителя pytest-xdist, расположенному рядом с файлом
+    сводки.
+
+    :param summary_path: Путь к файлу сводки.
+    :param worker_id: Идентификатор процесса-исполнителя (например, "gw0"). Значение "*" возвращает шаблон пути,
+        под который попадают файлы замеров всех исполнителей.
+    :return: Путь к файлу замеров.
+    """
+    return os.path.join(os.path.dirname(summary_path), f"latency-samples-{worker_id}.json")
+
+
+class LatencyTracker:
+    """
+    Данный класс накапливает замеры времени ответа приложения, сгруппированные по методу запроса и шаблону маршрута
+    (например, "GET /v1/users/{id}"), и формирует по ним сводку за запуск.
+    """
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.total_ms = 0.0
+        ''' Суммарное время ответа по всем замерам (используется для учёта времени ожидания HTTP по стадиям тестов) '''
+        self._lock = threading.Lock()
+
+    def record(self, method: str, url: str, elapsed_in_ms: float) -> None:
+        """
+        Метод для сохранения одного замера времени ответа.
+
+        :param method: Метод запроса.
+        :param url: URL запроса.
+        :param elapsed_in_ms: Время ответа в миллисекундах.
+        """
+        key = f"{method.upper()} {make_route_template(url)}"
+        with self._lock:
+            self.samples[key].append(elapsed_in_ms)
+            self.total_ms += elapsed_in_ms
+
+    def record_response(self, response: Response | AsyncResponse) -> None:
+        """
+        Метод для сохранения времени ответа из объекта ответа синхронного (requests) или асинхронного (httpx) клиента.
+
+        :param response: Ответ приложения.
+        """
+        self.record(
+            method=response.request.method,
+            url=str(response.url),
+            elapsed_in_ms=response.elapsed.total_seconds() * 1000
+        )
+
+    def summary(self) -> dict:
+        """
+        Метод для формирования сводки по всем накопленным замерам.
+
+        :return: Словарь, ключами которого являются метод и шаблон маршрута, а значениями - сводные показатели.
+        """
+        with self._lock:
+            samples = {key: list(values) for key, values in self.samples.items()}
+        return {key: summarize_samples(values) for key, values in sorted(samples.items())}
+
+    def write_samples(self, path: str) -> None:
+        """
+        Метод для записи накопленных замеров в JSON-файл (используется процессами-исполнителями pytest-xdist,
+        чтобы управляющий процесс мог сформировать общую сводку).
+
+        :param path: Путь к файлу замеров.
+        """
+        with self._lock:
+            samples = {key: list(values) for key, values in self.samples.items()}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(samples, f)
+
+    def merge_samples_files(self, pattern: str) -> None:
+        """
+        Метод для добавления замеров из файлов, ранее записанных методом write_samples. Прочитанные файлы удаляются.
+
+        :param pattern: Шаблон пути к файлам замеров.
+        """
+        for path in glob.glob(pattern):
+            with open(path, encoding="utf-8") as f:
+                samples = json.load(f)
+            with self._lock:
+                for key, values in samples.items():
+                    self.samples[key].extend(values)
+            os.remove(path)
+
+    def write_summary(self, path: str) -> dict:
+        """
+        Метод для записи сводки в JSON-файл.
+
+        :param path: Путь к файлу сводки.
+        :return: Записанная сводка.
+        """
+        summary = self.summary()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=3, ensure_ascii=False)
+        return summary
+
+
+latency_tracker = LatencyTracker()
+''' Общий для всей сессии экземпляр LatencyTracker, в который attach_request_data_to_report записывает замеры '''
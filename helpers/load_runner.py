@@ -0,0 +1,177 @@
+import asyncio
+import contextlib
+import time
+from collections import defaultdict
+
+import httpx
+
+from data.framework_variables import FrameworkVariables as FrVars
+from helpers.async_http_client import AsyncHttpClient
+from helpers.data_generators import generate_book_data
+from helpers.latency_tracker import LatencyTracker, make_route_template, summarize_samples
+from helpers.validate_response import validate_response
+from models.authorization import AuthSuccessfulResponse
+from models.books import MultipleBooks, CreateBookSuccessfulResponse, DeleteBookSuccessfulResponse
+from models.load import LoadRunReport, LoadEndpointStatistics
+from models.users import CreatedUserDataBundle, GetUserDataSuccessfulResponse
+
+ERRORS_SAMPLES_LIMIT = 20
+''' Максимальное количество текстов ошибок, сохраняемых в отчёт о нагрузочном запуске '''
+
+
+class LoadStepError(Exception):
+    """ Исключение, прерывающее итерацию сценария виртуального пользователя при ошибке одного из шагов. """
+
+
+class LoadRunner:
+    """
+    Данный класс реализует нагрузочный запуск: несколько виртуальных пользователей одновременно и в течение заданного
+    времени повторяют сценарий функциональных тестов - авторизация, обновление токенов, запрос списка книг, запрос
+    информации о себе, создание и удаление книги, выход из учётной записи.
+
+    Тела запросов формируются теми же генераторами, что и в фикстурах, а ответы проверяются функцией
+    validate_response по тем же моделям, что и в функциональных тестах.
+    """
+
+    def __init__(
+            self,
+            virtual_users: list[CreatedUserDataBundle],
+            administrator_access_token: str,
+            duration_in_seconds: float
+    ):
+        """
+        :param virtual_users: Данные пользователей, от имени которых работают виртуальные пользователи
+            (по одному пользователю на каждого виртуального пользователя).
+        :param administrator_access_token: Токен доступа администратора, необходимый для создания и удаления книг.
+        :param duration_in_seconds: Длительность нагрузки (в секундах).
+        """
+        self.virtual_users = virtual_users
+        self.administrator_access_token = administrator_access_token
+        self.duration_in_seconds = float(duration_in_seconds)
+        self.error_backoff_in_seconds = float(FrVars.LOAD_ERROR_BACKOFF_IN_SECONDS)
+        self.latency = LatencyTracker()
+        self.requests_count: dict[str, int] = defaultdict(int)
+        self.errors_count: dict[str, int] = defaultdict(int)
+        self.errors_samples: list[str] = []
+        self.iterations = 0
+
+    async def run(self) -> LoadRunReport:
+        """
+        Метод для проведения нагрузочного запуска.
+
+        :return: Отчёт о нагрузочном запуске.
+        """
+        async with AsyncHttpClient(pool_size=max(len(self.virtual_users) * 2, 1)) as client:
+            started_at = time.perf_counter()
+            deadline = started_at + self.duration_in_seconds
+            await asyncio.gather(*(
+                self._run_virtual_user(client, user, deadline) for user in self.virtual_users
+            ))
+            actual_duration = time.perf_counter() - started_at
+
+        return self._make_report(actual_duration)
+
+    async def _run_virtual_user(self, client: AsyncHttpClient, user: CreatedUserDataBundle, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            try:
+                await self._run_iteration(client, user)
+                self.iterations += 1
+            except LoadStepError:
+                # Пауза после ошибки не даёт виртуальному пользователю повторять сценарий без задержки, если
+                # приложение недоступно.
+                await asyncio.sleep(min(self.error_backoff_in_seconds, max(deadline - time.perf_counter(), 0)))
+
+    async def _run_iteration(self, client: AsyncHttpClient, user: CreatedUserDataBundle) -> None:
+        tokens = await self._send(
+            client, AuthSuccessfulResponse, "POST", "/v1/authorize",
+            json={"email": user.email, "password": user.password}
+        )
+        # Обновление токенов отзывает исходную пару, поэтому дальше используется новая пара токенов.
+        tokens = await self._send(
+            client, AuthSuccessfulResponse, "POST", "/v1/refresh",
+            json={"refresh_token": tokens.refresh_token}
+        )
+        user_headers = {"Access-Token": tokens.access_token}
+        administrator_headers = {"Access-Token": self.administrator_access_token}
+
+        try:
+            await self._send(client, MultipleBooks, "GET", "/v1/books", headers=user_headers)
+            await self._send(client, GetUserDataSuccessfulResponse, "GET", "/v1/users/me", headers=user_headers)
+
+            created_book = await self._send(
+                client, CreateBookSuccessfulResponse, "POST", "/v1/books",
+                headers=administrator_headers, json=generate_book_data()
+            )
+            book_deleted = False
+            try:
+                await self._send(
+                    client, DeleteBookSuccessfulResponse, "DELETE", f"/v1/books/{created_book.book_id}",
+                    headers=administrator_headers
+                )
+                book_deleted = True
+            finally:
+                if not book_deleted:
+                    # Повторный запрос не учитывается в статистике: он лишь не оставляет созданную книгу в БД.
+                    with contextlib.suppress(httpx.HTTPError):
+                        await client.delete(
+                            url=FrVars.APP_HOST + f"/v1/books/{created_book.book_id}",
+                            headers=administrator_headers
+                        )
+        finally:
+            await self._send(client, None, "DELETE", "/v1/logout", headers=user_headers)
+
+    async def _send(self, client: AsyncHttpClient, model, method: str, path: str, **kwargs):
+        url = FrVars.APP_HOST + path
+        key = f"{method} {make_route_template(url)}"
+        self.requests_count[key] += 1
+        try:
+            res = await client.request(method=method, url=url, **kwargs)
+        except httpx.HTTPError as e:
+            self._register_error(key, f"{key}: {type(e).__name__} {e}")
+            raise LoadStepError() from e
+
+        self.latency.record(method=method, url=url, elapsed_in_ms=res.elapsed.total_seconds() * 1000)
+
+        if res.status_code != 200:
+            self._register_error(key, f"{key}: unexpected status code {res.status_code}\n{res.text}")
+            raise LoadStepError()
+        if model is None:
+            return None
+        try:
+            return validate_response(model=model, response=res, attach_to_report=False)
+        except AssertionError as e:
+            self._register_error(key, f"{key}: {e}")
+            raise LoadStepError() from e
+
+    def _register_error(self, key: str, error_text: str) -> None:
+        self.errors_count[key] += 1
+        if len(self.errors_samples) < ERRORS_SAMPLES_LIMIT:
+            self.errors_samples.append(error_text)
+
+    def _make_report(self, actual_duration: float) -> LoadRunReport:
+        latency_summary = self.latency.summary()
+        empty_summary = {"count": 0, "mean_ms": 0, "p50_ms": 0, "p95_ms": 0, "p99_ms": 0, "max_ms": 0}
+
+        endpoints = {}
+        for key in sorted(self.requests_count):
+            endpoint_summary = dict(latency_summary.get(key, empty_summary))
+            endpoint_summary["count"] = self.requests_count[key]
+            endpoints[key] = LoadEndpointStatistics(errors=self.errors_count[key], **endpoint_summary)
+
+        total_requests = sum(self.requests_count.values())
+        failed_requests = sum(self.errors_count.values())
+        all_samples = [sample for samples in self.latency.samples.values() for sample in samples]
+        overall_summary = summarize_samples(all_samples) if all_samples else dict(empty_summary)
+        overall_summary["count"] = total_requests
+
+        return LoadRunReport(
+            virtual_users=len(self.virtual_users),
+            duration_in_seconds=round(actual_duration, 3),
+            iterations=self.iterations,
+            total_requests=total_requests,
+            failed_requests=failed_requests,
+            throughput_rps=round(total_requests / actual_duration, 3) if actual_duration > 0 else 0,
+            overall=LoadEndpointStatistics(errors=failed_requests, **overall_summary),
+            endpoints=endpoints,
+            errors_samples=self.errors_samples
+        )
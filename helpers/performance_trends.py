@@ -0,0 +1,279 @@
+import json
+import os
+import sqlite3
+import statistics
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+import allure_commons
+from allure_commons.model2 import TestResult, Attachment, Label, Status, StatusDetails
+from allure_commons.utils import now, uuid4
+
+from helpers.phase_timing import TEST_PHASES
+
+COMPARED_LATENCY_METRICS = ("p50_ms", "p95_ms")
+''' Показатели времени ответа эндпоинтов, сохраняемые в хранилище и сравниваемые с базовой линией '''
+
+MAD_TO_STANDARD_DEVIATION = 1.4826
+''' Коэффициент приведения медианного абсолютного отклонения к стандартному отклонению нормального распределения '''
+
+TRENDS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        finished_at TEXT NOT NULL,
+        app_host TEXT
+    );
+    CREATE TABLE IF NOT EXISTS metrics (
+        run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+        kind TEXT NOT NULL,
+        name TEXT NOT NULL,
+        metric TEXT NOT NULL,
+        value REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS metrics_series_idx ON metrics (kind, name, metric, run_id);
+"""
+
+BASELINE_QUERY = """
+    SELECT kind, name, metric, value FROM (
+        SELECT metrics.kind, metrics.name, metrics.metric, metrics.value,
+            row_number() OVER (
+                PARTITION BY metrics.kind, metrics.name, metrics.metric ORDER BY metrics.run_id DESC
+            ) AS run_number
+        FROM metrics
+        JOIN runs ON runs.id = metrics.run_id
+        WHERE metrics.run_id < ? AND runs.app_host IS ?
+    )
+    WHERE run_number <= ?;
+"""
+
+
+class RunMetric(NamedTuple):
+    """
+    Показатель производительности запуска.
+    """
+    kind: str
+    ''' Вид показателя: "latency" (эндпоинт), "test_duration" (тест) или "test_db_queries" (тест) '''
+    name: str
+    ''' Эндпоинт (метод и шаблон маршрута) или идентификатор теста '''
+    metric: str
+    ''' Название показателя (например, "p95_ms") '''
+    value: float
+
+
+class PerformanceRegression(NamedTuple):
+    """
+    Показатель запуска, значимо превысивший базовую линию.
+    """
+    kind: str
+    name: str
+    metric: str
+    value: float
+    baseline_median: float
+    threshold: float
+    baseline_runs: int
+
+
+def collect_run_metrics(
+        latency_summary: dict,
+        phase_timing_summary: dict,
+        tests_queries_count: dict[str, int]
+) -> list[RunMetric]:
+    """
+    Данный метод собирает показатели производительности запуска из сводок времени ответа эндпоинтов и времени стадий
+    тестов, а также из количества запросов к БД, исполненных каждым тестом.
+
+    Показатели тестов собираются только по тестам, все стадии которых пройдены: время упавших, сломанных
+    и пропущенных тестов не отражает их обычное исполнение. Временем теста считается время стадии исполнения (call),
+    так как в стадию подготовки первого теста каждого процесса-исполнителя входит подготовка фикстур сессии.
+
+    :param latency_summary: Сводка времени ответа эндпоинтов (LatencyTracker.summary).
+    :param phase_timing_summary: Сводка времени стадий тестов (PhaseTimingTracker.summary).
+    :param tests_queries_count: Количество запросов к БД по тестам (QueryTracker.tests_queries_count).
+    :return: Список показателей запуска.
+    """
+    passed_tests = {
+        test_id: phases for test_id, phases in phase_timing_summary["tests"].items()
+        if set(phases) == set(TEST_PHASES) and all(phase.get("outcome") == "passed" for phase in phases.values())
+    }
+    metrics = [
+        RunMetric("latency", endpoint, metric, endpoint_summary[metric])
+        for endpoint, endpoint_summary in latency_summary.items()
+        for metric in COMPARED_LATENCY_METRICS
+    ]
+    metrics.extend(
+        RunMetric("test_duration", test_id, "call_ms", phases["call"]["total_ms"])
+        for test_id, phases in passed_tests.items()
+    )
+    metrics.extend(
+        RunMetric("test_db_queries", test_id, "count", queries_count)
+        for test_id, queries_count in tests_queries_count.items()
+        if test_id in passed_tests
+    )
+    return metrics
+
+
+def find_regressions(
+        metrics: list[RunMetric],
+        baseline: dict[tuple[str, str, str], list[float]],
+        min_baseline_runs: int,
+        mad_multiplier: float,
+        min_relative_increase: float
+) -> tuple[int, list[PerformanceRegression]]:
+    """
+    Данный метод сравнивает показатели запуска с базовой линией - значениями тех же показателей в предыдущих запусках.
+
+    Показатель считается регрессией, если он превышает медиану базовой линии одновременно:
+
+    - больше чем на mad_multiplier приведённых медианных абсолютных отклонений (устойчивый к единичным выбросам
+      аналог правила "трёх сигм"), то есть превышение не объясняется обычным разбросом значений;
+    - больше чем на min_relative_increase от медианы, чтобы не отмечать незначительные по величине изменения
+      стабильных показателей (например, количества запросов, у которых разброс равен нулю).
+
+    :param metrics: Показатели запуска.
+    :param baseline: Значения показателей в предыдущих запусках (ключ - вид, название и показатель).
+    :param min_baseline_runs: Минимальное количество предыдущих запусков, при котором показатель сравнивается.
+    :param mad_multiplier: Допустимое количество приведённых медианных абсолютных отклонений.
+    :param min_relative_increase: Минимальное относительное превышение медианы (например, 0.2 - на 20%).
+    :return: Количество показателей, сравнённых с базовой линией, и список регрессий в порядке убывания
+        относительного превышения.
+    """
+    compared_metrics_count = 0
+    regressions = []
+    for metric in metrics:
+        baseline_values = baseline.get((metric.kind, metric.name, metric.metric), [])
+        if len(baseline_values) < min_baseline_runs:
+            continue
+        compared_metrics_count += 1
+        median = statistics.median(baseline_values)
+        deviation = MAD_TO_STANDARD_DEVIATION * statistics.median(abs(value - median) for value in baseline_values)
+        threshold = max(median + mad_multiplier * deviation, median * (1 + min_relative_increase))
+        if metric.value > threshold:
+            regressions.append(PerformanceRegression(
+                kind=metric.kind,
+                name=metric.name,
+                metric=metric.metric,
+                value=metric.value,
+                baseline_median=round(median, 3),
+                threshold=round(threshold, 3),
+                baseline_runs=len(baseline_values)
+            ))
+    regressions.sort(key=lambda item: item.value / (item.baseline_median or 1), reverse=True)
+    return compared_metrics_count, regressions
+
+
+class PerformanceTrendStore:
+    """
+    Данный класс представляет собой хранилище показателей производительности запусков в файле SQLite.
+
+    Каждый запуск сохраняется отдельной записью таблицы runs, а его показатели - записями таблицы metrics. Базовой
+    линией показателя служат его значения в последних запусках, предшествующих текущему.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к файлу хранилища. Файл и директория создаются при первом обращении.
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON;")
+        self.connection.executescript(TRENDS_SCHEMA)
+
+    def record_run(self, metrics: list[RunMetric], app_host: str | None = None) -> int:
+        """
+        Метод для сохранения показателей запуска.
+
+        :param metrics: Показатели запуска.
+        :param app_host: Адрес тестируемого приложения.
+        :return: Идентификатор сохранённого запуска.
+        """
+        with self.connection:
+            run_id = self.connection.execute(
+                "INSERT INTO runs (finished_at, app_host) VALUES (?, ?);",
+                (datetime.now(timezone.utc).isoformat(timespec="seconds"), app_host)
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO metrics (run_id, kind, name, metric, value) VALUES (?, ?, ?, ?, ?);",
+                [(run_id, *metric) for metric in metrics]
+            )
+        return run_id
+
+    def get_baseline(
+            self,
+            run_id: int,
+            runs_count: int,
+            app_host: str | None = None
+    ) -> dict[tuple[str, str, str], list[float]]:
+        """
+        Метод для получения базовой линии показателей - их значений в последних запусках против того же приложения,
+        предшествующих указанному.
+
+        :param run_id: Идентификатор текущего запуска.
+        :param runs_count: Количество последних запусков, составляющих базовую линию.
+        :param app_host: Адрес тестируемого приложения: учитываются только запуски против него.
+        :return: Словарь, ключами которого являются вид, название и показатель, а значениями - значения показателя.
+        """
+        baseline = {}
+        for kind, name, metric, value in self.connection.execute(BASELINE_QUERY, (run_id, app_host, runs_count)):
+            baseline.setdefault((kind, name, metric), []).append(value)
+        return baseline
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def report_regressions_to_allure(
+        regressions: list[PerformanceRegression],
+        compared_metrics_count: int,
+        baseline_runs_count: int
+) -> None:
+    """
+    Данный метод добавляет в отчёт Allure отдельный результат «Регрессии производительности» (в наборе «Тестовый
+    фреймворк») с перечнем регрессий во вложении. При наличии регрессий результат отмечается как непройденный.
+    Метод предназначен для вызова, только если с базовой линией сравнён хотя бы один показатель.
+    Метод вызывается по завершении сессии, когда результаты тестов уже записаны, поэтому результат записывается
+    напрямую через зарегистрированные средства записи результатов Allure.
+
+    :param regressions: Найденные регрессии.
+    :param compared_metrics_count: Количество показателей, сравнённых с базовой линией.
+    :param baseline_runs_count: Максимальное количество запусков, составляющих базовую линию.
+    :return: Метод ничего не возвращает.
+    """
+    started_at = now()
+    attachment_name = "Регрессии производительности"
+    attachment_file_name = f"{uuid4()}-attachment.json"
+    allure_commons.plugin_manager.hook.report_attached_data(
+        body=json.dumps([regression._asdict() for regression in regressions], indent=3, ensure_ascii=False),
+        file_name=attachment_file_name
+    )
+    if regressions:
+        status = Status.FAILED
+        message = (
+            f"Обнаружено регрессий производительности относительно базовой линии (до {baseline_runs_count} последних "
+            f"запусков): {len(regressions)} из {compared_metrics_count} сравнённых показателей.\n"
+            + "\n".join(
+                f"{regression.kind} {regression.name} {regression.metric}: {regression.value} "
+                f"(медиана {regression.baseline_median}, порог {regression.threshold})"
+                for regression in regressions
+            )
+        )
+    else:
+        status = Status.PASSED
+        message = f"Сравнено показателей с базовой линией: {compared_metrics_count}, регрессий не обнаружено."
+    allure_commons.plugin_manager.hook.report_result(result=TestResult(
+        uuid=uuid4(),
+        name="Регрессии производительности",
+        fullName="performance_trends.regressions",
+        historyId="performance_trends.regressions",
+        status=status,
+        statusDetails=StatusDetails(message=message),
+        description="Сравнение времени ответа эндпоинтов, времени тестов и количества запросов к БД текущего запуска "
+                    "с базовой линией - значениями тех же показателей в предыдущих запусках.",
+        attachments=[Attachment(name=attachment_name, source=attachment_file_name, type="application/json")],
+        labels=[
+            Label(name="parentSuite", value="Тестовый фреймворк"),
+            Label(name="suite", value="Тренды производительности")
+        ],
+        start=started_at,
+        stop=now()
+    ))
@@ -0,0 +1,190 @@
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+from helpers.latency_tracker import latency_tracker, LatencyTracker
+from helpers.query_tracker import query_tracker, QueryTracker
+
+TEST_PHASES = ("setup", "call", "teardown")
+''' Стадии теста в порядке исполнения '''
+
+TIMING_CATEGORIES = ("total_ms", "http_ms", "db_ms", "framework_ms")
+''' Составляющие времени стадии: общее время, ожидание ответов приложения, ожидание БД и время самого фреймворка '''
+
+
+def make_worker_phase_timing_path(summary_path: str, worker_id: str) -> str:
+    """
+    Данный метод возвращает путь к файлу замеров стадий тестов процесса-исполнителя pytest-xdist, расположенному рядом
+    с файлом сводки.
+
+    :param summary_path: Путь к файлу сводки.
+    :param worker_id: Идентификатор процесса-исполнителя (например, "gw0"). Значение "*" возвращает шаблон пути,
+        под который попадают файлы замеров всех исполнителей.
+    :return: Путь к файлу замеров.
+    """
+    return os.path.join(os.path.dirname(summary_path), f"phase-timing-{worker_id}.json")
+
+
+def _make_phase_timing() -> dict:
+    return dict.fromkeys(TIMING_CATEGORIES, 0.0)
+
+
+class PhaseTimingTracker:
+    """
+    Данный класс замеряет время стадий каждого теста (подготовки, исполнения и уборки) и разделяет его на ожидание
+    ответов приложения (HTTP), ожидание БД и время самого фреймворка (формирование данных, валидация моделей, отчёт
+    Allure и т.д.).
+
+    Время ожидания HTTP и БД берётся из уже собираемых замеров LatencyTracker и QueryTracker: в начале и в конце стадии
+    запоминаются их суммарные значения, поэтому замер стадии не добавляет накладных расходов к каждому запросу.
+    Время фреймворка - это остаток времени стадии. При одновременных (асинхронных) запросах их суммарное время может
+    превышать время стадии, в этом случае время фреймворка считается равным нулю.
+    """
+
+    def __init__(self, http_tracker: LatencyTracker, db_tracker: QueryTracker):
+        """
+        :param http_tracker: Источник замеров времени ответа приложения.
+        :param db_tracker: Источник замеров времени исполнения запросов к БД.
+        """
+        self.http_tracker = http_tracker
+        self.db_tracker = db_tracker
+        self.tests: dict[str, dict[str, dict]] = {}
+        self._phase_started: tuple[float, float, float] | None = None
+        self._lock = threading.Lock()
+
+    def start_phase(self) -> None:
+        """
+        Метод для начала замера стадии теста.
+        """
+        self._phase_started = (time.perf_counter(), self.http_tracker.total_ms, self.db_tracker.total_ms)
+
+    def finish_phase(self, test_id: str, phase: str) -> dict:
+        """
+        Метод для завершения замера стадии теста.
+
+        :param test_id: Идентификатор теста (nodeid).
+        :param phase: Стадия теста ("setup", "call" или "teardown").
+        :return: Составляющие времени стадии (в миллисекундах).
+        """
+        started_at, http_started_ms, db_started_ms = self._phase_started
+        self._phase_started = None
+        total_ms = (time.perf_counter() - started_at) * 1000
+        http_ms = self.http_tracker.total_ms - http_started_ms
+        db_ms = self.db_tracker.total_ms - db_started_ms
+        phase_timing = {
+            "total_ms": round(total_ms, 3),
+            "http_ms": round(http_ms, 3),
+            "db_ms": round(db_ms, 3),
+            "framework_ms": round(max(total_ms - http_ms - db_ms, 0.0), 3)
+        }
+        with self._lock:
+            self.tests.setdefault(test_id, {})[phase] = phase_timing
+        return phase_timing
+
+    def set_phase_outcome(self, test_id: str, phase: str, outcome: str) -> None:
+        """
+        Метод для сохранения результата стадии теста вместе с её замером.
+
+        :param test_id: Идентификатор теста (nodeid).
+        :param phase: Стадия теста ("setup", "call" или "teardown").
+        :param outcome: Результат стадии ("passed", "failed" или "skipped").
+        """
+        with self._lock:
+            phase_timing = self.tests.get(test_id, {}).get(phase)
+            if phase_timing is not None:
+                phase_timing["outcome"] = outcome
+
+    def get_test_timing(self, test_id: str) -> dict:
+        """
+        Метод для получения замеров стадий отдельного теста.
+
+        :param test_id: Идентификатор теста (nodeid).
+        :return: Словарь, ключами которого являются стадии теста, а значениями - составляющие их времени.
+        """
+        with self._lock:
+            return dict(self.tests.get(test_id, {}))
+
+    def summary(self, top_n: int) -> dict:
+        """
+        Метод для формирования сводки за запуск.
+
+        :param top_n: Количество самых долгих тестов в сводке.
+        :return: Словарь с суммарным временем стадий всех тестов (с разделением на составляющие), самыми долгими
+            тестами и замерами всех тестов.
+        """
+        with self._lock:
+            tests = {test_id: dict(phases) for test_id, phases in self.tests.items()}
+
+        phases_totals = defaultdict(_make_phase_timing)
+        tests_totals = {}
+        for test_id, phases in tests.items():
+            test_total = _make_phase_timing()
+            for phase, phase_timing in phases.items():
+                for category in TIMING_CATEGORIES:
+                    phases_totals[phase][category] += phase_timing[category]
+                    test_total[category] += phase_timing[category]
+            tests_totals[test_id] = test_total
+
+        slowest_tests = sorted(tests_totals.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top_n]
+        return {
+            "tests_count": len(tests),
+            "phases": {
+                phase: self._round_timing(phases_totals[phase]) for phase in TEST_PHASES if phase in phases_totals
+            },
+            "slowest_tests": {
+                test_id: {**self._round_timing(test_total), "phases": tests[test_id]}
+                for test_id, test_total in slowest_tests
+            },
+            "tests": dict(sorted(tests.items()))
+        }
+
+    def write_stats(self, path: str) -> None:
+        """
+        Метод для записи замеров в JSON-файл (используется процессами-исполнителями pytest-xdist, чтобы управляющий
+        процесс мог сформировать общую сводку).
+
+        :param path: Путь к файлу замеров.
+        """
+        with self._lock:
+            tests = dict(self.tests)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(tests, f)
+
+    def merge_stats_files(self, pattern: str) -> None:
+        """
+        Метод для добавления замеров из файлов, ранее записанных методом write_stats. Прочитанные файлы удаляются.
+
+        :param pattern: Шаблон пути к файлам замеров.
+        """
+        for path in glob.glob(pattern):
+            with open(path, encoding="utf-8") as f:
+                tests = json.load(f)
+            with self._lock:
+                self.tests.update(tests)
+            os.remove(path)
+
+    def write_summary(self, path: str, top_n: int) -> dict:
+        """
+        Метод для записи сводки в JSON-файл.
+
+        :param path: Путь к файлу сводки.
+        :param top_n: Количество самых долгих тестов в сводке.
+        :return: Записанная сводка.
+        """
+        summary = self.summary(top_n)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=3, ensure_ascii=False)
+        return summary
+
+    @staticmethod
+    def _round_timing(timing: dict) -> dict:
+        return {category: round(value, 3) for category, value in timing.items()}
+
+
+phase_timing_tracker = PhaseTimingTracker(latency_tracker, query_tracker)
+''' Общий для всей сессии экземпляр PhaseTimingTracker, в который fixtures/core.py записывает замеры стадий тестов '''
@@ -0,0 +1,202 @@
+import glob
+import json
+import os
+import re
+import threading
+from collections import defaultdict
+
+STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+NUMERIC_LITERAL_PATTERN = re.compile(r'\b\d+(?:\.\d+)?\b')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_sql(query: str) -> str:
+    """
+    Данный метод приводит текст запроса к единому виду, чтобы запросы, отличающиеся только значениями, учитывались
+    как одна инструкция: пробельные символы схлопываются, а строковые и числовые литералы заменяются на "?".
+    Например, "SELECT id FROM public.users WHERE is_admin = 'true'" приводится к
+    "SELECT id FROM public.users WHERE is_admin = ?".
+
+    :param query: Текст запроса.
+    :return: Нормализованный текст запроса.
+    """
+    query = STRING_LITERAL_PATTERN.sub("?", str(query))
+    query = NUMERIC_LITERAL_PATTERN.sub("?", query)
+    return WHITESPACE_PATTERN.sub(" ", query).strip().rstrip(";")
+
+
+class RepeatedQueriesWarning(UserWarning):
+    """
+    Предупреждение о том, что тест исполнил одну и ту же инструкцию больше DB_QUERY_REPEAT_THRESHOLD раз
+    (вероятный признак N+1 запросов).
+    """
+
+
+def make_worker_query_stats_path(summary_path: str, worker_id: str) -> str:
+    """
+    Данный метод возвращает путь к файлу статистики запросов процесса-исполнителя pytest-xdist, расположенному рядом
+    с файлом сводки.
+
+    :param summary_path: Путь к файлу сводки.
+    :param worker_id: Идентификатор процесса-исполнителя (например, "gw0"). Значение "*" возвращает шаблон пути,
+        под который попадают файлы статистики всех исполнителей.
+    :return: Путь к файлу статистики.
+    """
+    return os.path.join(os.path.dirname(summary_path), f"db-query-stats-{worker_id}.json")
+
+
+def _make_statement_stats() -> dict:
+    return {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+
+
+def _add_to_statement_stats(stats: dict, count: int, total_ms: float, max_ms: float) -> None:
+    stats["count"] += count
+    stats["total_ms"] += total_ms
+    stats["max_ms"] = max(stats["max_ms"], max_ms)
+
+
+class QueryTracker:
+    """
+    Данный класс накапливает количество и время исполнения запросов к БД, сгруппированные по нормализованному тексту
+    запроса (см. normalize_sql), как в рамках текущего теста, так и за весь запуск.
+
+    Тест, исполнивший одну и ту же инструкцию больше заданного количества раз, отмечается как содержащий
+    N+1 запросов: такие повторы обычно означают поштучную обработку записей там, где достаточно одного запроса.
+    """
+
+    def __init__(self):
+        self.statements: dict[str, dict] = defaultdict(_make_statement_stats)
+        self.flagged_tests: dict[str, dict[str, int]] = {}
+        self.tests_queries_count: dict[str, int] = {}
+        self.total_ms = 0.0
+        ''' Суммарное время исполнения всех запросов (используется для учёта времени ожидания БД по стадиям тестов) '''
+        self._test_statements: dict[str, dict] | None = None
+        self._lock = threading.Lock()
+
+    def record(self, query: str, elapsed_in_ms: float) -> None:
+        """
+        Метод для сохранения одного замера времени исполнения запроса.
+
+        :param query: Текст запроса.
+        :param elapsed_in_ms: Время исполнения запроса в миллисекундах.
+        """
+        statement = normalize_sql(query)
+        with self._lock:
+            _add_to_statement_stats(self.statements[statement], 1, elapsed_in_ms, elapsed_in_ms)
+            self.total_ms += elapsed_in_ms
+            if self._test_statements is not None:
+                _add_to_statement_stats(self._test_statements[statement], 1, elapsed_in_ms, elapsed_in_ms)
+
+    def start_test(self) -> None:
+        """
+        Метод для начала учёта запросов отдельного теста.
+        """
+        with self._lock:
+            self._test_statements = defaultdict(_make_statement_stats)
+
+    def finish_test(self, test_id: str, repeat_threshold: int) -> tuple[dict, dict[str, int]]:
+        """
+        Метод для завершения учёта запросов отдельного теста.
+
+        :param test_id: Идентификатор теста (nodeid).
+        :param repeat_threshold: Количество исполнений одной инструкции, превышение которого отмечает тест как
+            содержащий N+1 запросов.
+        :return: Статистика запросов теста (по убыванию суммарного времени) и инструкции, количество исполнений
+            которых превысило порог.
+        """
+        with self._lock:
+            test_statements = self._test_statements or {}
+            self._test_statements = None
+        summary = self._round_statements(
+            sorted(test_statements.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        )
+        repeated_statements = {
+            statement: stats["count"] for statement, stats in summary.items() if stats["count"] > repeat_threshold
+        }
+        with self._lock:
+            self.tests_queries_count[test_id] = sum(stats["count"] for stats in summary.values())
+            if repeated_statements:
+                self.flagged_tests[test_id] = repeated_statements
+        return summary, repeated_statements
+
+    def summary(self, top_n: int) -> dict:
+        """
+        Метод для формирования сводки запросов за запуск.
+
+        :param top_n: Количество инструкций в каждом из списков сводки.
+        :return: Словарь со списками самых затратных (по суммарному времени) и самых частых инструкций, а также
+            с тестами, отмеченными как содержащие N+1 запросов.
+        """
+        with self._lock:
+            statements = {statement: dict(stats) for statement, stats in self.statements.items()}
+            flagged_tests = dict(self.flagged_tests)
+        most_expensive = sorted(statements.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top_n]
+        most_repeated = sorted(statements.items(), key=lambda item: item[1]["count"], reverse=True)[:top_n]
+        return {
+            "statements_count": len(statements),
+            "queries_count": sum(stats["count"] for stats in statements.values()),
+            "most_expensive": self._round_statements(most_expensive),
+            "most_repeated": self._round_statements(most_repeated),
+            "n_plus_one_tests": dict(sorted(flagged_tests.items()))
+        }
+
+    def write_stats(self, path: str) -> None:
+        """
+        Метод для записи накопленной статистики в JSON-файл (используется процессами-исполнителями pytest-xdist,
+        чтобы управляющий процесс мог сформировать общую сводку).
+
+        :param path: Путь к файлу статистики.
+        """
+        with self._lock:
+            stats = {
+                "statements": dict(self.statements),
+                "flagged_tests": dict(self.flagged_tests),
+                "tests_queries_count": dict(self.tests_queries_count)
+            }
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(stats, f)
+
+    def merge_stats_files(self, pattern: str) -> None:
+        """
+        Метод для добавления статистики из файлов, ранее записанных методом write_stats. Прочитанные файлы удаляются.
+
+        :param pattern: Шаблон пути к файлам статистики.
+        """
+        for path in glob.glob(pattern):
+            with open(path, encoding="utf-8") as f:
+                stats = json.load(f)
+            with self._lock:
+                for statement, statement_stats in stats["statements"].items():
+                    _add_to_statement_stats(self.statements[statement], **statement_stats)
+                self.flagged_tests.update(stats["flagged_tests"])
+                self.tests_queries_count.update(stats["tests_queries_count"])
+            os.remove(path)
+
+    def write_summary(self, path: str, top_n: int) -> dict:
+        """
+        Метод для записи сводки в JSON-файл.
+
+        :param path: Путь к файлу сводки.
+        :param top_n: Количество инструкций в каждом из списков сводки.
+        :return: Записанная сводка.
+        """
+        summary = self.summary(top_n)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=3, ensure_ascii=False)
+        return summary
+
+    @staticmethod
+    def _round_statements(statements) -> dict:
+        return {
+            statement: {
+                "count": stats["count"],
+                "total_ms": round(stats["total_ms"], 3),
+                "max_ms": round(stats["max_ms"], 3)
+            } for statement, stats in statements
+        }
+
+
+query_tracker = QueryTracker()
+''' Общий для всей сессии экземпляр QueryTracker, в который Database и AsyncDatabase записывают замеры запросов '''
@@ -0,0 +1,189 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+from requests import Response
+
+from data.framework_variables import FrameworkVariables as FrVars
+from database.db_baseclass import Database
+from database.tokens import revoke_all_user_tokens
+from database.users import get_user_data_by_id, get_users_by_ids
+from helpers.administrator_session import AdministratorSession
+from helpers.allure_report import attach_request_data_to_report
+from helpers.assertions import make_simple_assertion
+from helpers.data_generators import generate_user_data
+from helpers.http_client import HttpClient
+from helpers.validate_response import validate_response
+from models.users import CreatedUserDataBundle, CreateUserSuccessfulResponse, DeleteUserSuccessfulResponse
+
+
+class UserPool:
+    """
+    Данный класс представляет собой пул пользователей без прав администратора, создаваемых один раз за сессию.
+
+    Тест получает пользователя во временное пользование (аренду), а после завершения теста пользователь возвращается
+    в пул, будучи приведённым к исходному состоянию: права администратора отзываются, а все выпущенные на пользователя
+    токены помечаются отозванными. Если свободных пользователей в пуле нет, то пул создаёт ещё одного пользователя.
+
+    Пул не является общим для процессов-исполнителей pytest-xdist: каждый исполнитель создаёт собственный пул.
+    """
+
+    def __init__(self, http_client: HttpClient, database: Database, administrator: AdministratorSession):
+        """
+        :param http_client: HTTP-клиент для запросов создания, изменения и удаления пользователей.
+        :param database: Экземпляр класса Database, используемый для проверки состояния пользователей и отзыва токенов.
+        :param administrator: Сессия администратора, от имени которого выполняются запросы.
+        """
+        self.http_client = http_client
+        self.database = database
+        self.administrator = administrator
+        self._users: list[CreatedUserDataBundle] = []
+        self._free_users: list[CreatedUserDataBundle] = []
+
+    def fill(self, users_count: int | None = None) -> None:
+        """
+        Метод для создания пользователей пула. Запросы создания отправляются параллельно, а их результаты проверяются
+        и прикрепляются к отчёту последовательно.
+
+        :param users_count: Количество создаваемых пользователей.
+            Если значение не передано, то используется значение переменной USER_POOL_SIZE.
+        :return: Метод ничего не возвращает.
+        """
+        users_count = int(users_count or FrVars.USER_POOL_SIZE)
+        if users_count < 1:
+            return
+
+        # Токен администратора запрашивается один раз до отправки запросов, чтобы авторизация (или обновление токенов)
+        # не выполнялась одновременно из нескольких потоков.
+        access_token = self.administrator.access_token
+        users_data = [generate_user_data() for _ in range(users_count)]
+        with ThreadPoolExecutor(max_workers=users_count) as executor:
+            responses = list(executor.map(
+                lambda user_data: self._send_user_creation_request(user_data, access_token), users_data
+            ))
+
+        for user_data, res in zip(users_data, responses):
+            self._register_user(user_data, res)
+
+    def lease(self) -> CreatedUserDataBundle:
+        """
+        Метод для получения пользователя из пула.
+
+        :return: Набор данных пользователя пула.
+        """
+        if not self._free_users:
+            user_data = generate_user_data()
+            res = self._send_user_creation_request(user_data, self.administrator.access_token)
+            self._register_user(user_data, res)
+        return self._free_users.pop(0)
+
+    def release(self, user: CreatedUserDataBundle) -> None:
+        """
+        Метод для возврата пользователя в пул с приведением его к исходному состоянию.
+        Если пользователь был удалён за время аренды, то он исключается из пула.
+
+        :param user: Набор данных пользователя пула, полученный методом lease.
+        :return: Метод ничего не возвращает.
+        """
+        user_data_from_db = get_user_data_by_id(db=self.database, user_id=user.user_id)
+        if user_data_from_db is None:
+            allure.attach(f"Пользователь {user.user_id} был удалён и исключён из пула", "Исключение из пула")
+            self._users.remove(user)
+            return
+
+        if user_data_from_db.is_admin is True:
+            self._revoke_administrator_permissions(user)
+        revoke_all_user_tokens(db=self.database, user_id=user.user_id)
+
+        self._free_users.append(user)
+
+    def reset(self) -> None:
+        """
+        Метод для исключения из пула всех пользователей без их удаления (например, после восстановления базы данных из
+        снимка, в котором этих пользователей не существует). При следующей аренде пул создаст нового пользователя.
+
+        :return: Метод ничего не возвращает.
+        """
+        self._users.clear()
+        self._free_users.clear()
+
+    def close(self) -> None:
+        """
+        Метод для удаления всех пользователей пула.
+
+        :return: Метод ничего не возвращает.
+        """
+        # Данные всех пользователей пула запрашиваются одним запросом.
+        users_data_from_db = get_users_by_ids(db=self.database, users_ids=[user.user_id for user in self._users])
+        for user in list(self._users):
+            user_data_from_db = users_data_from_db.get(user.user_id)
+            if user_data_from_db is None:
+                continue
+            if user_data_from_db.is_admin is True:
+                self._revoke_administrator_permissions(user)
+
+            with allure.step("Удаление пользователя"):
+                res = self.http_client.delete(
+                    url=FrVars.APP_HOST + f"/v1/users/{user.user_id}",
+                    headers={
+                        "Access-Token": self.administrator.access_token
+                    }
+                )
+                attach_request_data_to_report(res)
+
+                make_simple_assertion(
+                    expected_value=200,
+                    actual_value=res.status_code,
+                    assertion_name="Код ответа на запрос удаления пользователя в фикстуре"
+                )
+
+                validate_response(
+                    model=DeleteUserSuccessfulResponse,
+                    response=res
+                )
+
+        self._users.clear()
+        self._free_users.clear()
+
+    def _send_user_creation_request(self, user_data: dict, access_token: str) -> Response:
+        return self.http_client.post(
+            url=FrVars.APP_HOST + "/v1/users",
+            headers={
+                "Access-Token": access_token
+            },
+            json=user_data
+        )
+
+    def _register_user(self, user_data: dict, res: Response) -> None:
+        with allure.step("Создание пользователя"):
+            attach_request_data_to_report(res)
+
+            make_simple_assertion(
+                expected_value=200,
+                actual_value=res.status_code,
+                assertion_name="Код ответа на запрос создания пользователя в фикстуре"
+            )
+
+            serialized_response = validate_response(
+                model=CreateUserSuccessfulResponse,
+                response=res
+            )
+
+        user = CreatedUserDataBundle(user_id=serialized_response.user_id, **user_data)
+        self._users.append(user)
+        self._free_users.append(user)
+
+    def _revoke_administrator_permissions(self, user: CreatedUserDataBundle) -> None:
+        with allure.step("Отзыв у пользователя пула прав администратора"):
+            res = self.http_client.patch(
+                url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{user.user_id}/revoke",
+                headers={
+                    "Access-Token": self.administrator.access_token
+                }
+            )
+            attach_request_data_to_report(res)
+
+            make_simple_assertion(
+                expected_value=200,
+                actual_value=res.status_code,
+                assertion_name="Код ответа на запрос отзыва прав администратора у пользователя в фикстуре"
+            )
@@ -1,26 +1,90 @@
 import json
+from functools import lru_cache
+from typing import NamedTuple
+
 import allure
-from pydantic import ValidationError
+from httpx import Response as AsyncResponse
+from pydantic import TypeAdapter, ValidationError
+from requests import Response
 from helpers.json_tools import format_json
 
 
-def validate_response_model(model, data: str):
+class ModelValidator(NamedTuple):
+    """
+    Собранный для модели валидатор и текст вложения «Детали валидации», формируемые один раз на модель.
+    """
+    adapter: TypeAdapter
+    details: str
+
+
+@lru_cache(maxsize=None)
+def get_model_validator(model) -> ModelValidator:
+    """
+    Данный метод возвращает валидатор модели. Валидатор (TypeAdapter) и текст вложения создаются при первом обращении
+    к модели и переиспользуются при последующих проверках ответов.
+
+    :param model: Pydantic-модель.
+    :return: Валидатор модели.
+    """
+    return ModelValidator(
+        adapter=TypeAdapter(model),
+        details=f"Использована модель: {model.__name__}\nОписание модели: {model.__doc__}"
+    )
+
+
+def validate_response(model, response: Response | AsyncResponse, attach_to_report: bool = True):
+    """
+    Данный метод проверяет соответствие ответа переданной модели и возвращает сериализованный ответ.
+
+    В отличие от validate_response_model, тело ответа не разбирается предварительно в словари Python (res.json()):
+    байты ответа валидируются напрямую (model_validate_json) за один проход, без промежуточных словарей. По времени
+    оба способа сопоставимы: на ответах со списком из 10 000 - 100 000 книг разница между ними не превышает разброса
+    замеров, так как основное время уходит на создание моделей (см. benchmarks/response_validation.py).
+
+    :param model: Pydantic-модель, которой должен соответствовать ответ.
+    :param response: Ответ синхронного (requests) или асинхронного (httpx) клиента.
+    :param attach_to_report: Признак необходимости записи шагов валидации в отчёт.
+    :return: Сериализованный ответ.
+    :raises AssertionError: Исключение, возвращаемое в случае, если ответ не соответствует модели.
+    """
+    validator = get_model_validator(model)
+    return _validate(validator.adapter.validate_json, response.content, model, validator, attach_to_report)
+
+
+def validate_response_model(model, data: str, attach_to_report: bool = True):
+    """
+    Данный метод проверяет соответствие данных ответа переданной модели и возвращает сериализованный ответ.
+
+    :param model: Pydantic-модель, которой должен соответствовать ответ.
+    :param data: Данные ответа.
+    :param attach_to_report: Признак необходимости записи шагов валидации в отчёт. Отключается там, где отчёт
+        по каждому ответу не нужен (например, при нагрузочном тестировании).
+    :return: Сериализованный ответ.
+    :raises AssertionError: Исключение, возвращаемое в случае, если данные не соответствуют модели.
+    """
+    validator = get_model_validator(model)
+    return _validate(validator.adapter.validate_python, data, model, validator, attach_to_report)
+
+
+def _validate(validate, data, model, validator: ModelValidator, attach_to_report: bool):
     try:
-        serialized_model = model.model_validate(data)
+        serialized_model = validate(data)
+        if not attach_to_report:
+            return serialized_model
         with allure.step("Валидация структуры ответа пройдена"):
-            allure.attach(f"Использована модель: {model.__name__}\n"
-                          f"Описание модели: {model.__doc__}",
-                          "Детали валидации")
+            allure.attach(validator.details, "Детали валидации")
         return serialized_model
     except ValidationError as e:
+        if not attach_to_report:
+            raise AssertionError(f"Обнаружено ошибок валидации ответа модели {model.__name__}: {e.error_count()}\n{e}")
         with allure.step("Валидация структуры ответа не пройдена"):
-            allure.attach(f"Использована модель: {model.__name__}\n"
-                          f"Описание модели: {model.__doc__}",
-                          "Детали валидации")
+            allure.attach(validator.details, "Детали валидации")
             with allure.step("Ошибки валидации"):
                 errors_list = e.errors()
                 for error in errors_list:
-                    error_as_json = json.dumps(error, indent=4)
+                    # При валидации байтов ответа входные данные ошибки (например, невалидного JSON) могут быть
+                    # байтами, поэтому такие значения приводятся к строке.
+                    error_as_json = json.dumps(error, indent=4, default=str)
                     allure.attach(format_json(error_as_json), f"{error['msg']} : {error['loc']}")
                 raise AssertionError(f"Обнаружено ошибок валидации: {e.error_count()}")
     except ValueError as e:
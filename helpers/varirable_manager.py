@@ -4,10 +4,17 @@ from typing import Any
 class VariableManager:
     """
     Данный класс представляет собой менеджер переменных,
-    который может хранить переменные на протяжении всей сессии.
+    который может хранить переменные на протяжении жизни одного теста.
+
+    Каждый тест получает собственный экземпляр менеджера с пространством имён, включающим идентификатор
+    процесса-исполнителя и идентификатор теста, поэтому переменные параллельно исполняемых тестов не пересекаются.
     """
-    def __init__(self):
-        self.info = "Hello from variable manager!"
+    def __init__(self, namespace: str = "master"):
+        """
+        :param namespace: Пространство имён менеджера (используется в сообщениях об ошибках).
+        """
+        self.namespace = namespace
+        self._variables: dict[str, Any] = {}
 
     def set(self, name: str, value: Any) -> None:
         """
@@ -19,7 +26,7 @@ class VariableManager:
         :param name: Название создаваемой переменной
         :param value: Значение создаваемой переменной
         """
-        setattr(self, name, value)
+        self._variables[name] = value
 
     def get(self, name: str) -> Any:
         """
@@ -30,8 +37,12 @@ class VariableManager:
 
         :param name: Название запрашиваемой переменной
         :return: Содержимое запрошенной переменной
+        :raises AttributeError: Исключение, возвращаемое в случае, если переменная не была записана.
         """
-        return getattr(self, name)
+        try:
+            return self._variables[name]
+        except KeyError:
+            raise AttributeError(f"Variable '{name}' is not set in namespace '{self.namespace}'")
 
     def unset(self, name: str) -> None:
         """
@@ -41,5 +52,9 @@ class VariableManager:
         Метод ничего не возвращает.
 
         :param name: Название удаляемой переменной.
+        :raises AttributeError: Исключение, возвращаемое в случае, если переменная не была записана.
         """
-        delattr(self, name)
+        try:
+            del self._variables[name]
+        except KeyError:
+            raise AttributeError(f"Variable '{name}' is not set in namespace '{self.namespace}'")
@@ -0,0 +1,65 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def get_worker_id() -> str:
+    """
+    Данный метод возвращает идентификатор текущего процесса-исполнителя pytest-xdist ("gw0", "gw1" и т.д.).
+
+    :return: Идентификатор процесса-исполнителя, либо "master", если тесты запущены без pytest-xdist.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+class CrossWorkerLock:
+    """
+    Данный класс представляет собой блокировку "читатели-писатель", общую для всех процессов-исполнителей pytest-xdist.
+
+    Тесты, которые изменяют или проверяют глобальное состояние приложения (общее количество пользователей или книг,
+    список администраторов), захватывают блокировку монопольно. Остальные тесты захватывают её совместно, поэтому
+    они исполняются параллельно друг с другом, но не одновременно с монопольными тестами.
+
+    Блокировка основана на fcntl.flock и доступна только в POSIX-системах.
+    """
+
+    def __init__(self, lock_dir: Path):
+        """
+        :param lock_dir: Директория, общая для всех процессов-исполнителей, в которой будут созданы файлы блокировки.
+        """
+        if fcntl is None:
+            raise RuntimeError("Параллельный запуск тестов поддерживается только в POSIX-системах")
+        self.lock_file_path = Path(lock_dir) / "global_state.lock"
+        # Через "турникет" проходят все желающие захватить блокировку. Монопольный захват удерживает турникет, пока
+        # совместные захваты не будут освобождены, поэтому новые совместные захваты не могут бесконечно опережать его.
+        self.turnstile_file_path = Path(lock_dir) / "global_state.turnstile.lock"
+
+    @contextmanager
+    def _acquire(self, mode: int):
+        with open(self.turnstile_file_path, "a") as turnstile_file, open(self.lock_file_path, "a") as lock_file:
+            fcntl.flock(turnstile_file, fcntl.LOCK_EX)
+            try:
+                fcntl.flock(lock_file, mode)
+            finally:
+                fcntl.flock(turnstile_file, fcntl.LOCK_UN)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def shared(self):
+        """ Контекстный менеджер совместного захвата блокировки. """
+        with self._acquire(fcntl.LOCK_SH):
+            yield
+
+    @contextmanager
+    def exclusive(self):
+        """ Контекстный менеджер монопольного захвата блокировки. """
+        with self._acquire(fcntl.LOCK_EX):
+            yield
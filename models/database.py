@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class TableFingerprint(BaseModel):
+    """
+    Модель отпечатка состояния таблицы БД. Отпечатки двух состояний таблицы равны тогда и только тогда, когда
+    (с точностью до коллизий хэш-функции) таблица содержит одни и те же строки.
+    """
+    rows_count: int
+    """ Количество строк в таблице """
+    content_hash: str
+    """ Хэш содержимого таблицы, не зависящий от порядка строк """
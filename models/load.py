@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+
+
+class LoadEndpointStatistics(BaseModel):
+    """
+    Модель статистики одного эндпоинта за нагрузочный запуск.
+    """
+    count: int
+    """ Количество отправленных запросов """
+    errors: int
+    """ Количество запросов, завершившихся ошибкой (неожиданный код ответа, ответ не соответствует модели,
+    сетевая ошибка) """
+    mean_ms: float
+    """ Среднее время ответа (в миллисекундах) """
+    p50_ms: float
+    """ Медиана времени ответа (в миллисекундах) """
+    p95_ms: float
+    """ 95-й перцентиль времени ответа (в миллисекундах) """
+    p99_ms: float
+    """ 99-й перцентиль времени ответа (в миллисекундах) """
+    max_ms: float
+    """ Максимальное время ответа (в миллисекундах) """
+
+
+class LoadRunReport(BaseModel):
+    """
+    Модель отчёта о нагрузочном запуске.
+    """
+    virtual_users: int
+    """ Количество одновременно работающих виртуальных пользователей """
+    duration_in_seconds: float
+    """ Фактическая длительность нагрузки (в секундах) """
+    iterations: int
+    """ Количество полностью пройденных итераций сценария """
+    total_requests: int
+    """ Общее количество отправленных запросов """
+    failed_requests: int
+    """ Количество запросов, завершившихся ошибкой """
+    throughput_rps: float
+    """ Пропускная способность (запросов в секунду) """
+    overall: LoadEndpointStatistics
+    """ Статистика по всем запросам запуска """
+    endpoints: dict[str, LoadEndpointStatistics]
+    """ Статистика по каждому эндпоинту (ключ - метод и шаблон маршрута) """
+    errors_samples: list[str]
+    """ Примеры текстов ошибок (первые из обнаруженных) """
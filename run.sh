@@ -39,15 +39,26 @@ else
     echo "[ 🤖 Defined RUN_SCOPE and additional args is: \"$RUN_SCOPE_WITH_PYTEST_ARGS\"... ]"
 fi
 
-pytest "$RUN_SCOPE_WITH_PYTEST_ARGS" --alluredir="$PROJECT_ROOT"/allure-results -s
+# Parsing PYTEST_WORKERS variable
+PARALLEL_ARGS=()
+if [ -z "${PYTEST_WORKERS}" ]; then
+    echo "[ 🤖 PYTEST_WORKERS is not defined. Tests will be run sequentially... ]"
+else
+    PARALLEL_ARGS=(-n "$PYTEST_WORKERS")
+    echo "[ 🤖 Tests will be run in parallel with \"$PYTEST_WORKERS\" workers... ]"
+fi
+
+pytest "$RUN_SCOPE_WITH_PYTEST_ARGS" "${PARALLEL_ARGS[@]}" --alluredir="$PROJECT_ROOT"/allure-results -s
 
 PYTEST_EXIT_CODE=$?
 echo "[ 🤖 Pytest exitcode is $PYTEST_EXIT_CODE. ]"
 
+# The latest report directory (allure-report also contains the performance trends store file)
+LAST_REPORT_DIR=$(ls -Art allure-report/ 2>/dev/null | grep -v '\.sqlite3$' | tail -n 1)
 if [[ -d "$PROJECT_ROOT"/allure-report/ && \
--d "$PROJECT_ROOT"/allure-report/$(ls -Art allure-report/ | tail -n 1)/multi-file/history ]]; then
+-d "$PROJECT_ROOT"/allure-report/$LAST_REPORT_DIR/multi-file/history ]]; then
     echo "[ 🤖 Copying history from previous multi-file report... ]"
-    mv "$PROJECT_ROOT"/allure-report/$(ls -Art allure-report/ | tail -n 1)/multi-file/history \
+    mv "$PROJECT_ROOT"/allure-report/"$LAST_REPORT_DIR"/multi-file/history \
     "$PROJECT_ROOT"/allure-results/
 else
     echo "[ 🤖 Previous multi-file report is not found. History won't be included in current report. ]"
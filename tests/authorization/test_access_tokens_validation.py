@@ -1,10 +1,9 @@
 import allure
-import requests
 from faker import Faker
 
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.authorization import AccessTokenErrorTokenBadSignature, AccessTokenErrorTokenMalformed, \
     AccessTokenErrorTokenExpired, \
     AccessTokenErrorTokenNotFoundInDatabase, AccessTokenErrorTokenRevoked
@@ -23,10 +22,10 @@ class TestAccessTokenValidation:
         "Данный тест проверяет отказ в обслуживании при попытке передачи токена доступа с некорректной подписью."
     )
     def test_invalid_access_token_signature(
-            self, variable_manager, get_random_endpoint_data, make_access_token_with_incorrect_signature
+            self, http_client, variable_manager, get_random_endpoint_data, make_access_token_with_incorrect_signature
     ):
 
-        res = requests.request(
+        res = http_client.request(
             method=get_random_endpoint_data.method,
             url=get_random_endpoint_data.url,
             headers={
@@ -40,9 +39,9 @@ class TestAccessTokenValidation:
         make_simple_assertion(expected_value=401, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=AccessTokenErrorTokenBadSignature,
-            data=res.json()
+            response=res
         )
 
 
@@ -53,9 +52,9 @@ class TestAccessTokenValidation:
         "не являющихся токеном доступа."
     )
     def test_malformed_or_incorrect_access_token(
-            self, variable_manager, get_random_endpoint_data, make_malformed_jwt_token
+            self, http_client, variable_manager, get_random_endpoint_data, make_malformed_jwt_token
     ):
-        res = requests.request(
+        res = http_client.request(
             method=get_random_endpoint_data.method,
             url=get_random_endpoint_data.url,
             headers={
@@ -69,9 +68,9 @@ class TestAccessTokenValidation:
         make_simple_assertion(expected_value=400, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=AccessTokenErrorTokenMalformed,
-            data=res.json()
+            response=res
         )
 
     @allure.title("Ошибка при передаче истёкшего токена")
@@ -81,9 +80,9 @@ class TestAccessTokenValidation:
         "имеет корректную подпись, если его срок действия уже истёк."
     )
     def test_expired_access_token(
-            self, variable_manager, get_random_endpoint_data, make_expired_access_token
+            self, http_client, variable_manager, get_random_endpoint_data, make_expired_access_token
     ):
-        res = requests.request(
+        res = http_client.request(
             method=get_random_endpoint_data.method,
             url=get_random_endpoint_data.url,
             headers={
@@ -97,9 +96,9 @@ class TestAccessTokenValidation:
         make_simple_assertion(expected_value=401, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=AccessTokenErrorTokenExpired,
-            data=res.json()
+            response=res
         )
 
     @allure.title("Ошибка при передаче токена, данных по которому нет в базе данных")
@@ -109,9 +108,9 @@ class TestAccessTokenValidation:
         "являющегося истёкшим, при условии, что запись о нём в базе данных найти не удалось."
     )
     def test_access_token_not_found(
-            self, variable_manager, get_random_endpoint_data, make_unavailable_in_db_access_token
+            self, http_client, variable_manager, get_random_endpoint_data, make_unavailable_in_db_access_token
     ):
-        res = requests.request(
+        res = http_client.request(
             method=get_random_endpoint_data.method,
             url=get_random_endpoint_data.url,
             headers={
@@ -125,9 +124,9 @@ class TestAccessTokenValidation:
         make_simple_assertion(expected_value=401, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=AccessTokenErrorTokenNotFoundInDatabase,
-            data=res.json()
+            response=res
         )
 
     @allure.title("Ошибка при передаче отозванного токена")
@@ -138,9 +137,9 @@ class TestAccessTokenValidation:
         "признак отзыва."
     )
     def test_access_token_revoked(
-            self, variable_manager, get_random_endpoint_data, make_revoked_access_token
+            self, http_client, variable_manager, get_random_endpoint_data, make_revoked_access_token
     ):
-        res = requests.request(
+        res = http_client.request(
             method=get_random_endpoint_data.method,
             url=get_random_endpoint_data.url,
             headers={
@@ -154,7 +153,7 @@ class TestAccessTokenValidation:
         make_simple_assertion(expected_value=401, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=AccessTokenErrorTokenRevoked,
-            data=res.json()
+            response=res
         )
@@ -1,11 +1,10 @@
 import allure
-import requests
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from helpers.jwt_tools import validate_and_decode_token
 from helpers.json_tools import format_json
 from models.authorization import AuthUnauthorizedError, AuthSuccessfulResponse, StringResources as AuthStrings
@@ -30,8 +29,8 @@ class TestMainAuthorization:
         "Данный тест проверяет отказ в авторизации при передаче некорректного адреса электронной почты и \
         некорректного пароля."
     )
-    def test_authorization_with_incorrect_email(self, variable_manager):
-        res = requests.post(
+    def test_authorization_with_incorrect_email(self, http_client, variable_manager):
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/authorize",
             json={
                 "email": self.INCORRECT_RANDOM_EMAIL,
@@ -42,9 +41,9 @@ class TestMainAuthorization:
 
         make_simple_assertion(expected_value=401, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_model = validate_response_model(
+        serialized_model = validate_response(
             model=AuthUnauthorizedError,
-            data=res.json()
+            response=res
         )
 
         make_simple_assertion(
@@ -59,8 +58,8 @@ class TestMainAuthorization:
         "Данный тест проверяет отказ в авторизации при передаче корректного адреса электронной почты, но \
         некорректного пароля."
     )
-    def test_authorization_with_incorrect_password(self, variable_manager):
-        res = requests.post(
+    def test_authorization_with_incorrect_password(self, http_client, variable_manager):
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/authorize",
             json={
                 "email": self.CORRECT_ADMIN_EMAIL,
@@ -71,9 +70,9 @@ class TestMainAuthorization:
 
         make_simple_assertion(expected_value=401, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_model = validate_response_model(
+        serialized_model = validate_response(
             model=AuthUnauthorizedError,
-            data=res.json()
+            response=res
         )
 
         make_simple_assertion(
@@ -93,8 +92,8 @@ class TestMainAuthorization:
         "- Корректность записи данных о выпущенных токенах в БД, совпадение записанных в БД данных о токенах с данными "
         "из декодированных токенов\n"
     )
-    def test_successful_authorize_default_administrator(self, database, variable_manager, logout):
-        res = requests.post(
+    def test_successful_authorize_default_administrator(self, http_client, database, variable_manager, logout):
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/authorize",
             json={
                 "email": self.CORRECT_ADMIN_EMAIL,
@@ -105,9 +104,9 @@ class TestMainAuthorization:
 
         make_simple_assertion(expected_value=200, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=AuthSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         user_id_from_db = get_user_data_by_email(db=database, email=self.CORRECT_ADMIN_EMAIL).id
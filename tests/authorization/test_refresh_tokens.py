@@ -1,15 +1,14 @@
 import allure
 import pytest
-import requests
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
-from database.tokens import get_access_token_by_id, get_refresh_token_by_id
+from database.tokens import get_tokens_by_ids
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion
 from helpers.json_tools import format_json
 from helpers.jwt_tools import validate_and_decode_token
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.authorization import AuthSuccessfulResponse
 
 fake = Faker()
@@ -36,9 +35,9 @@ class TestSuccessfulTokensRenew:
     # выполняемый фикстурой "create_and_authorize_user":
     @pytest.mark.parametrize("create_and_authorize_user", ["fixture logout should be skipped"], indirect=True)
     def test_successful_tokens_renew(
-            self, variable_manager, create_and_authorize_user, logout
+            self, http_client, variable_manager, create_and_authorize_user, logout
     , database):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/refresh",
             json={
                 "refresh_token": create_and_authorize_user.refresh_token
@@ -49,9 +48,9 @@ class TestSuccessfulTokensRenew:
         make_simple_assertion(expected_value=200, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=AuthSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         with allure.step("Декодирование и верификация полученного Access-Token'а"):
@@ -84,8 +83,22 @@ class TestSuccessfulTokensRenew:
             )
 
         with allure.step("Верификация сохранённых в БД данных токенов"):
-            database_access_token_data = get_access_token_by_id(db=database, token_id=decoded_access_token.id)
-            database_refresh_token_data = get_refresh_token_by_id(db=database, token_id=decoded_refresh_token.id)
+            previous_access_token = validate_and_decode_token(create_and_authorize_user.access_token)
+            previous_refresh_token = validate_and_decode_token(create_and_authorize_user.refresh_token)
+
+            # Данные выпущенного и переданного токенов каждого типа запрашиваются одним запросом.
+            database_access_tokens = get_tokens_by_ids(
+                db=database,
+                tokens_ids=[decoded_access_token.id, previous_access_token.id],
+                token_type='access_token'
+            )
+            database_refresh_tokens = get_tokens_by_ids(
+                db=database,
+                tokens_ids=[decoded_refresh_token.id, previous_refresh_token.id],
+                token_type='refresh_token'
+            )
+            database_access_token_data = database_access_tokens.get(decoded_access_token.id)
+            database_refresh_token_data = database_refresh_tokens.get(decoded_refresh_token.id)
             allure.attach(format_json(database_access_token_data.model_dump_json()), 'Данные Access-Token\'а из БД')
             allure.attach(format_json(database_refresh_token_data.model_dump_json()), 'Данные Refresh-Token\'а из БД')
             make_bulk_assertion(
@@ -150,5 +163,22 @@ class TestSuccessfulTokensRenew:
                     )
                 ])
 
+            make_bulk_assertion(
+                group_name="Верификация отзыва переданной пары токенов",
+                data=[
+                    Assertion(
+                        expected_value=True,
+                        actual_value=database_access_tokens[previous_access_token.id].revoked,
+                        assertion_name="Переданный Access-Token отозван (значение поля revoked токена в БД является "
+                                       "True)"
+                    ),
+                    Assertion(
+                        expected_value=True,
+                        actual_value=database_refresh_tokens[previous_refresh_token.id].revoked,
+                        assertion_name="Переданный Refresh-Token отозван (значение поля revoked токена в БД является "
+                                       "True)"
+                    )
+                ])
+
         # Переменная access_token назначается для дальнейшей обработки в фикстуре logout.
         variable_manager.set("access_token", res.json()['access_token'])
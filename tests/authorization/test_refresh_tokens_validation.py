@@ -1,11 +1,10 @@
 import allure
-import requests
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.authorization import RefreshTokenErrorTokenBadSignature, \
     RefreshTokenErrorTokenMalformed, RefreshTokenErrorTokenExpired, RefreshTokenErrorTokenNotFoundInDatabase, \
     RefreshTokenErrorTokenRevoked
@@ -24,9 +23,9 @@ class TestRefreshTokenValidation:
         "Данный тест проверяет отказ в обслуживании при попытке передачи токена обновления с некорректной подписью."
     )
     def test_invalid_refresh_token_signature(
-            self, variable_manager, make_refresh_token_with_incorrect_signature
+            self, http_client, variable_manager, make_refresh_token_with_incorrect_signature
     ):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/refresh",
             json={
                 "refresh_token": make_refresh_token_with_incorrect_signature
@@ -37,9 +36,9 @@ class TestRefreshTokenValidation:
         make_simple_assertion(expected_value=401, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=RefreshTokenErrorTokenBadSignature,
-            data=res.json()
+            response=res
         )
 
 
@@ -50,9 +49,9 @@ class TestRefreshTokenValidation:
         "не являющихся токеном обновления."
     )
     def test_malformed_or_incorrect_refresh_token(
-            self, variable_manager, make_malformed_jwt_token
+            self, http_client, variable_manager, make_malformed_jwt_token
     ):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/refresh",
             json={
                 "refresh_token": make_malformed_jwt_token
@@ -64,9 +63,9 @@ class TestRefreshTokenValidation:
         make_simple_assertion(expected_value=400, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=RefreshTokenErrorTokenMalformed,
-            data=res.json()
+            response=res
         )
 
     @allure.title("Ошибка при передаче истёкшего токена")
@@ -76,9 +75,9 @@ class TestRefreshTokenValidation:
         "формату и имеет корректную подпись, если его срок действия уже истёк."
     )
     def test_expired_refresh_token(
-            self, variable_manager, make_expired_refresh_token
+            self, http_client, variable_manager, make_expired_refresh_token
     ):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/refresh",
             json={
                 "refresh_token": make_expired_refresh_token
@@ -90,9 +89,9 @@ class TestRefreshTokenValidation:
         make_simple_assertion(expected_value=401, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=RefreshTokenErrorTokenExpired,
-            data=res.json()
+            response=res
         )
 
     @allure.title("Ошибка при передаче токена, данных по которому нет в базе данных")
@@ -102,9 +101,9 @@ class TestRefreshTokenValidation:
         "не являющегося истёкшим, при условии, что запись о нём в базе данных найти не удалось."
     )
     def test_refresh_token_not_found(
-            self, variable_manager, make_unavailable_in_db_refresh_token
+            self, http_client, variable_manager, make_unavailable_in_db_refresh_token
     ):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/refresh",
             json={
                 "refresh_token": make_unavailable_in_db_refresh_token
@@ -116,9 +115,9 @@ class TestRefreshTokenValidation:
         make_simple_assertion(expected_value=401, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=RefreshTokenErrorTokenNotFoundInDatabase,
-            data=res.json()
+            response=res
         )
 
     @allure.title("Ошибка при передаче отозванного токена")
@@ -129,9 +128,9 @@ class TestRefreshTokenValidation:
         "признак отзыва."
     )
     def test_refresh_token_revoked(
-            self, variable_manager, make_revoked_refresh_token
+            self, http_client, variable_manager, make_revoked_refresh_token
     ):
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/refresh",
             json={
                 "refresh_token": make_revoked_refresh_token
@@ -143,7 +142,7 @@ class TestRefreshTokenValidation:
         make_simple_assertion(expected_value=401, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=RefreshTokenErrorTokenRevoked,
-            data=res.json()
+            response=res
         )
@@ -1,7 +1,7 @@
 import random
 
 import allure
-import requests
+import pytest
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
@@ -9,7 +9,7 @@ from database.books import get_book_data_by_id, get_books_count, get_book_data_b
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion
 from helpers.json_tools import format_json
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.books import CreateBookSuccessfulResponse, CreateBookLackOfPermissionError, CreateBookNotUniqueIsbnError
 
 fake = Faker()
@@ -30,8 +30,9 @@ class TestCreateBooks:
         "запроса не изменилась)."
         "- Отсутствие данных по книге при попытке найти её по ISBN."
     )
+    @pytest.mark.exclusive
     def test_create_book_without_administrator_permissions(
-            self, database, create_and_authorize_user
+            self, http_client, database, create_and_authorize_user
     ):
         book_title = fake.catch_phrase()
         book_author = fake.name()
@@ -42,7 +43,7 @@ class TestCreateBooks:
 
         total_books_count_before_request = get_books_count(db=database)
 
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/books",
             headers={
                 "Access-Token": create_and_authorize_user.access_token
@@ -60,9 +61,9 @@ class TestCreateBooks:
         make_simple_assertion(expected_value=403, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=CreateBookLackOfPermissionError,
-            data=res.json()
+            response=res
         )
 
         book_data_from_db = get_book_data_by_isbn(db=database, isbn=book_isbn)
@@ -94,8 +95,9 @@ class TestCreateBooks:
         "запроса не изменилась)."
         "- Отсутствие изменений данных существующей книги, ISBN которой был передан"
     )
+    @pytest.mark.exclusive
     def test_create_book_isbn_is_not_unique(
-            self, database, authorize_administrator, create_book
+            self, http_client, database, authorize_administrator, create_book
     ):
         book_title = fake.catch_phrase()
         book_author = fake.name()
@@ -104,7 +106,7 @@ class TestCreateBooks:
         existent_book_data_from_db_before_request = get_book_data_by_isbn(db=database, isbn=book_isbn)
         total_books_count_before_request = get_books_count(db=database)
 
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/books",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -123,9 +125,9 @@ class TestCreateBooks:
         make_simple_assertion(expected_value=400, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=CreateBookNotUniqueIsbnError,
-            data=res.json()
+            response=res
         )
 
         make_simple_assertion(
@@ -176,7 +178,9 @@ class TestCreateBooks:
         "данными полученными в ответе (в случае id) и данными переданными в запросе (в случае со всеми остальными "
         "данными)"
     )
-    def test_successful_book_creation(self, database, variable_manager, authorize_administrator, delete_book):
+    def test_successful_book_creation(
+            self, http_client, database, variable_manager, authorize_administrator, delete_book
+    ):
         book_title = fake.catch_phrase()
         book_author = fake.name()
         book_isbn = random.choice([
@@ -184,7 +188,7 @@ class TestCreateBooks:
             fake.isbn13(separator="")
         ])
 
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/books",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -200,9 +204,9 @@ class TestCreateBooks:
         make_simple_assertion(expected_value=200, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=CreateBookSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         book_data_from_db = get_book_data_by_id(db=database, book_id=serialized_response.book_id)
@@ -2,7 +2,6 @@ import uuid
 
 import allure
 import pytest
-import requests
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
@@ -10,7 +9,7 @@ from database.books import get_book_data_by_id, get_books_count
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion, AssertionModes
 from helpers.json_tools import format_json
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.books import DeleteBookLackOfPermissionError, BookNotFoundError, DeleteBookSuccessfulResponse
 
 fake = Faker()
@@ -30,10 +29,10 @@ class TestDeleteBooks:
         "- Сохранность в БД данных книги, которую пытались удалить"
     )
     def test_delete_book_without_administrator_permissions(
-            self, database, create_and_authorize_user, create_book
+            self, http_client, database, create_and_authorize_user, create_book
     ):
 
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/books/{create_book.book_id}",
             headers={
                 "Access-Token": create_and_authorize_user.access_token
@@ -44,9 +43,9 @@ class TestDeleteBooks:
         make_simple_assertion(expected_value=403, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=DeleteBookLackOfPermissionError,
-            data=res.json()
+            response=res
         )
 
         book_data_from_db = get_book_data_by_id(db=database, book_id=str(create_book.book_id))
@@ -109,14 +108,15 @@ class TestDeleteBooks:
         "- Соответствие структуры (модели) ответа ожидаемой\n"
         "- Неизменность количества книг в БД до и после запроса"
     )
+    @pytest.mark.exclusive
     def test_non_existent_book_delete(
-            self, database, authorize_administrator
+            self, http_client, database, authorize_administrator
     ):
 
         unavailable_in_db_book_id = str(uuid.uuid4())
         total_books_count_before_request = get_books_count(db=database)
 
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/books/{unavailable_in_db_book_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -129,9 +129,9 @@ class TestDeleteBooks:
         make_simple_assertion(expected_value=404, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=BookNotFoundError,
-            data=res.json()
+            response=res
         )
 
         make_simple_assertion(
@@ -157,12 +157,12 @@ class TestDeleteBooks:
     )
     @pytest.mark.parametrize("create_book", ["fixture book deletion should be skipped"], indirect=True)
     def test_successful_book_deletion(
-            self, database, authorize_administrator, create_book
+            self, http_client, database, authorize_administrator, create_book
     ):
 
         book_data_from_db_before_delete = get_book_data_by_id(db=database, book_id=str(create_book.book_id))
 
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/books/{create_book.book_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -173,9 +173,9 @@ class TestDeleteBooks:
         make_simple_assertion(expected_value=200, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=DeleteBookSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         book_data_from_db_after_delete = get_book_data_by_id(db=database, book_id=str(create_book.book_id))
@@ -1,16 +1,14 @@
-import json
-
 import allure
-import requests
+import pytest
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
-from database.books import get_all_books_data
-from helpers.allure_report import attach_request_data_to_report
-from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion
-from helpers.json_tools import format_json
-from helpers.validate_response import validate_response_model
-from models.books import MultipleBooks, SingleBook
+from database.books import iterate_all_books_data
+from helpers.allure_report import attach_request_data_to_report, attach_json_to_report
+from helpers.assertions import make_simple_assertion
+from helpers.collection_comparison import make_collection_assertion
+from helpers.validate_response import validate_response
+from models.books import MultipleBooks
 
 fake = Faker()
 
@@ -29,9 +27,10 @@ class TestGetBooksData:
         "- Соответствие структуры (модели) ответа ожидаемой\n"
         "- Соответствие списка книг, возвращённому в ответе списку, полученному из БД"
     )
-    def test_successful_all_books_data_get(self, database, create_and_authorize_user, create_book):
+    @pytest.mark.exclusive
+    def test_successful_all_books_data_get(self, http_client, database, create_and_authorize_user, seed_books):
 
-        res = requests.get(
+        res = http_client.get(
             url=FrVars.APP_HOST + "/v1/books",
             headers={
                 "Access-Token": create_and_authorize_user.access_token
@@ -42,49 +41,22 @@ class TestGetBooksData:
         make_simple_assertion(expected_value=200, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=MultipleBooks,
-            data=res.json()
+            response=res
         )
 
-        books_data_from_response = serialized_response.root
-        books_data_from_db = get_all_books_data(db=database)
-
         with allure.step("Сравнение списка книг из ответа и из БД"):
-            allure.attach(
-                format_json(serialized_response.model_dump_json()),
+            attach_json_to_report(
+                serialized_response.model_dump_json(),
                 'Список книг полученный в ответе на запрос'
             )
 
-            prettified_list_from_database = json.dumps(
-                [json.loads(book_from_db_as_json.model_dump_json()) for book_from_db_as_json in books_data_from_db]
-            )
-            allure.attach(
-                format_json(prettified_list_from_database),
-                'Список книг полученный в ответе из БД'
-            )
-
-            books_lists_assertions = []
-
-            for book_from_response in books_data_from_response:
-                book_from_db = books_data_from_db.pop(0)
-                serialized_book_from_db = SingleBook(
-                    id=book_from_db.id,
-                    title=book_from_db.title,
-                    author=book_from_db.author,
-                    isbn=book_from_db.isbn
-                )
-
-                books_lists_assertions.append(
-                    Assertion(
-                        expected_value=book_from_response,
-                        actual_value=serialized_book_from_db,
-                        assertion_name=f"Данные книги \"{book_from_response.title}\" (ISBN: {book_from_response.isbn}) "
-                                       f"одинаковы в ответе и в БД"
-                    )
-                )
-
-            make_bulk_assertion(
-                group_name="Сравнение отдельных книг",
-                data=books_lists_assertions
+            # Книги из БД читаются порциями и сравниваются с книгами из ответа по мере чтения, не накапливаясь
+            # в памяти: к отчёту прикрепляются только расхождения (см. make_collection_assertion).
+            make_collection_assertion(
+                expected=serialized_response.root,
+                actual=iterate_all_books_data(db=database),
+                assertion_name="Книги из ответа и из БД одинаковы",
+                key="id"
             )
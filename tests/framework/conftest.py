@@ -0,0 +1,48 @@
+import uuid
+
+import allure
+import psycopg
+import pytest
+from psycopg import sql
+
+from data.framework_variables import FrameworkVariables as FrVars
+from database.db_baseclass import Database
+
+
+@pytest.fixture(scope="function")
+@allure.title("Создание временной базы данных")
+def scratch_database() -> Database:
+    """
+    Данная фикстура создаёт временную базу данных (рядом с базой данных приложения) и удаляет её, а также все
+    созданные на её основе базы данных-шаблоны, после завершения тестирования.
+
+    :return: Экземпляр класса Database, подключённый к временной базе данных.
+    """
+    database_name = f"llce_t_scratch_{uuid.uuid4().hex[:12]}"
+    maintenance_connection = psycopg.connect(
+        dbname='postgres',
+        user=str(FrVars.DB_USER),
+        password=str(FrVars.DB_PASSWORD),
+        host=str(FrVars.DB_HOST),
+        port=str(FrVars.DB_PORT),
+        autocommit=True
+    )
+    with maintenance_connection:
+        maintenance_connection.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(database_name)))
+
+        db = Database(dbname=database_name)
+        db.connect_to_database()
+
+        yield db
+
+        db.close()
+        templates = maintenance_connection.execute(
+            "SELECT datname FROM pg_database WHERE datname LIKE %s", (database_name + '%',)
+        ).fetchall()
+        for (template_name,) in templates:
+            maintenance_connection.execute(sql.SQL("ALTER DATABASE {} WITH IS_TEMPLATE false").format(
+                sql.Identifier(template_name)
+            ))
+            maintenance_connection.execute(sql.SQL("DROP DATABASE {} WITH (FORCE)").format(
+                sql.Identifier(template_name)
+            ))
@@ -0,0 +1,107 @@
+import allure
+
+from helpers.assertions import make_bulk_assertion, AssertionBundle as Assertion
+from helpers.collection_comparison import compare_collections, RecordMismatch
+
+
+@allure.parent_suite("Тестовый фреймворк")
+@allure.suite("Сравнение коллекций")
+@allure.sub_suite("Сравнение коллекций записей по первичному ключу")
+class TestCollectionComparison:
+
+    @allure.title("Выявление всех видов расхождений коллекций")
+    @allure.severity(severity_level=allure.severity_level.NORMAL)
+    @allure.description(
+        "Данный тест проверяет, что метод compare_collections выявляет расхождения коллекций независимо от порядка "
+        "записей. Тест не обращается к приложению и базе данных.\n\n"
+        "При проведении теста проверяется:\n"
+        "- Подсчёт записей, совпавших по всем полям\n"
+        "- Выявление записей, отсутствующих в фактической коллекции\n"
+        "- Выявление записей, отсутствующих в ожидаемой коллекции\n"
+        "- Выявление расхождений значений полей\n"
+        "- Выявление ключей, повторяющихся в фактической коллекции, в том числе ключей, отсутствующих в ожидаемой"
+    )
+    def test_compare_collections_differences(self):
+        expected = [
+            {"id": 1, "title": "first"},
+            {"id": 2, "title": "second"},
+            {"id": 3, "title": "third"},
+            {"id": 4, "title": "fourth"}
+        ]
+        actual = (record for record in [
+            {"id": 3, "title": "third"},
+            {"id": 5, "title": "fifth"},
+            {"id": 1, "title": "first"},
+            {"id": 2, "title": "changed"},
+            {"id": 5, "title": "fifth"},
+            {"id": 1, "title": "first"}
+        ])
+
+        comparison = compare_collections(expected=expected, actual=actual, key="id")
+
+        make_bulk_assertion(
+            group_name="Проверка результата сравнения коллекций",
+            data=[
+                Assertion(
+                    expected_value=2,
+                    actual_value=comparison.matched_count,
+                    assertion_name="Количество совпавших записей"
+                ),
+                Assertion(
+                    expected_value=[{"id": 4, "title": "fourth"}],
+                    actual_value=comparison.missing,
+                    assertion_name="Записи, отсутствующие в фактической коллекции"
+                ),
+                Assertion(
+                    expected_value=[{"id": 5, "title": "fifth"}],
+                    actual_value=comparison.extra,
+                    assertion_name="Записи, отсутствующие в ожидаемой коллекции (без повторов)"
+                ),
+                Assertion(
+                    expected_value=[RecordMismatch("2", "title", "second", "changed")],
+                    actual_value=comparison.mismatches,
+                    assertion_name="Расхождения значений полей"
+                ),
+                Assertion(
+                    expected_value=["5", "1"],
+                    actual_value=comparison.duplicated_keys,
+                    assertion_name="Повторяющиеся ключи фактической коллекции"
+                ),
+                Assertion(
+                    expected_value=False,
+                    actual_value=comparison.is_equal,
+                    assertion_name="Коллекции не признаны совпадающими"
+                )
+            ]
+        )
+
+    @allure.title("Совпадение коллекций с разным порядком записей")
+    @allure.severity(severity_level=allure.severity_level.NORMAL)
+    @allure.description(
+        "Данный тест проверяет, что коллекции, различающиеся только порядком записей, признаются совпадающими, а "
+        "значения ключей сравниваются после приведения к строке. Тест не обращается к приложению и базе данных.\n\n"
+        "При проведении теста проверяется:\n"
+        "- Подсчёт записей, совпавших по всем полям\n"
+        "- Признание коллекций совпадающими"
+    )
+    def test_compare_equal_collections(self):
+        expected = [{"id": "1", "title": "first"}, {"id": "2", "title": "second"}]
+        actual = [{"id": 2, "title": "second"}, {"id": 1, "title": "first"}]
+
+        comparison = compare_collections(expected=expected, actual=actual, key="id", fields=["title"])
+
+        make_bulk_assertion(
+            group_name="Проверка результата сравнения коллекций",
+            data=[
+                Assertion(
+                    expected_value=2,
+                    actual_value=comparison.matched_count,
+                    assertion_name="Количество совпавших записей"
+                ),
+                Assertion(
+                    expected_value=True,
+                    actual_value=comparison.is_equal,
+                    assertion_name="Коллекции признаны совпадающими"
+                )
+            ]
+        )
@@ -0,0 +1,104 @@
+import allure
+import psycopg
+
+from database.snapshot import DatabaseSnapshot
+from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion
+
+
+@allure.parent_suite("Тестовый фреймворк")
+@allure.suite("Снимок базы данных")
+@allure.sub_suite("Создание снимка базы данных и восстановление из него")
+class TestDatabaseSnapshot:
+
+    @allure.title("Восстановление базы данных из снимка при открытых подключениях")
+    @allure.severity(severity_level=allure.severity_level.NORMAL)
+    @allure.description(
+        "Данный тест проверяет, что база данных восстанавливается из снимка, даже если к ней открыты сторонние "
+        "подключения (как подключения приложения). Тест работает с временной базой данных и не затрагивает "
+        "базу данных приложения.\n\n"
+        "При проведении теста проверяется:\n"
+        "- Отсутствие в восстановленной базе данных изменений, внесённых после создания снимка\n"
+        "- Закрытие стороннего подключения, открытого до восстановления\n"
+        "- Возможность новых подключений к восстановленной базе данных\n"
+        "- Вызов функций, зарегистрированных на восстановление"
+    )
+    def test_restore_with_open_connections(self, scratch_database):
+        scratch_database.execute_db_request(
+            query="CREATE TABLE items (id integer); INSERT INTO items VALUES (1);",
+            fetchmode='nofetch'
+        )
+        scratch_database.commit()
+
+        snapshot = DatabaseSnapshot(db=scratch_database)
+        restore_callbacks_calls = []
+        snapshot.add_restore_callback(lambda: restore_callbacks_calls.append(True))
+
+        with allure.step("Создание снимка"):
+            snapshot.create()
+
+        with allure.step("Изменение данных и открытие стороннего подключения"):
+            scratch_database.execute_db_request(query="INSERT INTO items VALUES (2);", fetchmode='nofetch')
+            scratch_database.commit()
+            foreign_connection = psycopg.connect(
+                dbname=scratch_database.dbname,
+                user=scratch_database.user,
+                password=scratch_database.password,
+                host=scratch_database.host,
+                port=scratch_database.port
+            )
+
+        with allure.step("Восстановление из снимка"):
+            snapshot.restore()
+
+        items_after_restore = scratch_database.execute_db_request(query="SELECT id FROM items;", fetchmode='all')
+
+        try:
+            foreign_connection.execute("SELECT 1;")
+            foreign_connection_is_closed = False
+        except psycopg.OperationalError:
+            foreign_connection_is_closed = True
+        finally:
+            foreign_connection.close()
+
+        with psycopg.connect(
+                dbname=scratch_database.dbname,
+                user=scratch_database.user,
+                password=scratch_database.password,
+                host=scratch_database.host,
+                port=scratch_database.port
+        ) as new_connection:
+            new_connection_result = new_connection.execute("SELECT count(*) FROM items;").fetchone()[0]
+
+        make_bulk_assertion(
+            group_name="Проверка восстановления базы данных",
+            data=[
+                Assertion(
+                    expected_value=[1],
+                    actual_value=[item.id for item in items_after_restore],
+                    assertion_name="В восстановленной базе данных отсутствуют изменения, внесённые после снимка"
+                ),
+                Assertion(
+                    expected_value=True,
+                    actual_value=foreign_connection_is_closed,
+                    assertion_name="Стороннее подключение было закрыто при восстановлении"
+                ),
+                Assertion(
+                    expected_value=1,
+                    actual_value=new_connection_result,
+                    assertion_name="К восстановленной базе данных можно подключиться"
+                ),
+                Assertion(
+                    expected_value=1,
+                    actual_value=len(restore_callbacks_calls),
+                    assertion_name="Функция, зарегистрированная на восстановление, была вызвана один раз"
+                )
+            ])
+
+        with allure.step("Удаление снимка"):
+            snapshot.drop()
+
+        make_simple_assertion(
+            expected_value=False,
+            actual_value=snapshot.exists(),
+            assertion_name="Снимок удалён"
+        )
@@ -0,0 +1,61 @@
+import json
+import os
+
+import allure
+import pytest
+
+from data.framework_variables import FrameworkVariables as FrVars
+from helpers.assertions import make_simple_assertion
+from helpers.load_runner import LoadRunner
+
+
+@allure.parent_suite("Нагрузочное тестирование")
+@allure.suite("Нагрузочный запуск")
+@allure.sub_suite("Основной пользовательский сценарий под нагрузкой")
+@pytest.mark.skipif(
+    int(FrVars.LOAD_VIRTUAL_USERS) < 1,
+    reason="Нагрузочный запуск выполняется только при LOAD_VIRTUAL_USERS больше 0"
+)
+class TestLoadScenario:
+
+    @allure.title("Основной пользовательский сценарий под нагрузкой")
+    @allure.severity(severity_level=allure.severity_level.NORMAL)
+    @allure.description(
+        "Данный тест запускает LOAD_VIRTUAL_USERS виртуальных пользователей, которые в течение "
+        "LOAD_DURATION_IN_SECONDS секунд одновременно повторяют сценарий: авторизация, обновление токенов, запрос "
+        "списка книг, запрос информации о себе, создание и удаление книги, выход из учётной записи.\n\n"
+        "При проведении теста проверяется:\n"
+        "- Соответствие кодов ответов ожидаемым\n"
+        "- Соответствие структуры (модели) ответов ожидаемой\n\n"
+        "Пропускная способность и перцентили времени ответа прикрепляются к отчёту и записываются в файл "
+        "LOAD_REPORT_PATH."
+    )
+    @pytest.mark.parametrize("async_create_users", [max(int(FrVars.LOAD_VIRTUAL_USERS), 1)], indirect=True)
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_load_scenario(self, async_create_users, async_authorize_administrator):
+
+        load_runner = LoadRunner(
+            virtual_users=async_create_users,
+            administrator_access_token=async_authorize_administrator.access_token,
+            duration_in_seconds=float(FrVars.LOAD_DURATION_IN_SECONDS)
+        )
+
+        with allure.step(f"Нагрузка в течение {FrVars.LOAD_DURATION_IN_SECONDS} секунд"):
+            load_report = await load_runner.run()
+
+            load_report_as_json = json.dumps(load_report.model_dump(), indent=3, ensure_ascii=False)
+            os.makedirs(os.path.dirname(FrVars.LOAD_REPORT_PATH) or ".", exist_ok=True)
+            with open(FrVars.LOAD_REPORT_PATH, "w", encoding="utf-8") as f:
+                f.write(load_report_as_json)
+
+            allure.attach(
+                load_report_as_json,
+                "Отчёт о нагрузочном запуске",
+                attachment_type=allure.attachment_type.JSON
+            )
+
+        make_simple_assertion(
+            expected_value=0,
+            actual_value=load_report.failed_requests,
+            assertion_name="Количество запросов, завершившихся ошибкой"
+        )
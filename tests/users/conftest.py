@@ -1,6 +1,5 @@
 import allure
 import pytest
-import requests
 import random
 from faker import Faker
 
@@ -16,12 +15,14 @@ fake = Faker()
 @pytest.fixture(scope='function')
 @allure.title("Изменение уровня прав пользователя")
 def before_test_user_has_administrator_permissions(
-        database, authorize_administrator, create_user, request
+        http_client, database, authorize_administrator, create_user, request
 ) -> bool:
     """
     Данная фикстура обеспечивает подготовку тестовых данных путём приведения наличия прав администратора у пользователя
     к значению, определённому в параметре тестовой функции (с применением indirect-параметризации).
 
+    :param http_client: Ссылка на фикстуру "http_client".
+        Используется для отправки запросов к приложению.
     :param database: Ссылка на фикстуру "database".
         Необходима для запроса уровня прав пользователя перед отправкой запроса на его изменение.
     :param authorize_administrator: Ссылка на фикстуру "variable_manager".
@@ -48,7 +49,7 @@ def before_test_user_has_administrator_permissions(
             else:
                 raise RuntimeError("Incorrect expected user permissions state!")
 
-            res = requests.patch(
+            res = http_client.patch(
                 url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{create_user.user_id}/{action}",
                 headers={
                     "Access-Token": authorize_administrator.access_token
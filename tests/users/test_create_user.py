@@ -1,7 +1,7 @@
 import random
 
 import allure
-import requests
+import pytest
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
@@ -10,7 +10,7 @@ from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion
 from helpers.json_tools import format_json
 from helpers.password_tools import hash_password
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.users import CreateUserSuccessfulResponse, CreateUserWithUsedEmailErrorResponse, CreateUserForbiddenResponse
 
 fake = Faker()
@@ -31,8 +31,9 @@ class TestCreateUsers:
         "- Соответствие числа записей в таблице пользователей в БД количеству пользователей с уникальным email в этой "
         "же таблице."
     )
-    def test_not_unique_email(self, database, variable_manager, authorize_administrator, create_user):
-        res = requests.post(
+    @pytest.mark.exclusive
+    def test_not_unique_email(self, http_client, database, variable_manager, authorize_administrator, create_user):
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/users",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -49,9 +50,9 @@ class TestCreateUsers:
 
         make_simple_assertion(expected_value=400, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=CreateUserWithUsedEmailErrorResponse,
-            data=res.json()
+            response=res
         )
 
         make_simple_assertion(
@@ -83,10 +84,10 @@ class TestCreateUsers:
         "администратора"
     )
     def test_create_user_without_administrator_permissions(
-            self, database, variable_manager, create_and_authorize_user
+            self, http_client, database, variable_manager, create_and_authorize_user
     ):
         new_user_mail = fake.email()
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/users",
             headers={
                 "Access-Token": create_and_authorize_user.access_token
@@ -103,9 +104,9 @@ class TestCreateUsers:
 
         make_simple_assertion(expected_value=403, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=CreateUserForbiddenResponse,
-            data=res.json()
+            response=res
         )
 
         potentialy_created_user_data = get_user_data_by_email(db=database, email=new_user_mail)
@@ -128,13 +129,15 @@ class TestCreateUsers:
         "данными полученными в ответе (в случае id) и данными переданными в запросе (в случае со всеми остальными "
         "данными)"
     )
-    def test_successful_user_creation(self, database, variable_manager, authorize_administrator, delete_user):
+    def test_successful_user_creation(
+            self, http_client, database, variable_manager, authorize_administrator, delete_user
+    ):
         new_user_random_email = fake.email()
         new_user_random_firstname = fake.first_name()
         new_user_random_middlename = random.choice([fake.first_name(), None])
         new_user_random_surname = fake.last_name()
         new_user_random_password = fake.password()
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/users",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -152,9 +155,9 @@ class TestCreateUsers:
         make_simple_assertion(expected_value=200, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=CreateUserSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         user_data_from_db = get_user_data_by_email(db=database, email=new_user_random_email)
@@ -1,12 +1,11 @@
 import allure
 import pytest
-import requests
 
 from data.framework_variables import FrameworkVariables as FrVars
-from database.users import get_users_count
+from database.fingerprint import get_tables_fingerprint
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.authorization import AccessTokenNotProvidedError
 
 
@@ -29,7 +28,10 @@ class TestCreateUsersValidation:
 
     @pytest.mark.parametrize('prepare_request_for_user_creation_validation', cases_list, indirect=True)
     @allure.severity(severity_level=allure.severity_level.CRITICAL)
-    def test_user_creation_request_validation(self, prepare_request_for_user_creation_validation, database):
+    @pytest.mark.exclusive
+    def test_user_creation_request_validation(
+            self, http_client, prepare_request_for_user_creation_validation, database
+    ):
 
         prepared_request = prepare_request_for_user_creation_validation
 
@@ -39,9 +41,9 @@ class TestCreateUsersValidation:
         headers, json = (prepared_request.headers_template,
                          prepared_request.body_template)
 
-        users_count_before_request = get_users_count(db=database, mode='table_count')
+        tables_fingerprint_before_request = get_tables_fingerprint(db=database)
 
-        res = requests.post(
+        res = http_client.post(
             url=FrVars.APP_HOST + "/v1/users",
             headers=headers,
             json=json
@@ -55,15 +57,15 @@ class TestCreateUsersValidation:
         )
 
         if prepared_request.case == "without_access_token":
-            validate_response_model(
+            validate_response(
                 model=AccessTokenNotProvidedError,
-                data=res.json()
+                response=res
             )
 
-        users_count_after_request = get_users_count(db=database, mode='table_count')
+        tables_fingerprint_after_request = get_tables_fingerprint(db=database)
 
         make_simple_assertion(
-            expected_value=users_count_before_request,
-            actual_value=users_count_after_request,
-            assertion_name=f"Общее количество записей в таблице пользователей не изменилось после запроса"
+            expected_value=tables_fingerprint_before_request,
+            actual_value=tables_fingerprint_after_request,
+            assertion_name=f"Содержимое таблиц пользователей, книг и токенов не изменилось после запроса"
         )
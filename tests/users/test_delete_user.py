@@ -2,16 +2,15 @@ import uuid
 
 import allure
 import pytest
-import requests
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
-from database.tokens import get_tokens_count
-from database.users import get_user_data_by_id
+from database.tokens import get_tokens_count, async_get_tokens_count
+from database.users import get_user_data_by_id, async_get_user_data_by_id
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion, AssertionModes
 from helpers.password_tools import hash_password
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.users import DeleteUserSuccessfulResponse, DeleteUserLackOfPermissionsErrorResponse, \
     DeleteAdministratorForbiddenErrorResponse, GetUserDataNotFoundErrorResponse
 
@@ -34,11 +33,15 @@ class TestDeleteUsers:
         "- Сохранность в БД данных пользователя, которого пытались удалить\n"
         "- Сохранность в БД токенов доступа и токенов обновления пользователя, которого пытались удалить"
     )
-    def test_delete_user_without_administrator_permissions(
-            self, database, variable_manager, create_and_authorize_user, create_and_authorize_second_user
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_delete_user_without_administrator_permissions(
+            self, http_client, async_database, variable_manager, async_create_and_authorize_users
     ):
+        # Оба пользователя создаются и авторизуются одновременно.
+        create_and_authorize_user, create_and_authorize_second_user = async_create_and_authorize_users
+
         # Отправка запроса на удаление пользователя.
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/users/{create_and_authorize_second_user.user_id}",
             headers={
                 "Access-Token": create_and_authorize_user.access_token
@@ -51,23 +54,23 @@ class TestDeleteUsers:
 
         # Запрос из БД данных пользователя которого пытались удалить, а также количества выпущенных на него токенов
         # доступа и токенов обновления.
-        user_data_from_db_after_delete_try = get_user_data_by_id(
-            db=database, user_id=create_and_authorize_second_user.user_id
+        user_data_from_db_after_delete_try = await async_get_user_data_by_id(
+            db=async_database, user_id=create_and_authorize_second_user.user_id
         )
-        access_tokens_count_after_delete_try = get_tokens_count(
-            db=database,
+        access_tokens_count_after_delete_try = await async_get_tokens_count(
+            db=async_database,
             user_id=create_and_authorize_second_user.user_id,
             token_type='access_token'
         )
-        refresh_tokens_count_after_delete_try = get_tokens_count(
-            db=database,
+        refresh_tokens_count_after_delete_try = await async_get_tokens_count(
+            db=async_database,
             user_id=create_and_authorize_second_user.user_id,
             token_type='refresh_token'
         )
 
-        validate_response_model(
+        validate_response(
             model=DeleteUserLackOfPermissionsErrorResponse,
-            data=res.json()
+            response=res
         )
 
         make_bulk_assertion(
@@ -133,10 +136,10 @@ class TestDeleteUsers:
         "- Соответствие структуры (модели) ответа ожидаемой"
     )
     def test_delete_non_existing_user(
-            self, database, variable_manager, authorize_administrator
+            self, http_client, database, variable_manager, authorize_administrator
     ):
         unavailable_in_db_user_id = str(uuid.uuid4())
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/users/{unavailable_in_db_user_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -147,9 +150,9 @@ class TestDeleteUsers:
         make_simple_assertion(expected_value=404, actual_value=res.status_code,
                               assertion_name="Проверка кода ответа")
 
-        serialized_model = validate_response_model(
+        serialized_model = validate_response(
             model=GetUserDataNotFoundErrorResponse,
-            data=res.json()
+            response=res
         )
 
         make_simple_assertion(
@@ -170,10 +173,10 @@ class TestDeleteUsers:
     )
     @pytest.mark.parametrize('before_test_user_has_administrator_permissions', [True], indirect=True)
     def test_delete_administrator(
-            self, database, authorize_administrator, create_user, create_and_authorize_user,
+            self, http_client, database, authorize_administrator, create_user, create_and_authorize_user,
             before_test_user_has_administrator_permissions
     ):
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/users/{create_and_authorize_user.user_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -200,9 +203,9 @@ class TestDeleteUsers:
             token_type='refresh_token'
         )
 
-        validate_response_model(
+        validate_response(
             model=DeleteAdministratorForbiddenErrorResponse,
-            data=res.json()
+            response=res
         )
 
         make_bulk_assertion(
@@ -271,7 +274,8 @@ class TestDeleteUsers:
     @pytest.mark.parametrize("create_and_authorize_user", ["fixture logout should be skipped"], indirect=True)
     @pytest.mark.parametrize("create_user", ["fixture user deletion should be skipped"], indirect=True)
     def test_successful_user_deletion(
-            self, database, variable_manager, authorize_administrator, create_user, create_and_authorize_user
+            self, http_client, database,
+            variable_manager, authorize_administrator, create_user, create_and_authorize_user
     ):
         # Извлечение имеющихся в БД данных пользователя, а также количества токенов доступа и количества токенов
         # обновления.
@@ -288,7 +292,7 @@ class TestDeleteUsers:
         )
 
         # Отправка запроса на удаление пользователя.
-        res = requests.delete(
+        res = http_client.delete(
             url=FrVars.APP_HOST + f"/v1/users/{create_and_authorize_user.user_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -313,9 +317,9 @@ class TestDeleteUsers:
             token_type='refresh_token'
         )
 
-        validate_response_model(
+        validate_response(
             model=DeleteUserSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         make_bulk_assertion(
@@ -2,7 +2,6 @@ import uuid
 
 import allure
 import pytest
-import requests
 from faker import Faker
 
 from data.framework_variables import FrameworkVariables as FrVars
@@ -10,7 +9,7 @@ from database.users import get_user_data_by_email, get_user_data_by_id
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion, make_bulk_assertion, AssertionBundle as Assertion
 from helpers.jwt_tools import validate_and_decode_token
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.users import GetUserDataSuccessfulResponse, GetUserDataForbiddenError, GetUserDataNotFoundErrorResponse
 
 fake = Faker()
@@ -31,10 +30,10 @@ class TestGetUserData:
         "- Соответствие структуры (модели) ответа ожидаемой\n"
     )
     def test_lack_of_permissions_for_another_user_data_get(
-            self, database, variable_manager, authorize_administrator,
+            self, http_client, database, variable_manager, authorize_administrator,
             create_and_authorize_user, create_second_user
     ):
-        res = requests.get(
+        res = http_client.get(
             url=FrVars.APP_HOST + "/v1/users/" + str(create_second_user.user_id),
             headers={
                 "Access-Token": create_and_authorize_user.access_token
@@ -44,9 +43,9 @@ class TestGetUserData:
 
         make_simple_assertion(expected_value=403, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=GetUserDataForbiddenError,
-            data=res.json()
+            response=res
         )
 
     @allure.title("Отказ при попытке получения информации о несуществующем пользователе")
@@ -59,10 +58,10 @@ class TestGetUserData:
         "- Соответствие структуры (модели) ответа ожидаемой\n"
     )
     def test_non_existent_user_data_get(
-            self, database, variable_manager, authorize_administrator
+            self, http_client, database, variable_manager, authorize_administrator
     ):
         unavailable_in_db_user_id = str(uuid.uuid4())
-        res = requests.get(
+        res = http_client.get(
             url=f"{FrVars.APP_HOST}/v1/users/{unavailable_in_db_user_id}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -72,9 +71,9 @@ class TestGetUserData:
 
         make_simple_assertion(expected_value=404, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_model = validate_response_model(
+        serialized_model = validate_response(
             model=GetUserDataNotFoundErrorResponse,
-            data=res.json()
+            response=res
         )
 
         make_simple_assertion(
@@ -93,9 +92,11 @@ class TestGetUserData:
         "- Соответствие структуры (модели) ответа ожидаемой\n"
         "- Соответствие данных, полученных в ответе, данным из БД"
     )
-    def test_successful_another_user_data_get(self, database, variable_manager, authorize_administrator, create_user):
+    def test_successful_another_user_data_get(
+            self, http_client, database, variable_manager, authorize_administrator, create_user
+    ):
         user_id = str(create_user.user_id)
-        res = requests.get(
+        res = http_client.get(
             url=FrVars.APP_HOST + "/v1/users/" + user_id,
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -105,9 +106,9 @@ class TestGetUserData:
 
         make_simple_assertion(expected_value=200, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=GetUserDataSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         user_data_from_db = get_user_data_by_email(db=database, email=create_user.email)
@@ -158,7 +159,9 @@ class TestGetUserData:
         "- Соответствие данных, полученных в ответе, данным из БД"
     )
     @pytest.mark.parametrize("get_mode", ['by_id', 'by_me_path'])
-    def test_successful_user_data_get(self, database, variable_manager, create_and_authorize_user, get_mode):
+    def test_successful_user_data_get(
+            self, http_client, database, variable_manager, create_and_authorize_user, get_mode
+    ):
 
         user_id = validate_and_decode_token(create_and_authorize_user.access_token).user_id
 
@@ -169,7 +172,7 @@ class TestGetUserData:
             allure.dynamic.title("Успешное получение информации пользователем о себе по пути \"/me\"")
             request_url_part = 'me'
 
-        res = requests.get(
+        res = http_client.get(
             url=FrVars.APP_HOST + "/v1/users/" + request_url_part,
             headers={
                 "Access-Token": create_and_authorize_user.access_token
@@ -179,9 +182,9 @@ class TestGetUserData:
 
         make_simple_assertion(expected_value=200, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=GetUserDataSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         # Дополнительный тест, применимый только к одному из типов запроса информации.
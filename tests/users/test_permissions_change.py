@@ -1,6 +1,5 @@
 import allure
 import pytest
-import requests
 import random
 from faker import Faker
 from data.framework_variables import FrameworkVariables as FrVars
@@ -8,7 +7,7 @@ from database.users import get_user_data_by_id, get_user_data_by_email, get_all_
     get_all_administrators_ids
 from helpers.allure_report import attach_request_data_to_report
 from helpers.assertions import make_simple_assertion
-from helpers.validate_response import validate_response_model
+from helpers.validate_response import validate_response
 from models.users import (UserPermissionsChangeSuccessfulResponse,
                           UserPermissionsChangeBadRequestResponse, UserPermissionsChangeBadRequestReason,
                           UserPermissionsChangeLastAdminErrorResponse,
@@ -24,7 +23,8 @@ class TestUsersPermissions:
 
     @pytest.mark.parametrize('before_test_user_has_administrator_permissions', [True, False], indirect=True)
     def test_successful_permissions_change(
-            self, database, authorize_administrator, create_user, before_test_user_has_administrator_permissions
+            self, http_client, database,
+            authorize_administrator, create_user, before_test_user_has_administrator_permissions
     ):
         # Описание кейса, подготовка параметров и тестовых данных
         if before_test_user_has_administrator_permissions is True:
@@ -51,7 +51,7 @@ class TestUsersPermissions:
         )
 
         user_id = create_user.user_id
-        res = requests.patch(
+        res = http_client.patch(
             url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{user_id}/{permission_action}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -61,9 +61,9 @@ class TestUsersPermissions:
 
         make_simple_assertion(expected_value=200, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=UserPermissionsChangeSuccessfulResponse,
-            data=res.json()
+            response=res
         )
 
         user_data_from_db = get_user_data_by_id(db=database, user_id=user_id)
@@ -95,7 +95,8 @@ class TestUsersPermissions:
     @allure.severity(severity_level=allure.severity_level.NORMAL)
     @pytest.mark.parametrize('before_test_user_has_administrator_permissions', [True, False], indirect=True)
     def test_repeated_permissions_change(
-            self, database, authorize_administrator, create_user, before_test_user_has_administrator_permissions
+            self, http_client, database,
+            authorize_administrator, create_user, before_test_user_has_administrator_permissions
     ):
         # Описание кейса, подготовка параметров и тестовых данных
         if before_test_user_has_administrator_permissions is False:
@@ -121,7 +122,7 @@ class TestUsersPermissions:
         )
 
         user_id = create_user.user_id
-        res = requests.patch(
+        res = http_client.patch(
             url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{user_id}/{permission_action}",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -131,9 +132,9 @@ class TestUsersPermissions:
 
         make_simple_assertion(expected_value=400, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        serialized_response = validate_response_model(
+        serialized_response = validate_response(
             model=UserPermissionsChangeBadRequestResponse,
-            data=res.json()
+            response=res
         )
 
         user_data_from_db = get_user_data_by_id(db=database, user_id=user_id)
@@ -166,12 +167,13 @@ class TestUsersPermissions:
         "- Соответствие структуры (модели) ответа ожидаемой\n"
         "- Неизменность признака наличия прав администратора в БД"
     )
+    @pytest.mark.exclusive
     def test_last_administrator_permissions_revoke(
-            self, database, authorize_administrator, revoke_all_administrators_permissions_except_default
+            self, http_client, database, authorize_administrator, revoke_all_administrators_permissions_except_default
     ):
         default_user_data = get_user_data_by_email(db=database, email=FrVars.APP_DEFAULT_USER_EMAIL)
         user_id = default_user_data.id
-        res = requests.patch(
+        res = http_client.patch(
             url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{user_id}/revoke",
             headers={
                 "Access-Token": authorize_administrator.access_token
@@ -181,9 +183,9 @@ class TestUsersPermissions:
 
         make_simple_assertion(expected_value=403, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=UserPermissionsChangeLastAdminErrorResponse,
-            data=res.json()
+            response=res
         )
 
         user_data_from_db = get_user_data_by_id(db=database, user_id=user_id)
@@ -197,8 +199,10 @@ class TestUsersPermissions:
 
     @allure.severity(severity_level=allure.severity_level.CRITICAL)
     @pytest.mark.parametrize("case", ['unauthorized_grant', 'unauthorized_revoke'])
+    @pytest.mark.exclusive
     def test_permissions_change_without_administrator_permissions(
-            self, database, create_and_authorize_user, revoke_all_administrators_permissions_except_default, case
+            self, http_client, database,
+            create_and_authorize_user, revoke_all_administrators_permissions_except_default, case
     ):
         if case == 'unauthorized_grant':
             allure.dynamic.title("Запрет повышения уровня прав пользователем, не имеющим прав администратора")
@@ -228,7 +232,7 @@ class TestUsersPermissions:
             "- Неизменность признака наличия или отсутствия прав администратора в БД\n\n"
         )
 
-        res = requests.patch(
+        res = http_client.patch(
             url=FrVars.APP_HOST + f"/v1/users/admin-permissions/{random_user_id}/{permissions_action}",
             headers={
                 "Access-Token": create_and_authorize_user.access_token
@@ -238,9 +242,9 @@ class TestUsersPermissions:
 
         make_simple_assertion(expected_value=403, actual_value=res.status_code, assertion_name="Проверка кода ответа")
 
-        validate_response_model(
+        validate_response(
             model=UserPermissionsChangeLackOfPermissionsErrorResponse,
-            data=res.json()
+            response=res
         )
 
         user_data_from_db_after_request = get_user_data_by_id(db=database, user_id=random_user_id)